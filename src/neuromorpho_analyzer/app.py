@@ -1,14 +1,21 @@
 """Main GUI application for Neuromorpho Analyzer."""
 
+import atexit
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Deque, Tuple
+from collections import OrderedDict, deque
+import queue
 import threading
+import time
+
+import pandas as pd
 
 from .core.database import SQLiteDatabase
 from .core.importers import UnifiedImporter, FileScanner, HeaderScanner, ParameterMapper
-from .core.processors import StatisticsEngine, DensityCalculator, RepresentativeFileAnalyzer
+from .core.processors import StatisticsEngine, DensityCalculator, RepresentativeFileAnalyzer, wide_to_long
+from .core.processors.jit import warm_up_kernels
 from .core.exporters import ExcelExporter, ExportConfig, ExportParameterSelector, StatisticsTableExporter
 from .core.profiles import AnalysisProfile, ProfileManager
 from .gui.widgets import (
@@ -20,6 +27,14 @@ from .gui.widgets import (
 )
 
 
+# Interval for applying queued status bar updates, and the minimum time
+# between forced status bar redraws on the Tk thread
+STATUS_POLL_MS = 100
+
+# Number of long-format measurement frames kept in memory
+LONG_CACHE_SIZE = 4
+
+
 class NeuromorphoAnalyzerApp:
     """Main application window for Neuromorpho Analyzer.
 
@@ -47,6 +62,9 @@ class NeuromorphoAnalyzerApp:
         self.current_assay_id: Optional[int] = None
         self.available_parameters: List[str] = []
         self.available_conditions: List[str] = []
+        # Recently used long-format measurements, keyed by (assay_id, parameters,
+        # conditions); least recently used entries are dropped, all cleared on import
+        self._long_cache: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
         self.profile_manager = ProfileManager(Path.home() / ".neuromorpho_analyzer" / "profiles")
 
         # Create UI
@@ -57,6 +75,12 @@ class NeuromorphoAnalyzerApp:
         # Initialize with empty state
         self._update_ui_state()
 
+        # Compile numeric kernels in the background so the first analysis is fast
+        threading.Thread(target=warm_up_kernels, daemon=True).start()
+
+        # Release the database even if Tk exits without WM_DELETE_WINDOW
+        atexit.register(self.cleanup)
+
     def _create_menu(self):
         """Create application menu bar."""
         menubar = tk.Menu(self.root)
@@ -159,38 +183,54 @@ class NeuromorphoAnalyzerApp:
         )
         self.condition_names.pack(fill='x')
 
-        # Export tab
-        export_frame = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(export_frame, text="Export")
+        # Export tab (widgets are created when the tab is first shown)
+        self.export_frame = ttk.Frame(self.notebook, padding=10)
+        self.notebook.add(self.export_frame, text="Export")
+        self.export_config: Optional[ExportConfigWidget] = None
 
+        # Results tab (text area is created when the tab is first shown)
+        self.results_frame = ttk.Frame(self.notebook, padding=10)
+        self.notebook.add(self.results_frame, text="Results")
+
+        self.results_text: Optional[tk.Text] = None
+        self._pending_results: Deque[str] = deque()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+    def _create_export_tab(self):
+        """Create export configuration widgets."""
         self.export_config = ExportConfigWidget(
-            export_frame,
+            self.export_frame,
             callback=self._on_export_config_change
         )
         self.export_config.pack(fill='x')
 
         # Export button
         ttk.Button(
-            export_frame,
+            self.export_frame,
             text="Export Now",
             command=self._export_excel
         ).pack(pady=20)
 
-        # Results tab
-        results_frame = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(results_frame, text="Results")
-
-        # Results text area
-        self.results_text = tk.Text(results_frame, height=20, wrap='word')
-        results_scrollbar = ttk.Scrollbar(results_frame, command=self.results_text.yview)
+    def _create_results_text(self):
+        """Create results text area and flush buffered messages."""
+        self.results_text = tk.Text(self.results_frame, height=20, wrap='word')
+        results_scrollbar = ttk.Scrollbar(self.results_frame, command=self.results_text.yview)
         self.results_text.configure(yscrollcommand=results_scrollbar.set)
 
         self.results_text.pack(side='left', fill='both', expand=True)
         results_scrollbar.pack(side='right', fill='y')
 
+        if self._pending_results:
+            self.results_text.insert('end', ''.join(m + "\n" for m in self._pending_results))
+            self._pending_results.clear()
+            self.results_text.see('end')
+
     def _create_status_bar(self):
         """Create status bar at bottom of window."""
         self.status_var = tk.StringVar(value="Ready")
+        self._status_queue: "queue.Queue[str]" = queue.Queue()
+        self._tk_thread = threading.current_thread()
+        self._last_status_refresh = 0.0
         status_bar = ttk.Label(
             self.root,
             textvariable=self.status_var,
@@ -199,6 +239,8 @@ class NeuromorphoAnalyzerApp:
         )
         status_bar.pack(side='bottom', fill='x')
 
+        self.root.after(STATUS_POLL_MS, self._drain_status_queue)
+
     def _update_ui_state(self):
         """Update UI based on current state."""
         if self.database:
@@ -224,15 +266,50 @@ class NeuromorphoAnalyzerApp:
             self.measurements_label.config(text="")
 
     def _set_status(self, message: str):
-        """Update status bar message."""
+        """Show a status bar message (safe to call from worker threads).
+
+        Imports, statistics and exports run on the Tk thread and block the
+        event loop, so on that thread the bar is redrawn right away, at most
+        once per STATUS_POLL_MS; messages in between only update the text.
+        Other threads queue their messages for _drain_status_queue.
+        """
+        if threading.current_thread() is not self._tk_thread:
+            self._status_queue.put(message)
+            return
+
         self.status_var.set(message)
-        self.root.update_idletasks()
+        now = time.monotonic()
+        if now - self._last_status_refresh >= STATUS_POLL_MS / 1000:
+            self._last_status_refresh = now
+            self.root.update_idletasks()
+
+    def _drain_status_queue(self):
+        """Show the most recent queued status message and reschedule."""
+        message = None
+        try:
+            while True:
+                message = self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        if message is not None:
+            self.status_var.set(message)
+        self.root.after(STATUS_POLL_MS, self._drain_status_queue)
 
     def _log_result(self, message: str):
         """Add message to results text area."""
+        if self.results_text is None:
+            # Buffer until the Results tab is first shown
+            self._pending_results.append(message)
+            return
         self.results_text.insert('end', message + "\n")
         self.results_text.see('end')
 
+    def _log_results(self, lines: List[str]):
+        """Add several lines to the results text area in one insert."""
+        if lines:
+            self._log_result("\n".join(lines))
+
     # --- File operations ---
 
     def _new_database(self):
@@ -242,8 +319,7 @@ class NeuromorphoAnalyzerApp:
             filetypes=[("SQLite Database", "*.db"), ("All Files", "*.*")]
         )
         if filepath:
-            self.database = SQLiteDatabase(filepath)
-            self.database.connect()
+            self._connect_database(filepath)
             self.current_assay_id = None
             self._update_ui_state()
             self._set_status(f"Created new database: {filepath}")
@@ -254,17 +330,23 @@ class NeuromorphoAnalyzerApp:
             filetypes=[("SQLite Database", "*.db"), ("All Files", "*.*")]
         )
         if filepath:
-            self.database = SQLiteDatabase(filepath)
-            self.database.connect()
+            self._connect_database(filepath)
 
             # Get first assay if exists
             assays = self.database.list_assays()
-            if assays:
-                self.current_assay_id = assays[0]['id']
+            self.current_assay_id = assays[0]['id'] if assays else None
 
             self._update_ui_state()
             self._set_status(f"Opened database: {filepath}")
 
+    def _connect_database(self, filepath: str):
+        """Open a persistent connection, closing any previous one."""
+        if self.database:
+            self.database.disconnect()
+        self.database = SQLiteDatabase(filepath)
+        self.database.connect()
+        self._long_cache.clear()
+
     def _import_files(self):
         """Import data files."""
         if not self.database:
@@ -304,37 +386,53 @@ class NeuromorphoAnalyzerApp:
         """Import a list of files."""
         self._set_status("Importing files...")
 
+        paths = [Path(p) for p in filepaths]
+        names = [p.name for p in paths]
+        n_files = len(paths)
+
+        # Get condition from file info or, failing that, parse it from the filename
+        conditions = [info.get('condition', 'Unknown') for info in (file_infos or [])[:n_files]]
+        for path in paths[len(conditions):]:
+            parts = path.stem.split('_')
+            conditions.append(parts[1] if len(parts) >= 2 else "Unknown")
+
         # Create new assay
-        assay_name = f"Import {Path(filepaths[0]).parent.name}"
+        assay_name = f"Import {paths[0].parent.name}"
         self.current_assay_id = self.database.insert_assay(assay_name)
 
-        total_imported = 0
-        for i, filepath in enumerate(filepaths):
-            try:
-                df = UnifiedImporter.import_file(filepath)
-
-                # Get condition from file info or filename
-                condition = "Unknown"
-                if file_infos and i < len(file_infos):
-                    condition = file_infos[i].get('condition', 'Unknown')
-                else:
-                    # Try to parse from filename
-                    parts = Path(filepath).stem.split('_')
-                    if len(parts) >= 2:
-                        condition = parts[1]
-
-                count = self.database.insert_measurements(
-                    self.current_assay_id,
-                    df,
-                    source_file=Path(filepath).name,
-                    condition=condition
-                )
-                total_imported += count
-                self._set_status(f"Imported {i+1}/{len(filepaths)}: {Path(filepath).name}")
-
-            except Exception as e:
-                self._log_result(f"Error importing {filepath}: {e}")
+        # Report progress about 100 times per import (each report can redraw
+        # the status bar while this loop blocks Tk) and log errors in one write
+        status_every = max(1, n_files // 100)
+        errors = []
 
+        # Import all files in a single transaction (one commit instead of one per file)
+        total_imported = 0
+        with self.database.transaction():
+            # Files are parsed on a thread pool; inserts stay on this thread
+            parsed = UnifiedImporter.iter_import_files(filepaths)
+            for i, (filepath, (df, error)) in enumerate(zip(filepaths, parsed)):
+                try:
+                    if error is not None:
+                        raise error
+
+                    count = self.database.insert_measurements(
+                        self.current_assay_id,
+                        df,
+                        source_file=names[i],
+                        condition=conditions[i]
+                    )
+                    total_imported += count
+
+                except Exception as e:
+                    errors.append(f"Error importing {filepath}: {e}")
+
+                # Files that failed still count towards the progress
+                if (i + 1) % status_every == 0 or i + 1 == n_files:
+                    self._set_status(f"Imported {i+1}/{n_files}: {names[i]}")
+
+        if errors:
+            self._log_result("\n".join(errors))
+        self._long_cache.clear()
         self._update_ui_state()
         self._set_status(f"Imported {total_imported} measurements from {len(filepaths)} files")
         self._log_result(f"Successfully imported {total_imported} measurements")
@@ -349,43 +447,47 @@ class NeuromorphoAnalyzerApp:
         self._set_status("Running statistics...")
         self.notebook.select(2)  # Switch to results tab
 
+        lines = []
         try:
             stats = StatisticsEngine()
-            df = self.database.get_measurements(self.current_assay_id)
-
             selected_params = self.param_selector.get_selected_parameters()
             selected_conditions = self.condition_selector.get_selected_conditions()
 
-            # Filter data
-            df = df[df['condition'].isin(selected_conditions)]
+            # Filter data (conditions are filtered in SQL)
+            df = self._get_long(self.current_assay_id, selected_params, selected_conditions)
+
+            lines.append("=" * 50)
+            lines.append("STATISTICAL ANALYSIS")
+            lines.append("=" * 50)
 
-            self._log_result("=" * 50)
-            self._log_result("STATISTICAL ANALYSIS")
-            self._log_result("=" * 50)
+            # Split by parameter once instead of scanning the frame per parameter
+            by_param = dict(tuple(df.groupby('parameter_name', sort=False, observed=True)))
 
             for param in selected_params:
-                param_df = df[df['parameter_name'] == param]
-                if param_df.empty:
+                param_df = by_param.get(param)
+                if param_df is None or param_df.empty:
                     continue
 
-                self._log_result(f"\nParameter: {param}")
-                self._log_result("-" * 30)
+                lines.append(f"\nParameter: {param}")
+                lines.append("-" * 30)
 
                 result = stats.auto_compare(param_df, 'value', 'condition')
 
                 main_test = result.get('main_test')
                 if main_test:
-                    self._log_result(f"Test: {main_test.test_name}")
-                    self._log_result(f"Statistic: {main_test.statistic:.4f}")
-                    self._log_result(f"P-value: {main_test.p_value:.4e}")
-                    self._log_result(f"Significant: {'Yes' if main_test.significant else 'No'}")
+                    lines.append(f"Test: {main_test.test_name}")
+                    lines.append(f"Statistic: {main_test.statistic:.4f}")
+                    lines.append(f"P-value: {main_test.p_value:.4e}")
+                    lines.append(f"Significant: {'Yes' if main_test.significant else 'No'}")
 
             self._set_status("Statistics complete")
 
         except Exception as e:
-            self._log_result(f"Error: {e}")
+            lines.append(f"Error: {e}")
             self._set_status("Statistics failed")
 
+        self._log_results(lines)
+
     def _find_representative(self):
         """Find representative files per condition."""
         if not self._check_data_loaded():
@@ -394,28 +496,30 @@ class NeuromorphoAnalyzerApp:
         self._set_status("Finding representative files...")
         self.notebook.select(2)
 
+        lines = []
         try:
             analyzer = RepresentativeFileAnalyzer(self.database)
             selected_params = self.param_selector.get_selected_parameters()
 
             results = analyzer.analyze([self.current_assay_id], selected_params)
 
-            self._log_result("=" * 50)
-            self._log_result("REPRESENTATIVE FILES")
-            self._log_result("=" * 50)
+            lines.append("=" * 50)
+            lines.append("REPRESENTATIVE FILES")
+            lines.append("=" * 50)
 
-            for condition in results['condition'].unique():
-                self._log_result(f"\n{condition}:")
-                cond_results = results[results['condition'] == condition].head(3)
-                for _, row in cond_results.iterrows():
-                    self._log_result(f"  {row['rank']}. {row['file']} (dist: {row['distance_from_average']:.4f})")
+            for condition, cond_results in results.groupby('condition', sort=False, observed=True):
+                lines.append(f"\n{condition}:")
+                for _, row in cond_results.head(3).iterrows():
+                    lines.append(f"  {row['rank']}. {row['file']} (dist: {row['distance_from_average']:.4f})")
 
             self._set_status("Representative analysis complete")
 
         except Exception as e:
-            self._log_result(f"Error: {e}")
+            lines.append(f"Error: {e}")
             self._set_status("Analysis failed")
 
+        self._log_results(lines)
+
     def _calculate_density(self):
         """Calculate structure density."""
         if not self._check_data_loaded():
@@ -424,30 +528,32 @@ class NeuromorphoAnalyzerApp:
         self._set_status("Calculating density...")
         self.notebook.select(2)
 
+        lines = []
         try:
             calc = DensityCalculator()
-            df = self.database.get_measurements(self.current_assay_id)
+            counts = self.database.get_condition_counts(self.current_assay_id)
 
-            self._log_result("=" * 50)
-            self._log_result("DENSITY ANALYSIS")
-            self._log_result(f"Image area: {calc.config.image_area:.4f} µm² (3.5021²)")
-            self._log_result("=" * 50)
+            lines.append("=" * 50)
+            lines.append("DENSITY ANALYSIS")
+            lines.append(f"Image area: {calc.config.image_area:.4f} µm² (3.5021²)")
+            lines.append("=" * 50)
 
             for condition in self.condition_selector.get_selected_conditions():
-                cond_df = df[df['condition'] == condition]
-                count = len(cond_df)
+                count = counts.get(condition, 0)
                 result = calc.calculate_density_from_count(count, condition=condition)
 
-                self._log_result(f"\n{condition}:")
-                self._log_result(f"  Count: {result.count}")
-                self._log_result(f"  Density: {result.density_per_mm2:.2f} /mm²")
+                lines.append(f"\n{condition}:")
+                lines.append(f"  Count: {result.count}")
+                lines.append(f"  Density: {result.density_per_mm2:.2f} /mm²")
 
             self._set_status("Density calculation complete")
 
         except Exception as e:
-            self._log_result(f"Error: {e}")
+            lines.append(f"Error: {e}")
             self._set_status("Calculation failed")
 
+        self._log_results(lines)
+
     # --- Export operations ---
 
     def _export_excel(self):
@@ -500,16 +606,17 @@ class NeuromorphoAnalyzerApp:
             stats = StatisticsEngine()
             exporter = StatisticsTableExporter(stats)
 
-            df = self.database.get_measurements(self.current_assay_id)
             selected_params = self.param_selector.get_selected_parameters()
 
             # Build data dict for first parameter
             if selected_params:
                 param = selected_params[0]
-                param_df = df[df['parameter_name'] == param]
-                data_dict = {}
-                for cond in param_df['condition'].unique():
-                    data_dict[cond] = param_df[param_df['condition'] == cond]['value']
+                param_df = self._get_long(self.current_assay_id, [param])
+                # One groupby pass instead of a boolean mask per condition
+                data_dict = {
+                    cond: values.to_numpy()
+                    for cond, values in param_df.groupby('condition', sort=False, observed=True)['value']
+                }
 
                 tables = exporter.create_statistics_tables(data_dict, param)
                 exporter.export_to_excel(tables, Path(filepath))
@@ -551,16 +658,16 @@ class NeuromorphoAnalyzerApp:
             messagebox.showinfo("No Profiles", "No saved profiles found.")
             return
 
-        # Simple selection dialog
+        # Simple selection dialog (hidden while its children are laid out)
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Load Profile")
         dialog.geometry("300x200")
 
         ttk.Label(dialog, text="Select profile:").pack(pady=10)
 
         listbox = tk.Listbox(dialog)
-        for p in profiles:
-            listbox.insert('end', p)
+        listbox.insert('end', *profiles)
         listbox.pack(fill='both', expand=True, padx=10)
 
         def on_select():
@@ -579,8 +686,19 @@ class NeuromorphoAnalyzerApp:
 
         ttk.Button(dialog, text="Load", command=on_select).pack(pady=10)
 
+        dialog.update_idletasks()
+        dialog.deiconify()
+
     # --- Callbacks ---
 
+    def _on_tab_changed(self, event=None):
+        """Called when the notebook tab changes; builds tabs on first view."""
+        selected = self.notebook.select()
+        if self.export_config is None and selected == str(self.export_frame):
+            self._create_export_tab()
+        elif self.results_text is None and selected == str(self.results_frame):
+            self._create_results_text()
+
     def _on_parameter_change(self):
         """Called when parameter selection changes."""
         pass
@@ -599,6 +717,32 @@ class NeuromorphoAnalyzerApp:
 
     # --- Helpers ---
 
+    def _get_long(self, assay_id: int, params: List[str],
+                  conditions: Optional[List[str]] = None) -> pd.DataFrame:
+        """Get long-format measurements for an assay, reusing cached results.
+
+        Args:
+            assay_id: Assay to load
+            params: Parameters to include
+            conditions: Conditions to include (None = all)
+
+        Returns:
+            Long-format DataFrame (treat as read-only; it is shared)
+        """
+        key = (assay_id, tuple(params), None if conditions is None else tuple(conditions))
+        df = self._long_cache.get(key)
+        if df is None:
+            measurements = self.database.get_measurements(
+                assay_id, parameters=params, conditions=conditions
+            )
+            df = wide_to_long(measurements, params)
+            self._long_cache[key] = df
+            if len(self._long_cache) > LONG_CACHE_SIZE:
+                self._long_cache.popitem(last=False)
+        else:
+            self._long_cache.move_to_end(key)
+        return df
+
     def _check_data_loaded(self) -> bool:
         """Check if data is loaded and show warning if not."""
         if not self.database or not self.current_assay_id:
@@ -626,14 +770,24 @@ class NeuromorphoAnalyzerApp:
         self.root.mainloop()
 
     def cleanup(self):
-        """Clean up resources."""
+        """Clean up resources. Safe to call more than once."""
         if self.database:
-            self.database.disconnect()
+            try:
+                self.database.disconnect()
+            except Exception:
+                pass
+            self.database = None
 
 
-def main():
-    """Main entry point for GUI application."""
-    root = tk.Tk()
+def main(root: Optional[tk.Tk] = None):
+    """Main entry point for GUI application.
+
+    Args:
+        root: Existing Tk root window to build the application in
+            (default: create one)
+    """
+    if root is None:
+        root = tk.Tk()
     app = NeuromorphoAnalyzerApp(root)
 
     def on_close():
@@ -1,15 +1,16 @@
 """Command-line interface for Neuromorpho Analyzer."""
 
 import argparse
+import sqlite3
 import sys
 from pathlib import Path
 from typing import List, Optional
 
-from .core.database import SQLiteDatabase
-from .core.importers import UnifiedImporter, FileScanner
-from .core.processors import StatisticsEngine, DensityCalculator, RepresentativeFileAnalyzer
-from .core.exporters import ExcelExporter, ExportParameterSelector, StatisticsTableExporter
-from .core.profiles import AnalysisProfile, ProfileManager
+# Analysis modules (pandas, SciPy, Numba, openpyxl) are imported inside the
+# commands that use them, so --help and light commands start quickly.
+
+# Parser built on first use by get_parser()
+_PARSER: Optional[argparse.ArgumentParser] = None
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -37,6 +38,8 @@ Examples:
 """
     )
 
+    parser.add_argument("--debug", action="store_true", help="Show full tracebacks on errors")
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # GUI command
@@ -48,6 +51,8 @@ Examples:
     import_parser.add_argument("-d", "--database", required=True, help="Database file path")
     import_parser.add_argument("-n", "--name", help="Assay name (default: directory name)")
     import_parser.add_argument("--recursive", action="store_true", help="Scan subdirectories")
+    import_parser.add_argument("-j", "--jobs", type=int, default=None,
+                               help="Parse files in N worker processes (default: threads)")
 
     # Stats command
     stats_parser = subparsers.add_parser("stats", help="Run statistical analysis")
@@ -61,7 +66,7 @@ Examples:
     export_parser.add_argument("-d", "--database", required=True, help="Database file path")
     export_parser.add_argument("--assay", type=int, required=True, help="Assay ID to export")
     export_parser.add_argument("-o", "--output", required=True, help="Output directory")
-    export_parser.add_argument("-f", "--format", choices=["excel", "csv", "stats"],
+    export_parser.add_argument("-f", "--format", choices=["excel", "csv", "stats", "parquet"],
                                default="excel", help="Export format")
     export_parser.add_argument("-p", "--parameters", nargs="+", help="Parameters to export")
 
@@ -90,266 +95,319 @@ Examples:
     return parser
 
 
+def get_parser() -> argparse.ArgumentParser:
+    """Return the argument parser, creating it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = create_parser()
+    return _PARSER
+
+
 def cmd_gui(args):
     """Launch GUI."""
+    import tkinter as tk
+
+    # Show the window before importing the analysis stack, which takes
+    # over a second; the application is then built inside this root
+    root = tk.Tk()
+    root.title("Neuromorpho Analyzer - Loading...")
+    root.update()
+
     from .app import main as gui_main
-    gui_main()
+    gui_main(root)
 
 
 def cmd_import(args):
     """Import data files."""
-    db = SQLiteDatabase(args.database)
-    db.connect()
+    from .core.database import SQLiteDatabase
+    from .core.importers import UnifiedImporter, FileScanner
 
-    path = Path(args.path)
+    with SQLiteDatabase(args.database) as db:
+        path = Path(args.path)
 
-    if path.is_file():
-        files = [{'path': path, 'condition': path.stem.split('_')[1] if '_' in path.stem else 'Unknown'}]
-    else:
-        scanner = FileScanner(path)
-        files = scanner.scan_files()
+        if path.is_file():
+            files = [{'path': path, 'condition': path.stem.split('_')[1] if '_' in path.stem else 'Unknown'}]
+        else:
+            scanner = FileScanner(path)
+            files = scanner.scan_files()
 
-    if not files:
-        print("No supported files found.")
-        db.disconnect()
-        return 1
+        if not files:
+            print("No supported files found.")
+            return 1
 
-    assay_name = args.name or path.name
-    assay_id = db.insert_assay(assay_name)
+        assay_name = args.name or path.name
+        assay_id = db.insert_assay(assay_name)
 
-    print(f"Created assay '{assay_name}' (ID: {assay_id})")
+        print(f"Created assay '{assay_name}' (ID: {assay_id})")
 
-    total = 0
-    for file_info in files:
-        filepath = file_info['path'] if isinstance(file_info, dict) else file_info
-        condition = file_info.get('condition', 'Unknown') if isinstance(file_info, dict) else 'Unknown'
+        filepaths = [f['path'] if isinstance(f, dict) else Path(f) for f in files]
+        conditions = [f.get('condition', 'Unknown') if isinstance(f, dict) else 'Unknown' for f in files]
 
-        try:
-            df = UnifiedImporter.import_file(str(filepath))
-            count = db.insert_measurements(
-                assay_id, df,
-                source_file=filepath.name if hasattr(filepath, 'name') else str(filepath),
-                condition=condition
-            )
-            total += count
-            print(f"  Imported: {filepath.name if hasattr(filepath, 'name') else filepath} ({count} rows)")
-        except Exception as e:
-            print(f"  Error: {filepath}: {e}")
+        # The assay is new, so the only possible duplicates are files in this
+        # batch; track them here instead of querying the database per file
+        seen = set()
 
-    print(f"\nTotal: {total} measurements imported")
-    db.disconnect()
-    return 0
+        # Parse files concurrently and insert everything in one transaction
+        total = 0
+        with db.transaction():
+            # Inserts stay on this thread; SQLite connections are not shared
+            parsed = UnifiedImporter.iter_import_files(
+                filepaths,
+                max_workers=args.jobs,
+                use_processes=args.jobs is not None and args.jobs > 1
+            )
+            for filepath, condition, (df, error) in zip(filepaths, conditions, parsed):
+                try:
+                    if error is not None:
+                        raise error
+
+                    key = (filepath.name, condition)
+                    count = 0
+                    if key not in seen:
+                        count = db.insert_measurements(
+                            assay_id, df,
+                            source_file=filepath.name,
+                            condition=condition,
+                            check_duplicates=False
+                        )
+                        if count:
+                            seen.add(key)
+                    total += count
+                    print(f"  Imported: {filepath.name} ({count} rows)")
+                except Exception as e:
+                    print(f"  Error: {filepath}: {e}")
+
+        print(f"\nTotal: {total} measurements imported")
+        return 0
 
 
 def cmd_stats(args):
     """Run statistical analysis."""
-    db = SQLiteDatabase(args.database)
-    db.connect()
+    from .core.database import SQLiteDatabase
+    from .core.processors import StatisticsEngine, wide_to_long
+
+    with SQLiteDatabase(args.database) as db:
+        # Only the requested parameters are read from the database
+        df = db.get_measurements(args.assay, parameters=args.parameters)
+        if df.empty:
+            print("No data found for assay.")
+            return 1
 
-    df = db.get_measurements(args.assay)
-    if df.empty:
-        print("No data found for assay.")
-        db.disconnect()
-        return 1
+        stats = StatisticsEngine()
+        df = wide_to_long(df, args.parameters)
+        # Take the parameter list from the loaded data instead of querying again
+        parameters = args.parameters or df['parameter_name'].unique().tolist()
 
-    stats = StatisticsEngine()
-    parameters = args.parameters or db.get_parameters(args.assay)
+        print("=" * 60)
+        print("STATISTICAL ANALYSIS")
+        print("=" * 60)
 
-    print("=" * 60)
-    print("STATISTICAL ANALYSIS")
-    print("=" * 60)
+        # Split by parameter once instead of scanning the frame per parameter
+        by_param = dict(tuple(df.groupby('parameter_name', sort=False, observed=True)))
 
-    for param in parameters:
-        param_df = df[df['parameter_name'] == param]
-        if param_df.empty:
-            continue
+        for param in parameters:
+            param_df = by_param.get(param)
+            if param_df is None or param_df.empty:
+                continue
 
-        print(f"\nParameter: {param}")
-        print("-" * 40)
+            print(f"\nParameter: {param}")
+            print("-" * 40)
 
-        try:
-            result = stats.auto_compare(param_df, 'value', 'condition')
-            main_test = result.get('main_test')
+            try:
+                result = stats.auto_compare(param_df, 'value', 'condition')
+                main_test = result.get('main_test')
 
-            if main_test:
-                print(f"Test: {main_test.test_name}")
-                print(f"Statistic: {main_test.statistic:.4f}")
-                print(f"P-value: {main_test.p_value:.4e}")
-                print(f"Significant: {'Yes' if main_test.significant else 'No'}")
+                if main_test:
+                    print(f"Test: {main_test.test_name}")
+                    print(f"Statistic: {main_test.statistic:.4f}")
+                    print(f"P-value: {main_test.p_value:.4e}")
+                    print(f"Significant: {'Yes' if main_test.significant else 'No'}")
 
-                post_hoc = result.get('post_hoc_tests', [])
-                if post_hoc:
-                    print("\nPost-hoc comparisons:")
-                    for test in post_hoc:
-                        sig = '*' if test.p_value < 0.05 else ''
-                        print(f"  {test.group1} vs {test.group2}: p={test.p_value:.4e} {sig}")
+                    post_hoc = result.get('post_hoc_tests', [])
+                    if post_hoc:
+                        print("\nPost-hoc comparisons:")
+                        for test in post_hoc:
+                            sig = '*' if test.p_value < 0.05 else ''
+                            print(f"  {test.group1} vs {test.group2}: p={test.p_value:.4e} {sig}")
 
-        except Exception as e:
-            print(f"Error: {e}")
+            except Exception as e:
+                print(f"Error: {e}")
 
-    db.disconnect()
-    return 0
+        return 0
 
 
 def cmd_export(args):
     """Export data."""
-    db = SQLiteDatabase(args.database)
-    db.connect()
-
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    stats = StatisticsEngine()
-    param_selector = ExportParameterSelector(db)
-
-    if args.parameters:
-        param_selector.select_parameters(args.parameters)
-    else:
-        param_selector.select_all(args.assay)
-
-    if args.format == "excel":
-        exporter = ExcelExporter(param_selector, stats)
-        output_path = exporter.export([args.assay], output_dir, db)
-        print(f"Exported to: {output_path}")
-
-    elif args.format == "stats":
-        df = db.get_measurements(args.assay)
-        parameters = args.parameters or db.get_parameters(args.assay)
-
-        if parameters:
-            param = parameters[0]
-            param_df = df[df['parameter_name'] == param]
-            data_dict = {}
-            for cond in param_df['condition'].unique():
-                data_dict[cond] = param_df[param_df['condition'] == cond]['value']
-
-            exporter = StatisticsTableExporter(stats)
-            tables = exporter.create_statistics_tables(data_dict, param)
-            output_path = output_dir / f"statistics_{param}.xlsx"
-            exporter.export_to_excel(tables, output_path)
+    from .core.database import SQLiteDatabase
+    from .core.processors import StatisticsEngine, wide_to_long
+    from .core.processors.reshape import ID_COLUMNS
+    from .core.exporters import (
+        ExcelExporter, ExportParameterSelector, ParquetExporter, StatisticsTableExporter
+    )
+
+    with SQLiteDatabase(args.database) as db:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        stats = StatisticsEngine()
+        param_selector = ExportParameterSelector(db)
+
+        if args.parameters:
+            param_selector.select_parameters(args.parameters)
+        else:
+            param_selector.select_all([args.assay])
+
+        if args.format == "excel":
+            exporter = ExcelExporter(param_selector, stats)
+            output_path = exporter.export([args.assay], output_dir, db)
             print(f"Exported to: {output_path}")
 
-    db.disconnect()
-    return 0
+        elif args.format == "parquet":
+            exporter = ParquetExporter(param_selector)
+            output_path = exporter.export([args.assay], output_dir, db)
+            print(f"Exported to: {output_path}")
+
+        elif args.format == "stats":
+            # Only the first parameter is exported; read just that one when known
+            df = db.get_measurements(args.assay, parameters=args.parameters[:1] if args.parameters else None)
+            parameters = args.parameters or [c for c in df.columns if c not in ID_COLUMNS]
+
+            if parameters:
+                param = parameters[0]
+                param_df = wide_to_long(df, [param])
+                # One groupby pass instead of a boolean mask per condition
+                data_dict = {
+                    cond: values.to_numpy()
+                    for cond, values in param_df.groupby('condition', sort=False, observed=True)['value']
+                }
+
+                exporter = StatisticsTableExporter(stats)
+                tables = exporter.create_statistics_tables(data_dict, param)
+                output_path = output_dir / f"statistics_{param}.xlsx"
+                exporter.export_to_excel(tables, output_path)
+                print(f"Exported to: {output_path}")
+
+        return 0
 
 
 def cmd_representative(args):
     """Find representative files."""
-    db = SQLiteDatabase(args.database)
-    db.connect()
-
-    analyzer = RepresentativeFileAnalyzer(db)
-    parameters = args.parameters or db.get_parameters(args.assay)
+    from .core.database import SQLiteDatabase
+    from .core.processors import RepresentativeFileAnalyzer
 
-    results = analyzer.analyze([args.assay], parameters)
+    with SQLiteDatabase(args.database) as db:
+        analyzer = RepresentativeFileAnalyzer(db)
+        # None = every parameter in the loaded measurements
+        results = analyzer.analyze([args.assay], args.parameters)
 
-    print("=" * 60)
-    print("REPRESENTATIVE FILES")
-    print("=" * 60)
+        print("=" * 60)
+        print("REPRESENTATIVE FILES")
+        print("=" * 60)
 
-    for condition in sorted(results['condition'].unique()):
-        print(f"\n{condition}:")
-        cond_results = results[results['condition'] == condition].head(args.top)
-        for _, row in cond_results.iterrows():
-            print(f"  {row['rank']}. {row['file']} (distance: {row['distance_from_average']:.4f})")
+        # One groupby pass instead of a boolean mask per condition
+        for condition, cond_results in results.groupby('condition', sort=True, observed=True):
+            print(f"\n{condition}:")
+            for _, row in cond_results.head(args.top).iterrows():
+                print(f"  {row['rank']}. {row['file']} (distance: {row['distance_from_average']:.4f})")
 
-    if args.output:
-        analyzer.export_to_csv(results, Path(args.output))
-        print(f"\nExported to: {args.output}")
+        if args.output:
+            analyzer.export_to_csv(results, Path(args.output))
+            print(f"\nExported to: {args.output}")
 
-    db.disconnect()
-    return 0
+        return 0
 
 
 def cmd_density(args):
     """Calculate structure density."""
-    from .core.processors import DensityConfig
-
-    db = SQLiteDatabase(args.database)
-    db.connect()
+    from .core.database import SQLiteDatabase
+    from .core.processors import DensityCalculator, DensityConfig
 
-    config = DensityConfig(image_area_um2=args.area)
-    calc = DensityCalculator(config)
+    with SQLiteDatabase(args.database) as db:
+        config = DensityConfig(image_area_um2=args.area)
+        calc = DensityCalculator(config)
 
-    df = db.get_measurements(args.assay)
+        counts = db.get_condition_counts(args.assay)
 
-    print("=" * 60)
-    print("DENSITY ANALYSIS")
-    print(f"Image area: {args.area:.4f} µm²")
-    print("=" * 60)
+        print("=" * 60)
+        print("DENSITY ANALYSIS")
+        print(f"Image area: {args.area:.4f} µm²")
+        print("=" * 60)
 
-    for condition in sorted(df['condition'].unique()):
-        cond_df = df[df['condition'] == condition]
-        count = len(cond_df)
-        result = calc.calculate_density_from_count(count)
+        for condition in sorted(counts):
+            count = counts[condition]
+            result = calc.calculate_density_from_count(count)
 
-        print(f"\n{condition}:")
-        print(f"  Count: {count}")
-        print(f"  Density: {result.density:.6f} /µm²")
-        print(f"  Density: {result.density_per_mm2:.2f} /mm²")
+            print(f"\n{condition}:")
+            print(f"  Count: {count}")
+            print(f"  Density: {result.density:.6f} /µm²")
+            print(f"  Density: {result.density_per_mm2:.2f} /mm²")
 
-    db.disconnect()
-    return 0
+        return 0
 
 
 def cmd_list(args):
     """List database contents."""
-    db = SQLiteDatabase(args.database)
-    db.connect()
-
-    if args.assays:
-        assays = db.list_assays()
-        print("Assays:")
-        for assay in assays:
-            print(f"  {assay['id']}: {assay['name']}")
-
-    if args.conditions:
-        conditions = db.get_conditions(args.conditions)
-        print(f"Conditions for assay {args.conditions}:")
-        for cond in conditions:
-            print(f"  - {cond}")
-
-    if args.parameters:
-        parameters = db.get_parameters(args.parameters)
-        print(f"Parameters for assay {args.parameters}:")
-        for param in parameters:
-            print(f"  - {param}")
+    from .core.database import SQLiteDatabase
+
+    with SQLiteDatabase(args.database) as db:
+        if args.assays:
+            assays = db.list_assays()
+            print("Assays:")
+            for assay in assays:
+                print(f"  {assay['id']}: {assay['name']}")
+
+        if args.conditions:
+            conditions = db.get_conditions(args.conditions)
+            print(f"Conditions for assay {args.conditions}:")
+            for cond in conditions:
+                print(f"  - {cond}")
+
+        if args.parameters:
+            parameters = db.get_parameters(args.parameters)
+            print(f"Parameters for assay {args.parameters}:")
+            for param in parameters:
+                print(f"  - {param}")
+
+        return 0
+
 
-    db.disconnect()
-    return 0
+# Subcommand name -> handler
+COMMANDS = {
+    "gui": cmd_gui,
+    "import": cmd_import,
+    "stats": cmd_stats,
+    "export": cmd_export,
+    "representative": cmd_representative,
+    "density": cmd_density,
+    "list": cmd_list,
+}
+
+# Errors caused by bad input or environment; reported without a traceback
+# unless --debug is given. Anything else is a bug and propagates.
+EXPECTED_ERRORS = (sqlite3.Error, OSError, ValueError, ImportError)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI entry point."""
-    parser = create_parser()
+    parser = get_parser()
     args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return 0
 
-    commands = {
-        "gui": cmd_gui,
-        "import": cmd_import,
-        "stats": cmd_stats,
-        "export": cmd_export,
-        "representative": cmd_representative,
-        "density": cmd_density,
-        "list": cmd_list,
-    }
-
-    cmd_func = commands.get(args.command)
-    if cmd_func:
-        try:
-            return cmd_func(args) or 0
-        except KeyboardInterrupt:
-            print("\nAborted.")
-            return 130
-        except Exception as e:
-            print(f"Error: {e}")
-            return 1
-
-    return 0
+    # argparse only accepts registered subcommands
+    cmd_func = COMMANDS[args.command]
+    try:
+        return cmd_func(args) or 0
+    except KeyboardInterrupt:
+        print("\nAborted.")
+        return 130
+    except EXPECTED_ERRORS as e:
+        if args.debug:
+            raise
+        print(f"Error: {e}")
+        return 1
 
 
 if __name__ == "__main__":
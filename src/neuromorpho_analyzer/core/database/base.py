@@ -1,7 +1,8 @@
 """Abstract base class for database operations."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 import pandas as pd
 
@@ -38,6 +39,22 @@ class DatabaseBase(ABC):
         """
         pass
 
+    def insert_assays(self, assays: Iterable[Tuple[str, Optional[str]]]) -> List[int]:
+        """
+        Insert several assays at once.
+
+        Backends should override this with a bulk insert; the default
+        implementation calls insert_assay() inside one transaction().
+
+        Args:
+            assays: (name, description) pairs
+
+        Returns:
+            Assay IDs in input order
+        """
+        with self.transaction():
+            return [self.insert_assay(name, description) for name, description in assays]
+
     @abstractmethod
     def get_assay(self, assay_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -103,7 +120,8 @@ class DatabaseBase(ABC):
         self,
         assay_id: int,
         condition: Optional[str] = None,
-        parameters: Optional[List[str]] = None
+        parameters: Optional[List[str]] = None,
+        conditions: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Get measurements for an assay.
@@ -112,6 +130,7 @@ class DatabaseBase(ABC):
             assay_id: Assay ID
             condition: Filter by condition (optional)
             parameters: List of parameters to retrieve (None = all)
+            conditions: Filter to any of these conditions (None = all)
 
         Returns:
             DataFrame with measurements
@@ -167,6 +186,87 @@ class DatabaseBase(ABC):
         """
         pass
 
+    def iter_measurements(
+        self,
+        assay_id: int,
+        condition: Optional[str] = None,
+        parameters: Optional[List[str]] = None,
+        conditions: Optional[List[str]] = None,
+        chunk_size: int = 10_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield measurements for an assay in chunks.
+
+        Backends should override this to stream rows from storage; the
+        default implementation yields get_measurements() as one chunk.
+
+        Args:
+            assay_id: Assay ID
+            condition: Filter by condition (optional)
+            parameters: List of parameters to retrieve (None = all)
+            conditions: Filter to any of these conditions (None = all)
+            chunk_size: Maximum rows per chunk (ignored by the default)
+
+        Yields:
+            DataFrames with measurements
+        """
+        df = self.get_measurements(assay_id, condition, parameters, conditions)
+        if not df.empty:
+            yield df
+
+    def get_measurements_bulk(
+        self,
+        assay_ids: List[int],
+        parameters: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Get measurements for several assays at once.
+
+        Backends should override this with a single query; the default
+        implementation calls get_measurements() once per assay.
+
+        Args:
+            assay_ids: Assay IDs
+            parameters: List of parameters to retrieve (None = all)
+
+        Returns:
+            DataFrame with measurements and an 'assay_id' column
+        """
+        dfs = []
+        for assay_id in assay_ids:
+            assay_df = self.get_measurements(assay_id, parameters=parameters)
+            if not assay_df.empty:
+                dfs.append(assay_df.assign(assay_id=assay_id))
+        return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+
+    def get_condition_counts(self, assay_id: int) -> Dict[str, int]:
+        """
+        Get number of measurements per condition for an assay.
+
+        Backends should override this with an aggregate query; the default
+        implementation counts rows returned by get_measurements().
+
+        Args:
+            assay_id: Assay ID
+
+        Returns:
+            Dictionary mapping condition name to measurement count
+        """
+        df = self.get_measurements(assay_id)
+        if df.empty:
+            return {}
+        return df['condition'].value_counts().to_dict()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several write operations into a single transaction.
+
+        Backends that support transactions commit once when the block exits
+        (and roll back on error). The default implementation is a no-op.
+        """
+        yield self
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
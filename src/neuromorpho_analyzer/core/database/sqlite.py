@@ -1,82 +1,287 @@
 """SQLite database backend for single-user workflows."""
 
 import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import pandas as pd
 import json
 from datetime import datetime
 
 from .base import DatabaseBase
 
+try:
+    # Optional; parses the stored JSON about twice as fast as the json module
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+# Connection-level tuning applied on connect: WAL journaling with
+# synchronous=NORMAL, in-memory temp storage, a 256 MB memory map and a
+# 64 MB page cache. Foreign keys are enforced so deleting an assay cascades
+# to its measurements.
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'mmap_size': 268435456,
+    'cache_size': -65536,
+    'foreign_keys': 'ON',
+}
+
+# DEFAULT_PRAGMAS/overrides that also apply to the read-only connection
+READ_PRAGMAS = ('temp_store', 'mmap_size', 'cache_size')
+
+# Columns of the assays table, in the order of ASSAY_SELECT
+ASSAY_COLUMNS = ('id', 'name', 'description', 'created_at')
+ASSAY_SELECT = 'SELECT id, name, description, created_at FROM assays'
+
+# Stored in PRAGMA user_version; bumped when create_tables migrates data
+SCHEMA_VERSION = 1
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Bound parameters per "IN (...)" lookup; below SQLite's historic limit of 999
+MAX_IN_PARAMS = 500
+
+# Maximum number of assays / parameter lists kept by the lookup caches
+LOOKUP_CACHE_SIZE = 256
+
+# Rows fetched and decoded per chunk when reading measurements
+READ_CHUNK_SIZE = 10_000
+
+# Projection of one JSON parameter. json_extract() returns JSON booleans as
+# 0/1 integers, so they are selected as one-byte blobs instead (JSON never
+# yields blobs) and mapped back to bool, matching the full JSON decode.
+EXTRACT_PARAMETER_SQL = (
+    "CASE json_type(parameters, ?) WHEN 'true' THEN X'01' WHEN 'false' THEN X'00' "
+    "ELSE json_extract(parameters, ?) END"
+)
+JSON_BOOLEANS = {b'\x01': True, b'\x00': False}
+
+
+def _decode_json_boolean(value: Any) -> Any:
+    """Map a boolean marker from EXTRACT_PARAMETER_SQL back to bool."""
+    return JSON_BOOLEANS[value] if isinstance(value, bytes) else value
+
+
+def _fix_null_columns(frame: pd.DataFrame, names: Iterable[str]) -> None:
+    """Give parameter columns that are entirely null a float64 dtype.
+
+    pandas builds an all-None column as object dtype. Chunks are decoded
+    separately, so without this a parameter that is empty in one chunk and
+    numeric in the next would concatenate to object instead of float64.
+    """
+    for name in names:
+        column = frame[name]
+        if column.dtype == object and column.isna().all():
+            frame[name] = column.astype('float64')
+
+
+def _combine_frames(frames: Iterable[pd.DataFrame], parameters: Optional[List[str]],
+                    metadata: List[str], stored: Iterable[str] = ()) -> pd.DataFrame:
+    """Concatenate measurement chunks into one DataFrame.
+
+    With a parameter list, columns are ordered parameters first, then
+    ``metadata``; requested parameters that are not ``stored`` for the
+    assays are dropped, while stored ones are kept even if all-NaN.
+    """
+    frames = list(frames)
+    if not frames:
+        return pd.DataFrame()
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    if parameters:
+        stored = set(stored)
+        available = [p for p in parameters if p in stored]
+        df = df.reindex(columns=available + metadata)
+
+    return df
+
 
 class SQLiteDatabase(DatabaseBase):
     """SQLite database implementation for single-user workflows."""
 
-    def __init__(self, db_path: Path = None):
+    def __init__(self, db_path: Path = None, pragmas: Optional[Dict[str, Any]] = None):
         """
         Initialize SQLite database.
 
         Args:
             db_path: Path to SQLite database file (default: ./data.db)
+            pragmas: PRAGMA settings applied on connect, overriding or
+                extending DEFAULT_PRAGMAS (e.g. {'synchronous': 'FULL'})
         """
         if db_path is None:
             db_path = Path.cwd() / 'data.db'
         self.db_path = Path(db_path)
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
         self.connection = None
+        self._read_only_connection = None
+        self._transaction_depth = 0
+
+        # Per-instance lookup caches, cleared by every write that could
+        # change their results (see _clear_caches)
+        self._get_assay_cached = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._fetch_assay)
+        self._get_assay_id_cached = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._fetch_assay_id)
+        self._get_parameters_cached = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._fetch_parameters)
 
     def connect(self) -> None:
         """Establish database connection."""
-        self.connection = sqlite3.connect(self.db_path)
-        self.connection.row_factory = sqlite3.Row  # Enable column access by name
+        # isolation_level=None: no implicit BEGIN before writes; every
+        # write method runs inside an explicit transaction() instead
+        self.connection = sqlite3.connect(
+            self.db_path, cached_statements=STATEMENT_CACHE_SIZE, isolation_level=None
+        )
+        self._clear_caches()
+        self.apply_performance_pragmas()
         self.create_tables()
 
+        # Separate read-only connection for queries, so long reads never
+        # share state with the writer (WAL lets them run side by side)
+        if str(self.db_path) != ':memory:':
+            self._read_only_connection = sqlite3.connect(
+                f'{self.db_path.resolve().as_uri()}?mode=ro', uri=True,
+                cached_statements=STATEMENT_CACHE_SIZE
+            )
+            self._read_only_connection.executescript(''.join(
+                f"PRAGMA {name}={value};"
+                for name, value in self.pragmas.items() if name in READ_PRAGMAS
+            ) + 'PRAGMA query_only=ON;')
+
+    @property
+    def _reader(self) -> sqlite3.Connection:
+        """Connection for queries.
+
+        Inside a transaction() the main connection is used, since its
+        uncommitted writes are invisible to the read-only connection.
+        """
+        if self._transaction_depth or self._read_only_connection is None:
+            return self.connection
+        return self._read_only_connection
+
+    def apply_performance_pragmas(self) -> None:
+        """Apply the configured PRAGMA settings to the open connection.
+
+        Called by connect(); WAL journaling with synchronous=NORMAL avoids
+        the rollback journal's double write and an fsync per commit.
+        """
+        self.connection.executescript(
+            ''.join(f"PRAGMA {name}={value};" for name, value in self.pragmas.items())
+        )
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several write operations into a single transaction.
+
+        Writes inside the block are committed once on exit instead of after
+        every call, and rolled back if an exception escapes the block.
+        Nested blocks join the outermost transaction. The outermost block
+        issues BEGIN IMMEDIATE, taking the write lock up front.
+        """
+        if self._transaction_depth == 0:
+            self.connection.execute('BEGIN IMMEDIATE')
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.connection.execute('ROLLBACK')
+                self._clear_caches()
+            raise
+        else:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.connection.execute('COMMIT')
+
+    def _clear_caches(self) -> None:
+        """Drop all cached assay and parameter lookups."""
+        self._get_assay_cached.cache_clear()
+        self._get_assay_id_cached.cache_clear()
+        self._get_parameters_cached.cache_clear()
+
     def disconnect(self) -> None:
         """Close database connection."""
+        if self._read_only_connection:
+            self._read_only_connection.close()
+            self._read_only_connection = None
         if self.connection:
             self.connection.close()
             self.connection = None
 
     def create_tables(self) -> None:
         """Create necessary database tables."""
-        cursor = self.connection.cursor()
-
-        # Create assays table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS assays (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Create measurements table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS measurements (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                assay_id INTEGER NOT NULL,
-                source_file TEXT,
-                condition TEXT,
-                parameters TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (assay_id) REFERENCES assays(id) ON DELETE CASCADE
-            )
-        ''')
-
-        # Create index on assay_id for faster queries
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_measurements_assay
-            ON measurements(assay_id)
-        ''')
-
-        # Create index on condition for faster filtering
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_measurements_condition
-            ON measurements(condition)
-        ''')
-
-        self.connection.commit()
+        with self.transaction():
+            # Create assays table
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS assays (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    description TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Create measurements table
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS measurements (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    assay_id INTEGER NOT NULL,
+                    source_file TEXT,
+                    condition TEXT,
+                    parameters TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (assay_id) REFERENCES assays(id) ON DELETE CASCADE
+                )
+            ''')
+
+            # Create index on assay_id for faster queries
+            self.connection.execute('''
+                CREATE INDEX IF NOT EXISTS idx_measurements_assay
+                ON measurements(assay_id)
+            ''')
+
+            # Compound index covering the condition/source file lookups
+            # (duplicate check, condition lists and counts), so they never
+            # read the table rows
+            self.connection.execute('''
+                CREATE INDEX IF NOT EXISTS idx_measurements_dup
+                ON measurements(assay_id, condition, source_file)
+            ''')
+
+            # Every condition filter also filters on assay_id and is served
+            # by the compound index; the old single-column index only slowed
+            # down inserts
+            self.connection.execute('DROP INDEX IF EXISTS idx_measurements_condition')
+
+            # Parameter names per assay, in first-seen order (rowid), so
+            # get_parameters never has to read measurement JSON
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS assay_parameters (
+                    assay_id INTEGER NOT NULL,
+                    param_name TEXT NOT NULL,
+                    UNIQUE (assay_id, param_name),
+                    FOREIGN KEY (assay_id) REFERENCES assays(id) ON DELETE CASCADE
+                )
+            ''')
+
+            version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+            if version < SCHEMA_VERSION:
+                # Databases written before assay_parameters existed: collect
+                # the names once from the stored JSON
+                self.connection.execute('''
+                    INSERT OR IGNORE INTO assay_parameters (assay_id, param_name)
+                    SELECT m.assay_id, j.key FROM measurements m, json_each(m.parameters) j
+                    ORDER BY m.id, j.id
+                ''')
+                self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
 
     def insert_assay(self, name: str, description: Optional[str] = None) -> int:
         """
@@ -89,14 +294,42 @@ class SQLiteDatabase(DatabaseBase):
         Returns:
             Assay ID
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            'INSERT INTO assays (name, description) VALUES (?, ?)',
-            (name, description)
-        )
-        self.connection.commit()
+        with self.transaction():
+            cursor = self.connection.execute(
+                'INSERT INTO assays (name, description) VALUES (?, ?)',
+                (name, description)
+            )
+            self._clear_caches()
         return cursor.lastrowid
 
+    def insert_assays(self, assays: Iterable[Tuple[str, Optional[str]]]) -> List[int]:
+        """
+        Insert several assays with one executemany and a single commit.
+
+        Args:
+            assays: (name, description) pairs
+
+        Returns:
+            Assay IDs in input order
+        """
+        rows = list(assays)
+        names = [name for name, _ in rows]
+        ids = {}
+        with self.transaction():
+            self.connection.executemany(
+                'INSERT INTO assays (name, description) VALUES (?, ?)', rows
+            )
+            # Names are unique, so look the new IDs up by name
+            for start in range(0, len(names), MAX_IN_PARAMS):
+                batch = names[start:start + MAX_IN_PARAMS]
+                cursor = self.connection.execute(
+                    f"SELECT name, id FROM assays WHERE name IN ({', '.join('?' * len(batch))})",
+                    batch
+                )
+                ids.update(cursor.fetchall())
+            self._clear_caches()
+        return [ids[name] for name in names]
+
     def get_assay(self, assay_id: int) -> Optional[Dict[str, Any]]:
         """
         Get assay by ID.
@@ -107,12 +340,17 @@ class SQLiteDatabase(DatabaseBase):
         Returns:
             Assay data dictionary or None if not found
         """
-        cursor = self.connection.cursor()
-        cursor.execute('SELECT * FROM assays WHERE id = ?', (assay_id,))
+        assay = self._get_assay_cached(assay_id)
+        # Copy so callers cannot modify the cached entry
+        return dict(assay) if assay else None
+
+    def _fetch_assay(self, assay_id: int) -> Optional[Dict[str, Any]]:
+        """Query one assay by ID (cached by get_assay)."""
+        cursor = self._reader.execute(f'{ASSAY_SELECT} WHERE id = ?', (assay_id,))
         row = cursor.fetchone()
 
         if row:
-            return dict(row)
+            return dict(zip(ASSAY_COLUMNS, row))
         return None
 
     def get_assay_by_name(self, name: str) -> Optional[Dict[str, Any]]:
@@ -125,13 +363,14 @@ class SQLiteDatabase(DatabaseBase):
         Returns:
             Assay data dictionary or None if not found
         """
-        cursor = self.connection.cursor()
-        cursor.execute('SELECT * FROM assays WHERE name = ?', (name,))
-        row = cursor.fetchone()
+        assay_id = self._get_assay_id_cached(name)
+        return self.get_assay(assay_id) if assay_id is not None else None
 
-        if row:
-            return dict(row)
-        return None
+    def _fetch_assay_id(self, name: str) -> Optional[int]:
+        """Query an assay ID by name (cached by get_assay_by_name)."""
+        cursor = self._reader.execute('SELECT id FROM assays WHERE name = ?', (name,))
+        row = cursor.fetchone()
+        return row[0] if row else None
 
     def list_assays(self) -> List[Dict[str, Any]]:
         """
@@ -140,9 +379,8 @@ class SQLiteDatabase(DatabaseBase):
         Returns:
             List of assay dictionaries
         """
-        cursor = self.connection.cursor()
-        cursor.execute('SELECT * FROM assays ORDER BY created_at DESC')
-        return [dict(row) for row in cursor.fetchall()]
+        cursor = self._reader.execute(f'{ASSAY_SELECT} ORDER BY created_at DESC')
+        return [dict(zip(ASSAY_COLUMNS, row)) for row in cursor.fetchall()]
 
     def insert_measurements(
         self,
@@ -165,64 +403,54 @@ class SQLiteDatabase(DatabaseBase):
         Returns:
             Number of measurements inserted
         """
-        if check_duplicates:
-            # Check for duplicates based on source_file and condition
-            existing = self.get_measurements(assay_id, condition=condition)
-            if not existing.empty and source_file:
-                # Filter existing measurements from same source file
-                existing_sources = self._get_measurement_sources(assay_id, condition)
-                if source_file in existing_sources:
-                    # Duplicate detected - skip insertion
-                    return 0
-
-        cursor = self.connection.cursor()
-        inserted_count = 0
-
-        # Insert each measurement row
-        for _, row in measurements.iterrows():
-            # Convert row to JSON for storage
-            parameters_json = row.to_json()
-
-            cursor.execute('''
+        if check_duplicates and source_file and self._has_source(assay_id, source_file, condition):
+            # Duplicate detected - skip insertion
+            return 0
+
+        if measurements.empty:
+            return 0
+
+        # Serialize all rows to JSON in one call (one JSON object per line)
+        rows_json = measurements.to_json(orient='records', lines=True).rstrip('\n').split('\n')
+
+        with self.transaction():
+            self.connection.executemany('''
                 INSERT INTO measurements (assay_id, source_file, condition, parameters)
                 VALUES (?, ?, ?, ?)
-            ''', (assay_id, source_file, condition, parameters_json))
-            inserted_count += 1
-
-        self.connection.commit()
-        return inserted_count
+            ''', [(assay_id, source_file, condition, row_json) for row_json in rows_json])
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO assay_parameters (assay_id, param_name) VALUES (?, ?)',
+                [(assay_id, str(name)) for name in measurements.columns]
+            )
+            self._get_parameters_cached.cache_clear()
+        return len(rows_json)
 
-    def _get_measurement_sources(self, assay_id: int, condition: Optional[str] = None) -> List[str]:
+    def _has_source(self, assay_id: int, source_file: str, condition: Optional[str] = None) -> bool:
         """
-        Get list of source files for an assay.
+        Check whether measurements from a source file are already stored.
 
         Args:
             assay_id: Assay ID
+            source_file: Source file name
             condition: Filter by condition (optional)
 
         Returns:
-            List of source file names
+            True if at least one matching measurement exists
         """
-        cursor = self.connection.cursor()
-
+        query = 'SELECT 1 FROM measurements WHERE assay_id = ? AND source_file = ?'
+        args: List[Any] = [assay_id, source_file]
         if condition:
-            cursor.execute('''
-                SELECT DISTINCT source_file FROM measurements
-                WHERE assay_id = ? AND condition = ?
-            ''', (assay_id, condition))
-        else:
-            cursor.execute('''
-                SELECT DISTINCT source_file FROM measurements
-                WHERE assay_id = ?
-            ''', (assay_id,))
+            query += ' AND condition = ?'
+            args.append(condition)
 
-        return [row[0] for row in cursor.fetchall() if row[0]]
+        return self.connection.execute(query + ' LIMIT 1', args).fetchone() is not None
 
     def get_measurements(
         self,
         assay_id: int,
         condition: Optional[str] = None,
-        parameters: Optional[List[str]] = None
+        parameters: Optional[List[str]] = None,
+        conditions: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Get measurements for an assay.
@@ -231,46 +459,155 @@ class SQLiteDatabase(DatabaseBase):
             assay_id: Assay ID
             condition: Filter by condition (optional)
             parameters: List of parameters to retrieve (None = all)
+            conditions: Filter to any of these conditions (None = all)
 
         Returns:
             DataFrame with measurements
         """
-        cursor = self.connection.cursor()
+        if parameters:
+            parameters = list(dict.fromkeys(parameters))
 
-        if condition:
-            cursor.execute('''
-                SELECT parameters, source_file, condition FROM measurements
-                WHERE assay_id = ? AND condition = ?
-            ''', (assay_id, condition))
-        else:
-            cursor.execute('''
-                SELECT parameters, source_file, condition FROM measurements
-                WHERE assay_id = ?
-            ''', (assay_id,))
+        frames = self.iter_measurements(assay_id, condition, parameters, conditions)
+        stored = self._get_parameters_cached(assay_id) if parameters else ()
+        return _combine_frames(frames, parameters, ['source_file', 'condition'], stored)
 
-        rows = cursor.fetchall()
+    def get_measurements_bulk(
+        self,
+        assay_ids: List[int],
+        parameters: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Get measurements for several assays with a single query.
 
-        if not rows:
-            return pd.DataFrame()
+        Args:
+            assay_ids: Assay IDs
+            parameters: List of parameters to retrieve (None = all)
 
-        # Parse JSON parameters back into DataFrame
-        data = []
-        for row in rows:
-            params = json.loads(row[0])
-            params['source_file'] = row[1]
-            params['condition'] = row[2]
-            data.append(params)
+        Returns:
+            DataFrame with measurements and an 'assay_id' column, grouped
+            by assay in ascending ID order
+        """
+        if parameters:
+            parameters = list(dict.fromkeys(parameters))
+
+        # One query per MAX_IN_PARAMS assays (a single query for typical exports)
+        assay_ids = sorted(set(assay_ids))
+        frames = [
+            frame
+            for start in range(0, len(assay_ids), MAX_IN_PARAMS)
+            for frame in self._iter_measurement_chunks(
+                assay_ids[start:start + MAX_IN_PARAMS], None, parameters, None,
+                READ_CHUNK_SIZE, include_assay_id=True
+            )
+        ]
+        stored = {name for assay_id in assay_ids
+                  for name in self._get_parameters_cached(assay_id)} if parameters else ()
+        return _combine_frames(frames, parameters, ['source_file', 'condition', 'assay_id'],
+                               stored)
 
-        df = pd.DataFrame(data)
+    def iter_measurements(
+        self,
+        assay_id: int,
+        condition: Optional[str] = None,
+        parameters: Optional[List[str]] = None,
+        conditions: Optional[List[str]] = None,
+        chunk_size: int = READ_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield measurements for an assay in chunks of at most chunk_size rows.
 
-        # Filter to selected parameters if specified
-        if parameters:
-            available_params = [p for p in parameters if p in df.columns]
-            metadata_cols = ['source_file', 'condition']
-            cols_to_keep = available_params + [c for c in metadata_cols if c in df.columns]
-            df = df[cols_to_keep]
+        Rows are fetched and decoded one chunk at a time, so callers that
+        process chunks independently never hold the whole assay in memory.
+        With a parameter list every chunk has a column per parameter (NaN
+        where a row lacks it); full reads yield the parameters present in
+        each chunk.
 
-        return df
+        Args:
+            assay_id: Assay ID
+            condition: Filter by condition (optional)
+            parameters: List of parameters to retrieve (None = all)
+            conditions: Filter to any of these conditions (None = all)
+            chunk_size: Maximum rows per chunk
+
+        Yields:
+            DataFrames with parameter columns plus 'source_file' and 'condition'
+        """
+        yield from self._iter_measurement_chunks(
+            [assay_id], condition, parameters, conditions, chunk_size
+        )
+
+    def _iter_measurement_chunks(
+        self,
+        assay_ids: List[int],
+        condition: Optional[str],
+        parameters: Optional[List[str]],
+        conditions: Optional[List[str]],
+        chunk_size: int,
+        include_assay_id: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """Yield measurement chunks for any of ``assay_ids`` from one query."""
+        if not assay_ids:
+            return
+
+        # With a parameter list, pull just those keys out of the JSON inside
+        # SQLite, so unused parameters are never decoded in Python. JSON paths
+        # are bound as arguments; names containing '"' cannot be expressed as
+        # a quoted path label and use the full decode below.
+        extract = bool(parameters) and not any('"' in p for p in parameters)
+        if extract:
+            columns = ', '.join([EXTRACT_PARAMETER_SQL] * len(parameters))
+            args: List[Any] = [f'$."{p}"' for p in parameters for _ in range(2)]
+        else:
+            columns = 'parameters'
+            args = []
+
+        metadata = ['source_file', 'condition']
+        if include_assay_id:
+            metadata.append('assay_id')
+
+        query = f'''
+            SELECT {columns}, {', '.join(metadata)} FROM measurements
+            WHERE assay_id IN ({', '.join('?' * len(assay_ids))})
+        '''
+        args.extend(assay_ids)
+        if condition:
+            query += ' AND condition = ?'
+            args.append(condition)
+        if conditions is not None:
+            if not conditions:
+                return
+            query += f" AND condition IN ({', '.join('?' * len(conditions))})"
+            args.extend(conditions)
+
+        if include_assay_id:
+            query += ' ORDER BY assay_id'
+
+        cursor = self._reader.execute(query, args)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+
+            if extract:
+                frame = pd.DataFrame.from_records(rows, columns=[*parameters, *metadata])
+                _fix_null_columns(frame, parameters)
+                for name in parameters:
+                    # Remaining object columns hold strings and/or boolean
+                    # markers (all-null ones were made float64 above); map
+                    # the markers and let pandas infer bool where possible
+                    if frame[name].dtype == object:
+                        frame[name] = frame[name].map(_decode_json_boolean).infer_objects()
+                yield frame
+                continue
+
+            # Each chunk's blobs are joined into one JSON array and parsed
+            # with a single call; metadata columns are assigned whole
+            blobs, *metadata_values = zip(*rows)
+            frame = pd.DataFrame(_json_loads('[' + ','.join(blobs) + ']'))
+            _fix_null_columns(frame, list(frame.columns))
+            for name, values in zip(metadata, metadata_values):
+                frame[name] = values
+            yield frame
 
     def delete_assay(self, assay_id: int) -> None:
         """
@@ -279,10 +616,10 @@ class SQLiteDatabase(DatabaseBase):
         Args:
             assay_id: Assay ID
         """
-        cursor = self.connection.cursor()
-        cursor.execute('DELETE FROM measurements WHERE assay_id = ?', (assay_id,))
-        cursor.execute('DELETE FROM assays WHERE id = ?', (assay_id,))
-        self.connection.commit()
+        with self.transaction():
+            # Measurements go with it through ON DELETE CASCADE
+            self.connection.execute('DELETE FROM assays WHERE id = ?', (assay_id,))
+            self._clear_caches()
 
     def get_measurement_count(self, assay_id: int) -> int:
         """
@@ -294,10 +631,28 @@ class SQLiteDatabase(DatabaseBase):
         Returns:
             Number of measurements
         """
-        cursor = self.connection.cursor()
-        cursor.execute('SELECT COUNT(*) FROM measurements WHERE assay_id = ?', (assay_id,))
+        cursor = self._reader.execute('SELECT COUNT(*) FROM measurements WHERE assay_id = ?', (assay_id,))
         return cursor.fetchone()[0]
 
+    def get_condition_counts(self, assay_id: int) -> Dict[str, int]:
+        """
+        Get number of measurements per condition for an assay.
+
+        Counting happens in SQL, so no measurement rows are loaded.
+
+        Args:
+            assay_id: Assay ID
+
+        Returns:
+            Dictionary mapping condition name to measurement count
+        """
+        cursor = self._reader.execute('''
+            SELECT condition, COUNT(*) FROM measurements
+            WHERE assay_id = ?
+            GROUP BY condition
+        ''', (assay_id,))
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
     def get_conditions(self, assay_id: int) -> List[str]:
         """
         Get list of conditions for an assay.
@@ -308,8 +663,7 @@ class SQLiteDatabase(DatabaseBase):
         Returns:
             List of condition names
         """
-        cursor = self.connection.cursor()
-        cursor.execute('''
+        cursor = self._reader.execute('''
             SELECT DISTINCT condition FROM measurements
             WHERE assay_id = ? AND condition IS NOT NULL
             ORDER BY condition
@@ -320,22 +674,21 @@ class SQLiteDatabase(DatabaseBase):
         """
         Get list of parameters stored for an assay.
 
+        Includes every parameter of every imported file, in the order they
+        were first imported.
+
         Args:
             assay_id: Assay ID
 
         Returns:
             List of parameter names
         """
-        # Get one measurement and extract parameter names
-        cursor = self.connection.cursor()
-        cursor.execute('''
-            SELECT parameters FROM measurements
-            WHERE assay_id = ?
-            LIMIT 1
-        ''', (assay_id,))
+        return list(self._get_parameters_cached(assay_id))
 
-        row = cursor.fetchone()
-        if row:
-            params = json.loads(row[0])
-            return list(params.keys())
-        return []
+    def _fetch_parameters(self, assay_id: int) -> tuple:
+        """Query the parameter names of an assay (cached by get_parameters)."""
+        cursor = self._reader.execute(
+            'SELECT param_name FROM assay_parameters WHERE assay_id = ? ORDER BY rowid',
+            (assay_id,)
+        )
+        return tuple(row[0] for row in cursor.fetchall())
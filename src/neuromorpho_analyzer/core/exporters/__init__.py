@@ -1,10 +1,31 @@
-"""Export functionality for analysis results."""
+"""Export functionality for analysis results.
 
-from .export_config import ExportConfig
-from .parameter_selector import ExportParameterSelector
-from .statistics_table_exporter import StatisticsTableExporter
-from .excel_exporter import ExcelExporter, ExcelExporterSimple
-from .graphpad_exporter import GraphPadExporter
+Exporters are imported on first access (PEP 562 module ``__getattr__``), so
+importing this package does not load openpyxl, SciPy/statsmodels or pyarrow
+until an exporter that needs them is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .export_config import ExportConfig
+    from .parameter_selector import ExportParameterSelector
+    from .statistics_table_exporter import StatisticsTableExporter
+    from .excel_exporter import ExcelExporter, ExcelExporterSimple
+    from .graphpad_exporter import GraphPadExporter
+    from .parquet_exporter import ParquetExporter
+
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    'ExportConfig': 'export_config',
+    'ExportParameterSelector': 'parameter_selector',
+    'StatisticsTableExporter': 'statistics_table_exporter',
+    'ExcelExporter': 'excel_exporter',
+    'ExcelExporterSimple': 'excel_exporter',
+    'GraphPadExporter': 'graphpad_exporter',
+    'ParquetExporter': 'parquet_exporter',
+}
 
 __all__ = [
     'ExportConfig',
@@ -13,4 +34,18 @@ __all__ = [
     'ExcelExporter',
     'ExcelExporterSimple',
     'GraphPadExporter',
+    'ParquetExporter',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
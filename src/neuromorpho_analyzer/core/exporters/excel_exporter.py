@@ -1,16 +1,20 @@
 """Export comprehensive analysis results to Excel matching the expected format."""
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, NamedStyle, PatternFill
 from openpyxl.utils import get_column_letter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
 from .parameter_selector import ExportParameterSelector
-from ..processors.statistics import StatisticsEngine
+from ..processors.statistics import StatisticsEngine, group_histogram
 from ..database.base import DatabaseBase
 
 
@@ -24,6 +28,80 @@ DEFAULT_FONT = Font(size=11)
 CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
 LEFT_ALIGN = Alignment(horizontal='left', vertical='center')
 
+# Named styles registered once per workbook; cells refer to them by name
+# instead of each getting its own font/fill assignment
+HEADER_STYLE = 'nm_header'
+SECTION_TITLE_LARGE_STYLE = 'nm_section_large'
+SECTION_TITLE_STYLE = 'nm_section'
+LABEL_STYLE = 'nm_label'
+DEFAULT_STYLE = 'nm_default'
+
+# Condition names (lowercase) treated as the control for relative change
+CONTROL_NAMES = ('control', 'ctrl')
+
+# Left edge of the first frequency-distribution bin
+FREQUENCY_BIN_START = 10
+
+# Buffer for writing the .xlsx zip stream, so the many small zip writes
+# are batched into large write() syscalls
+SAVE_BUFFER_SIZE = 1 << 20
+
+DESCRIPTIVE_HEADERS = ['Condition', 'N', 'Mean', 'Median', 'SD', 'SEM', 'Min', 'Max']
+PAIRWISE_HEADERS = ['Group 1', 'Group 2', 'Test', 'Statistic', 'P-value', 'Significant']
+
+
+def _add_named_styles(wb: Workbook) -> None:
+    """Register the exporter's named styles with a workbook."""
+    wb.add_named_style(NamedStyle(name=HEADER_STYLE, font=HEADER_FONT, fill=HEADER_FILL))
+    wb.add_named_style(NamedStyle(name=SECTION_TITLE_LARGE_STYLE, font=SECTION_TITLE_FONT_LARGE))
+    wb.add_named_style(NamedStyle(name=SECTION_TITLE_STYLE, font=SECTION_TITLE_FONT))
+    wb.add_named_style(NamedStyle(name=LABEL_STYLE, font=LABEL_FONT))
+    wb.add_named_style(NamedStyle(name=DEFAULT_STYLE, font=DEFAULT_FONT))
+
+
+def _styled_cell(ws, value, style: str) -> WriteOnlyCell:
+    """Create a cell with a named style for appending to a write-only worksheet."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def _append_title(ws, row_idx: int, title: str, style: str, height: float) -> None:
+    """Append a section title as row ``row_idx`` with a fixed row height."""
+    # Row dimensions must be set before the row is streamed out
+    ws.row_dimensions[row_idx].height = height
+    ws.append([_styled_cell(ws, title, style)])
+
+
+def _save_workbook(wb: Workbook, output_path: Path) -> None:
+    """Save a workbook through a large userspace write buffer."""
+    with open(output_path, 'wb', buffering=SAVE_BUFFER_SIZE) as fh:
+        wb.save(fh)
+
+
+def _frequency_bins(bin_size: float, bin_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Uniform frequency bins starting at FREQUENCY_BIN_START.
+
+    Returns:
+        Tuple of (bin_count + 1 edges, bin_count integer bin-center labels)
+    """
+    edges = FREQUENCY_BIN_START + np.arange(bin_count + 1) * bin_size
+    centers = (edges[:-1] + bin_size / 2).astype(np.int64)
+    return edges, centers
+
+
+def _emit_matrix(ws, header_row: list, matrix: np.ndarray) -> None:
+    """Append a header row and then every row of ``matrix`` to a worksheet."""
+    ws.append(header_row)
+    for row in matrix.tolist():
+        ws.append(row)
+
+
+@lru_cache(maxsize=None)
+def _marker_pattern(marker: str) -> re.Pattern:
+    """Compiled pattern matching file names whose stem ends with ``marker``."""
+    return re.compile(rf'{re.escape(marker)}\.[^.]+$')
+
 
 class ExcelExporter:
     """Exports comprehensive analysis results to Excel in the standard format."""
@@ -43,9 +121,15 @@ class ExcelExporter:
                database: DatabaseBase,
                dataset_split: Optional[Dict[str, str]] = None,
                bin_size: float = 10.0,
-               bin_count: int = 250) -> Path:
+               bin_count: int = 250,
+               include_empty_bins: bool = False,
+               max_workers: Optional[int] = None) -> Path:
         """Export comprehensive Excel file with all parameters and statistics.
 
+        The datasets are filtered and grouped by condition in a thread pool
+        (pandas releases the GIL for most of that work); statistics and
+        sheets are then produced in order on this thread.
+
         Args:
             assay_ids: List of assay IDs to export
             output_dir: Output directory
@@ -53,32 +137,33 @@ class ExcelExporter:
             dataset_split: Optional dict mapping markers (L/T) to names (Liposome/Tubule)
             bin_size: Size of bins for frequency distribution
             bin_count: Number of bins for frequency distribution
+            include_empty_bins: Write a frequency row for every bin, not
+                only bins where some condition has values
+            max_workers: Number of threads preparing datasets (None = one
+                per dataset, 1 = prepare on this thread)
 
         Returns:
             Path to created Excel file
         """
         # Get data from all assays
         parameters = self.param_selector.get_selected()
-        dfs = []
-        for assay_id in assay_ids:
-            assay_df = database.get_measurements(assay_id, parameters=parameters)
-            if not assay_df.empty:
-                assay_df['assay_id'] = assay_id
-                dfs.append(assay_df)
-
-        # Combine all data
-        if dfs:
-            df = pd.concat(dfs, ignore_index=True)
-        else:
-            df = pd.DataFrame()
+        df = database.get_measurements_bulk(assay_ids, parameters=parameters)
+
+        if not df.empty:
+            # Categorical conditions make grouping compare integer codes
+            # instead of strings; categories are kept in sheet order
+            df['condition'] = pd.Categorical(
+                df['condition'], categories=sorted(df['condition'].dropna().unique())
+            )
 
         # Default dataset split if not provided
         if dataset_split is None:
             dataset_split = {'L': 'Liposome', 'T': 'Tubule'}
 
-        # Create workbook
-        wb = Workbook()
-        wb.remove(wb.active)  # Remove default sheet
+        # Create workbook; write-only mode streams each appended row to disk
+        # instead of keeping a Cell object per value in memory
+        wb = Workbook(write_only=True)
+        _add_named_styles(wb)
 
         # Generate filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -86,35 +171,43 @@ class ExcelExporter:
         filename = f'analysis_{timestamp}_assays{assay_indices}.xlsx'
 
         # Get conditions
-        conditions = sorted(df['condition'].unique()) if not df.empty else []
-
-        # Create sheets for each dataset type
-        for marker, dataset_name in dataset_split.items():
-            # Filter data by marker if available (check source_file for marker)
-            dataset_df = self._filter_by_marker(df, marker)
-            if dataset_df.empty:
-                # If no marker-based data, use all data for first dataset
-                if marker == list(dataset_split.keys())[0]:
-                    dataset_df = df
-                else:
-                    continue
+        conditions = list(df['condition'].cat.categories) if not df.empty else []
+
+        # Prepare every dataset concurrently; only the first dataset falls
+        # back to all data when no file carries its marker
+        markers = list(dataset_split)
+        prepare = partial(self._prepare_dataset, df)
+        fallbacks = [marker == markers[0] for marker in markers]
+        if len(markers) <= 1 or max_workers == 1:
+            prepared = list(map(prepare, markers, fallbacks))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers or len(markers)) as executor:
+                prepared = list(executor.map(prepare, markers, fallbacks))
+
+        # Create sheets for each dataset type (workbook access stays on this thread)
+        for dataset_name, condition_values in zip(dataset_split.values(), prepared):
+            if condition_values is None:
+                continue
 
             # Create data sheet (raw values with stats header)
-            self._create_data_sheet(wb, dataset_df, dataset_name, conditions)
+            self._create_data_sheet(wb, condition_values, dataset_name, conditions)
 
             # Create relative change sheet
-            self._create_relative_change_sheet(wb, dataset_df, dataset_name, conditions)
+            self._create_relative_change_sheet(wb, condition_values, dataset_name, conditions)
 
             # Create frequency sheet
-            self._create_frequency_sheet(wb, dataset_df, dataset_name, conditions,
-                                         bin_size=bin_size, bin_count=bin_count)
+            self._create_frequency_sheet(wb, condition_values, dataset_name, conditions,
+                                         bin_size=bin_size, bin_count=bin_count,
+                                         include_empty_bins=include_empty_bins)
 
             # Create statistics sheet
-            self._create_statistics_sheet(wb, dataset_df, dataset_name, conditions)
+            result = self._compare_conditions(condition_values, conditions)
+            self._create_statistics_sheet(wb, condition_values, dataset_name, conditions,
+                                          result)
 
         # Save
         output_path = output_dir / filename
-        wb.save(output_path)
+        _save_workbook(wb, output_path)
 
         return output_path
 
@@ -131,11 +224,79 @@ class ExcelExporter:
         if df.empty or 'source_file' not in df.columns:
             return pd.DataFrame()
 
-        # Check if source file ends with marker before extension
-        mask = df['source_file'].str.contains(f'{marker}\\.[^.]+$', regex=True, na=False)
-        return df[mask].copy()
+        # Check if source file ends with marker before extension. Files
+        # repeat across many rows, so match each distinct name only once.
+        pattern = _marker_pattern(marker)
+        source_files = df['source_file']
+        matching = [name for name in source_files.unique()
+                    if isinstance(name, str) and pattern.search(name)]
+        mask = source_files.isin(matching)
+        # Callers only read the subset, so skip the extra defensive copy
+        return df.loc[mask]
+
+    def _prepare_dataset(self, df: pd.DataFrame, marker: str, use_all_if_unmarked: bool
+                         ) -> Optional[Dict[str, np.ndarray]]:
+        """Select one dataset's values by condition without touching the workbook.
+
+        Args:
+            df: Long-format DataFrame with all exported values
+            marker: Dataset marker in the source file names
+            use_all_if_unmarked: Use all data if no file carries the marker
+
+        Returns:
+            Dictionary mapping conditions to value arrays, or None if the
+            dataset is skipped
+        """
+        # Filter data by marker if available (check source_file for marker)
+        dataset_df = self._filter_by_marker(df, marker)
+        if dataset_df.empty:
+            if not use_all_if_unmarked:
+                return None
+            dataset_df = df
 
-    def _create_data_sheet(self, wb: Workbook, df: pd.DataFrame,
+        # Split values by condition once; every sheet builder reuses it
+        return self._group_by_condition(dataset_df)
+
+    def _compare_conditions(self, condition_values: Dict[str, np.ndarray],
+                            conditions: List[str]) -> Dict[str, Any]:
+        """Run the automatic statistical comparison across conditions.
+
+        Args:
+            condition_values: Values by condition
+            conditions: Conditions in sheet order
+
+        Returns:
+            auto_compare result, {} if no condition has values, or
+            {'error': message} if the comparison failed
+        """
+        data_dict = {cond: condition_values[cond] for cond in conditions
+                     if len(condition_values.get(cond, ())) > 0}
+        if not data_dict:
+            return {}
+
+        # auto_compare takes the per-condition arrays directly, so no
+        # long-format DataFrame has to be built for it
+        try:
+            return self.stats.auto_compare(data_dict, 'value', 'condition')
+        except Exception as e:
+            return {'error': str(e)}
+
+    def _group_by_condition(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Split non-missing values by condition in a single groupby pass.
+
+        Args:
+            df: Long-format DataFrame with 'condition' and 'value' columns
+
+        Returns:
+            Dictionary mapping condition names to arrays of values
+        """
+        if df.empty:
+            return {}
+
+        grouped = df.dropna(subset=['value']).groupby('condition', sort=False, observed=True)['value']
+        return {cond: values.to_numpy() for cond, values in grouped}
+
+    def _create_data_sheet(self, wb: Workbook, condition_values: Dict[str, np.ndarray],
                            sheet_name: str, conditions: List[str]) -> None:
         """Create data worksheet with conditions as columns.
 
@@ -148,93 +309,82 @@ class ExcelExporter:
         """
         ws = wb.create_sheet(sheet_name)
 
-        if df.empty:
+        if not condition_values:
             self._write_empty_data_sheet(ws, conditions)
             return
 
-        # Get values grouped by condition
-        condition_values = {}
-        for cond in conditions:
-            cond_data = df[df['condition'] == cond]['value'].dropna().tolist()
-            condition_values[cond] = cond_data
+        columns = [condition_values.get(cond, np.empty(0)) for cond in conditions]
 
         # Row 1: Condition headers
-        ws.cell(row=1, column=1, value='Condition:').font = DEFAULT_FONT
-        for col_idx, cond in enumerate(conditions, 2):
-            ws.cell(row=1, column=col_idx, value=cond).font = DEFAULT_FONT
+        ws.append([_styled_cell(ws, 'Condition:', DEFAULT_STYLE)] +
+                  [_styled_cell(ws, cond, DEFAULT_STYLE) for cond in conditions])
 
         # Row 2: Average
-        ws.cell(row=2, column=1, value='Average:').font = DEFAULT_FONT
-        for col_idx, cond in enumerate(conditions, 2):
-            values = condition_values.get(cond, [])
-            if values:
-                avg = np.mean(values)
-                ws.cell(row=2, column=col_idx, value=avg)
+        ws.append([_styled_cell(ws, 'Average:', DEFAULT_STYLE)] +
+                  [values.mean() if len(values) else None for values in columns])
 
-        # Row 3: SEM
-        ws.cell(row=3, column=1, value='SEM:').font = DEFAULT_FONT
-        for col_idx, cond in enumerate(conditions, 2):
-            values = condition_values.get(cond, [])
-            if len(values) > 1:
-                sem = np.std(values, ddof=1) / np.sqrt(len(values))
-                ws.cell(row=3, column=col_idx, value=sem)
+        # Row 3: SEM (needs at least two values)
+        ws.append([_styled_cell(ws, 'SEM:', DEFAULT_STYLE)] +
+                  [values.std(ddof=1) / np.sqrt(len(values)) if len(values) > 1 else None
+                   for values in columns])
 
         # Row 4: Count
-        ws.cell(row=4, column=1, value='Count:').font = DEFAULT_FONT
-        for col_idx, cond in enumerate(conditions, 2):
-            values = condition_values.get(cond, [])
-            ws.cell(row=4, column=col_idx, value=len(values))
-
-        # Row 5+: Values
-        max_values = max(len(v) for v in condition_values.values()) if condition_values else 0
-        for row_idx in range(5, 5 + max_values):
-            value_idx = row_idx - 5
-            if value_idx == 0:
-                ws.cell(row=row_idx, column=1, value='Values:')
-
-            for col_idx, cond in enumerate(conditions, 2):
-                values = condition_values.get(cond, [])
-                if value_idx < len(values):
-                    ws.cell(row=row_idx, column=col_idx, value=values[value_idx])
+        ws.append([_styled_cell(ws, 'Count:', DEFAULT_STYLE)] +
+                  [len(values) for values in columns])
+
+        # Row 5+: Values, as one padded (value, condition) matrix so each
+        # row is appended whole; shorter columns are padded with blanks
+        max_values = max(len(values) for values in columns)
+        matrix = np.full((max_values, len(conditions) + 1), None, dtype=object)
+        for col_idx, values in enumerate(columns, 1):
+            matrix[:len(values), col_idx] = values
+        if max_values:
+            matrix[0, 0] = 'Values:'
+        for row in matrix.tolist():
+            ws.append(row)
 
     def _write_empty_data_sheet(self, ws, conditions: List[str]) -> None:
         """Write empty data sheet structure."""
-        ws.cell(row=1, column=1, value='Condition:').font = DEFAULT_FONT
-        for col_idx, cond in enumerate(conditions, 2):
-            ws.cell(row=1, column=col_idx, value=cond).font = DEFAULT_FONT
-
-        ws.cell(row=2, column=1, value='Average:').font = DEFAULT_FONT
-        ws.cell(row=3, column=1, value='SEM:').font = DEFAULT_FONT
-        ws.cell(row=4, column=1, value='Count:').font = DEFAULT_FONT
-        ws.cell(row=5, column=1, value='Values:')
-
-    def _create_relative_change_sheet(self, wb: Workbook, df: pd.DataFrame,
+        ws.append([_styled_cell(ws, 'Condition:', DEFAULT_STYLE)] +
+                  [_styled_cell(ws, cond, DEFAULT_STYLE) for cond in conditions])
+        ws.append([_styled_cell(ws, 'Average:', DEFAULT_STYLE)])
+        ws.append([_styled_cell(ws, 'SEM:', DEFAULT_STYLE)])
+        ws.append([_styled_cell(ws, 'Count:', DEFAULT_STYLE)])
+        ws.append(['Values:'])
+
+    def _create_relative_change_sheet(self, wb: Workbook, condition_values: Dict[str, np.ndarray],
                                        base_name: str, conditions: List[str]) -> None:
-        """Create relative change worksheet."""
-        sheet_name = f'{base_name}_RelativeChange'
-        ws = wb.create_sheet(sheet_name)
+        """Create relative change worksheet.
 
-        # Same structure as data sheet but for relative change values
-        ws.cell(row=1, column=1, value='Condition:').font = DEFAULT_FONT
-        for col_idx, cond in enumerate(conditions, 2):
-            ws.cell(row=1, column=col_idx, value=cond).font = DEFAULT_FONT
+        Each value is expressed as percent change from the control mean,
+        (value / control_mean - 1) * 100, in the same layout as the data
+        sheet. The sheet is skipped if there is no control condition with
+        a non-zero mean to compare against.
+        """
+        control = next((cond for cond in conditions if cond.lower() in CONTROL_NAMES), None)
+        control_values = condition_values.get(control, ())
+        if len(control_values) == 0:
+            return
 
-        ws.cell(row=2, column=1, value='Average:').font = DEFAULT_FONT
-        ws.cell(row=3, column=1, value='SEM:').font = DEFAULT_FONT
-        ws.cell(row=4, column=1, value='Count:').font = DEFAULT_FONT
-        ws.cell(row=5, column=1, value='Values:')
+        control_mean = control_values.mean()
+        if control_mean == 0:
+            return
 
-        # Relative change would be calculated against control - placeholder for now
+        relative_values = {cond: (values / control_mean - 1) * 100
+                           for cond, values in condition_values.items()}
+        self._create_data_sheet(wb, relative_values, f'{base_name}_RelativeChange', conditions)
 
-    def _create_frequency_sheet(self, wb: Workbook, df: pd.DataFrame,
+    def _create_frequency_sheet(self, wb: Workbook, condition_values: Dict[str, np.ndarray],
                                  base_name: str, conditions: List[str],
                                  bin_size: float = 10.0,
-                                 bin_count: int = 250) -> None:
+                                 bin_count: int = 250,
+                                 include_empty_bins: bool = False) -> None:
         """Create frequency distribution worksheet.
 
         Format:
         Header: Bin Center | cond1_Frequency | cond1_Percentage | cond2_Frequency | ...
-        Data rows with frequency counts and percentages
+        Data rows with frequency counts and percentages (one row per bin
+        that holds any value, or per bin if include_empty_bins is set)
         """
         sheet_name = f'{base_name}_Frequency'
         ws = wb.create_sheet(sheet_name)
@@ -244,51 +394,40 @@ class ExcelExporter:
         for cond in conditions:
             headers.extend([f'{cond}_Frequency', f'{cond}_Percentage'])
 
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
+        header_row = [_styled_cell(ws, header, HEADER_STYLE) for header in headers]
 
-        if df.empty:
+        if not condition_values:
+            ws.append(header_row)
             return
 
-        # Calculate bin centers (starting from bin_size/2 + 10)
-        bin_start = 10 + bin_size / 2
-        bin_centers = [bin_start + i * bin_size for i in range(bin_count)]
-
-        # Get frequency data for each condition
-        condition_freqs = {}
-        for cond in conditions:
-            cond_values = df[df['condition'] == cond]['value'].dropna().values
-            if len(cond_values) > 0:
-                # Calculate histogram
-                bins = [10 + i * bin_size for i in range(bin_count + 1)]
-                hist, _ = np.histogram(cond_values, bins=bins)
-                total = len(cond_values)
-                percentages = (hist / total * 100) if total > 0 else hist
-                condition_freqs[cond] = (hist, percentages)
-            else:
-                condition_freqs[cond] = (np.zeros(bin_count), np.zeros(bin_count))
-
-        # Write data rows
-        for row_idx, bin_center in enumerate(bin_centers, 2):
-            ws.cell(row=row_idx, column=1, value=int(bin_center))
-
-            col_idx = 2
-            for cond in conditions:
-                hist, pct = condition_freqs.get(cond, (np.zeros(bin_count), np.zeros(bin_count)))
-                bin_idx = row_idx - 2
-                if bin_idx < len(hist):
-                    freq = int(hist[bin_idx])
-                    percentage = pct[bin_idx]
-                    # Only write non-zero values
-                    if freq > 0:
-                        ws.cell(row=row_idx, column=col_idx, value=freq)
-                        ws.cell(row=row_idx, column=col_idx + 1, value=round(percentage, 2))
-                col_idx += 2
-
-    def _create_statistics_sheet(self, wb: Workbook, df: pd.DataFrame,
-                                  base_name: str, conditions: List[str]) -> None:
+        edges, bin_centers = _frequency_bins(bin_size, bin_count)
+
+        # Histogram every condition in one compiled pass over the values
+        columns = [np.asarray(condition_values.get(cond, ()), dtype=np.float64)
+                   for cond in conditions]
+        totals = np.array([len(values) for values in columns], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(totals)))
+        hist = group_histogram(np.concatenate(columns), offsets, edges, float(bin_size))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            percentages = hist / totals[:, None] * 100
+
+        # Lay the sheet body out as one (bin, column) matrix; only non-zero
+        # bins get values, the rest stay blank
+        matrix = np.full((bin_count, len(headers)), None, dtype=object)
+        matrix[:, 0] = bin_centers.tolist()
+        nonzero = hist.T > 0
+        matrix[:, 1::2] = np.where(nonzero, hist.T.astype(object), None)
+        matrix[:, 2::2] = np.where(nonzero, np.round(percentages.T, 2).astype(object), None)
+
+        if not include_empty_bins:
+            # Typical distributions fill only a few of the bins
+            matrix = matrix[nonzero.any(axis=1)]
+
+        _emit_matrix(ws, header_row, matrix)
+
+    def _create_statistics_sheet(self, wb: Workbook, condition_values: Dict[str, np.ndarray],
+                                  base_name: str, conditions: List[str],
+                                  result: Dict[str, Any]) -> None:
         """Create statistics worksheet with three sections.
 
         Format:
@@ -304,107 +443,61 @@ class ExcelExporter:
         sheet_name = f'{base_name}_Statistics'
         ws = wb.create_sheet(sheet_name)
 
-        if df.empty:
-            self._write_empty_statistics_sheet(ws)
-            return
-
-        # Prepare data for statistics
-        data_dict = {}
-        for cond in conditions:
-            cond_values = df[df['condition'] == cond]['value'].dropna()
-            if len(cond_values) > 0:
-                data_dict[cond] = cond_values
+        # Conditions with values, in sheet order
+        data_dict = {cond: condition_values[cond] for cond in conditions
+                     if len(condition_values.get(cond, ())) > 0}
 
         if not data_dict:
             self._write_empty_statistics_sheet(ws)
             return
 
-        # Convert to DataFrame for statistics
-        stats_df = pd.DataFrame([
-            {'condition': cond, 'value': val}
-            for cond, series in data_dict.items()
-            for val in series
-        ])
-
-        # Run statistical analysis
-        try:
-            result = self.stats.auto_compare(stats_df, 'value', 'condition')
-        except Exception as e:
-            self._write_empty_statistics_sheet(ws, error=str(e))
+        if 'error' in result:
+            self._write_empty_statistics_sheet(ws, error=result['error'])
             return
 
-        current_row = 1
-
         # Section 1: STATISTICAL ANALYSIS
-        ws.cell(row=current_row, column=1, value='STATISTICAL ANALYSIS').font = SECTION_TITLE_FONT_LARGE
-        ws.row_dimensions[current_row].height = 18.75
-        current_row += 2
+        _append_title(ws, 1, 'STATISTICAL ANALYSIS', SECTION_TITLE_LARGE_STYLE, 18.75)
+        ws.append([])
+        current_row = 3
 
         # Overall test info
         main_test = result.get('main_test')
         if main_test:
-            ws.cell(row=current_row, column=1, value='Overall Test:').font = LABEL_FONT
             test_name = main_test.test_name
             if result.get('is_parametric') is False:
                 test_name += ' (non-parametric)'
-            ws.cell(row=current_row, column=2, value=test_name)
-            current_row += 1
-
-            ws.cell(row=current_row, column=1, value='Test Statistic:')
-            ws.cell(row=current_row, column=2, value=round(main_test.statistic, 4))
-            current_row += 1
-
-            ws.cell(row=current_row, column=1, value='P-value:')
-            ws.cell(row=current_row, column=2, value=f'{main_test.p_value:.4e}')
-            current_row += 1
-
-            ws.cell(row=current_row, column=1, value='Significant (α=0.05):')
-            ws.cell(row=current_row, column=2, value='Yes' if main_test.significant else 'No')
-            current_row += 3
+            ws.append([_styled_cell(ws, 'Overall Test:', LABEL_STYLE), test_name])
+            ws.append(['Test Statistic:', round(main_test.statistic, 4)])
+            ws.append(['P-value:', f'{main_test.p_value:.4e}'])
+            ws.append(['Significant (α=0.05):', 'Yes' if main_test.significant else 'No'])
+            ws.append([])
+            ws.append([])
+            current_row += 6
 
         # Section 2: DESCRIPTIVE STATISTICS
-        ws.cell(row=current_row, column=1, value='DESCRIPTIVE STATISTICS').font = SECTION_TITLE_FONT
-        ws.row_dimensions[current_row].height = 15.75
-        current_row += 1
+        _append_title(ws, current_row, 'DESCRIPTIVE STATISTICS', SECTION_TITLE_STYLE, 15.75)
+        ws.append([_styled_cell(ws, header, HEADER_STYLE)
+                   for header in DESCRIPTIVE_HEADERS])
 
-        # Header row
-        desc_headers = ['Condition', 'N', 'Mean', 'Median', 'SD', 'SEM', 'Min', 'Max']
-        for col_idx, header in enumerate(desc_headers, 1):
-            cell = ws.cell(row=current_row, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
-        current_row += 1
+        # Descriptive stats data (already computed by auto_compare)
+        descriptive = result['descriptive_stats']
+        for cond in data_dict:
+            stats = descriptive[cond]
+            n = stats['n']
+            sem = stats['std'] / np.sqrt(n) if n > 0 else 0
 
-        # Descriptive stats data
-        for cond, series in data_dict.items():
-            n = len(series)
-            mean = series.mean()
-            median = series.median()
-            std = series.std(ddof=1)
-            sem = std / np.sqrt(n) if n > 0 else 0
-            min_val = series.min()
-            max_val = series.max()
-
-            values = [cond, n, round(mean, 3), round(median, 3),
-                      round(std, 3), round(sem, 3), round(min_val, 3), round(max_val, 3)]
-            for col_idx, val in enumerate(values, 1):
-                ws.cell(row=current_row, column=col_idx, value=val)
-            current_row += 1
+            ws.append([cond, n, round(stats['mean'], 3), round(stats['median'], 3),
+                       round(stats['std'], 3), round(sem, 3),
+                       round(stats['min'], 3), round(stats['max'], 3)])
 
-        current_row += 2
+        ws.append([])
+        ws.append([])
+        current_row += 2 + len(data_dict) + 2
 
         # Section 3: PAIRWISE COMPARISONS
-        ws.cell(row=current_row, column=1, value='PAIRWISE COMPARISONS').font = SECTION_TITLE_FONT
-        ws.row_dimensions[current_row].height = 15.75
-        current_row += 1
-
-        # Header row
-        pairwise_headers = ['Group 1', 'Group 2', 'Test', 'Statistic', 'P-value', 'Significant']
-        for col_idx, header in enumerate(pairwise_headers, 1):
-            cell = ws.cell(row=current_row, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
-        current_row += 1
+        _append_title(ws, current_row, 'PAIRWISE COMPARISONS', SECTION_TITLE_STYLE, 15.75)
+        ws.append([_styled_cell(ws, header, HEADER_STYLE)
+                   for header in PAIRWISE_HEADERS])
 
         # Pairwise comparison data
         post_hoc = result.get('post_hoc_tests', [])
@@ -413,39 +506,31 @@ class ExcelExporter:
                 test_name = 'Mann-Whitney U' if not result.get('is_parametric', True) else 'Tukey HSD'
                 significant = 'Yes' if test.p_value < 0.05 else 'No'
 
-                values = [test.group1, test.group2, test_name,
-                          round(test.statistic, 4) if hasattr(test, 'statistic') else '',
-                          f'{test.p_value:.4e}', significant]
-                for col_idx, val in enumerate(values, 1):
-                    ws.cell(row=current_row, column=col_idx, value=val)
-                current_row += 1
+                ws.append([test.group1, test.group2, test_name,
+                           round(test.statistic, 4) if hasattr(test, 'statistic') else '',
+                           f'{test.p_value:.4e}', significant])
 
     def _write_empty_statistics_sheet(self, ws, error: str = None) -> None:
         """Write empty statistics sheet structure."""
-        ws.cell(row=1, column=1, value='STATISTICAL ANALYSIS').font = SECTION_TITLE_FONT_LARGE
-        ws.row_dimensions[1].height = 18.75
+        _append_title(ws, 1, 'STATISTICAL ANALYSIS', SECTION_TITLE_LARGE_STYLE, 18.75)
+        ws.append([])
+        ws.append(['Error:', error] if error else [])
 
-        if error:
-            ws.cell(row=3, column=1, value='Error:')
-            ws.cell(row=3, column=2, value=error)
+        # Rows 4-8 stay blank
+        for _ in range(5):
+            ws.append([])
 
-        ws.cell(row=9, column=1, value='DESCRIPTIVE STATISTICS').font = SECTION_TITLE_FONT
-        ws.row_dimensions[9].height = 15.75
+        _append_title(ws, 9, 'DESCRIPTIVE STATISTICS', SECTION_TITLE_STYLE, 15.75)
+        ws.append([_styled_cell(ws, header, HEADER_STYLE)
+                   for header in DESCRIPTIVE_HEADERS])
 
-        desc_headers = ['Condition', 'N', 'Mean', 'Median', 'SD', 'SEM', 'Min', 'Max']
-        for col_idx, header in enumerate(desc_headers, 1):
-            cell = ws.cell(row=10, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
+        # Rows 11-18 stay blank
+        for _ in range(8):
+            ws.append([])
 
-        ws.cell(row=19, column=1, value='PAIRWISE COMPARISONS').font = SECTION_TITLE_FONT
-        ws.row_dimensions[19].height = 15.75
-
-        pairwise_headers = ['Group 1', 'Group 2', 'Test', 'Statistic', 'P-value', 'Significant']
-        for col_idx, header in enumerate(pairwise_headers, 1):
-            cell = ws.cell(row=20, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
+        _append_title(ws, 19, 'PAIRWISE COMPARISONS', SECTION_TITLE_STYLE, 15.75)
+        ws.append([_styled_cell(ws, header, HEADER_STYLE)
+                   for header in PAIRWISE_HEADERS])
 
 
 class ExcelExporterSimple:
@@ -481,6 +566,7 @@ class ExcelExporterSimple:
         """
         wb = Workbook()
         wb.remove(wb.active)
+        _add_named_styles(wb)
 
         conditions = list(data.keys())
 
@@ -496,7 +582,7 @@ class ExcelExporterSimple:
         if include_statistics:
             self._create_statistics_sheet_from_dict(wb, data, dataset_name, conditions)
 
-        wb.save(output_path)
+        _save_workbook(wb, output_path)
         return output_path
 
     def _create_data_sheet_from_dict(self, wb: Workbook, data: Dict[str, List[float]],
@@ -505,26 +591,26 @@ class ExcelExporterSimple:
         ws = wb.create_sheet(sheet_name)
 
         # Row 1: Condition headers
-        ws.cell(row=1, column=1, value='Condition:').font = DEFAULT_FONT
+        ws.cell(row=1, column=1, value='Condition:').style = DEFAULT_STYLE
         for col_idx, cond in enumerate(conditions, 2):
-            ws.cell(row=1, column=col_idx, value=cond).font = DEFAULT_FONT
+            ws.cell(row=1, column=col_idx, value=cond).style = DEFAULT_STYLE
 
         # Row 2: Average
-        ws.cell(row=2, column=1, value='Average:').font = DEFAULT_FONT
+        ws.cell(row=2, column=1, value='Average:').style = DEFAULT_STYLE
         for col_idx, cond in enumerate(conditions, 2):
             values = data.get(cond, [])
             if values:
                 ws.cell(row=2, column=col_idx, value=np.mean(values))
 
         # Row 3: SEM
-        ws.cell(row=3, column=1, value='SEM:').font = DEFAULT_FONT
+        ws.cell(row=3, column=1, value='SEM:').style = DEFAULT_STYLE
         for col_idx, cond in enumerate(conditions, 2):
             values = data.get(cond, [])
             if len(values) > 1:
                 ws.cell(row=3, column=col_idx, value=np.std(values, ddof=1) / np.sqrt(len(values)))
 
         # Row 4: Count
-        ws.cell(row=4, column=1, value='Count:').font = DEFAULT_FONT
+        ws.cell(row=4, column=1, value='Count:').style = DEFAULT_STYLE
         for col_idx, cond in enumerate(conditions, 2):
             ws.cell(row=4, column=col_idx, value=len(data.get(cond, [])))
 
@@ -552,40 +638,27 @@ class ExcelExporterSimple:
         for cond in conditions:
             headers.extend([f'{cond}_Frequency', f'{cond}_Percentage'])
 
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
+        header_row = [_styled_cell(ws, header, HEADER_STYLE) for header in headers]
 
-        # Bin centers
-        bin_start = 10 + bin_size / 2
-        bin_centers = [bin_start + i * bin_size for i in range(bin_count)]
+        # Bin edges and centers, shared by every condition
+        edges, bin_centers = _frequency_bins(bin_size, bin_count)
 
-        # Calculate frequencies
-        condition_freqs = {}
-        for cond in conditions:
-            values = np.array(data.get(cond, []))
-            if len(values) > 0:
-                bins = [10 + i * bin_size for i in range(bin_count + 1)]
-                hist, _ = np.histogram(values, bins=bins)
-                total = len(values)
-                pct = (hist / total * 100) if total > 0 else hist
-                condition_freqs[cond] = (hist, pct)
-            else:
-                condition_freqs[cond] = (np.zeros(bin_count), np.zeros(bin_count))
-
-        # Write data
-        for row_idx, bin_center in enumerate(bin_centers, 2):
-            ws.cell(row=row_idx, column=1, value=int(bin_center))
-
-            col_idx = 2
-            for cond in conditions:
-                hist, pct = condition_freqs.get(cond, (np.zeros(bin_count), np.zeros(bin_count)))
-                bin_idx = row_idx - 2
-                if bin_idx < len(hist) and hist[bin_idx] > 0:
-                    ws.cell(row=row_idx, column=col_idx, value=int(hist[bin_idx]))
-                    ws.cell(row=row_idx, column=col_idx + 1, value=round(pct[bin_idx], 2))
-                col_idx += 2
+        # Histogram every condition in one compiled pass over the values
+        columns = [np.asarray(data.get(cond, ()), dtype=np.float64) for cond in conditions]
+        totals = np.array([len(values) for values in columns], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(totals)))
+        hist = group_histogram(np.concatenate(columns), offsets, edges, float(bin_size))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            percentages = hist / totals[:, None] * 100
+
+        # One row per bin; only non-zero bins get values
+        matrix = np.full((bin_count, len(headers)), None, dtype=object)
+        matrix[:, 0] = bin_centers.tolist()
+        nonzero = hist.T > 0
+        matrix[:, 1::2] = np.where(nonzero, hist.T.astype(object), None)
+        matrix[:, 2::2] = np.where(nonzero, np.round(percentages.T, 2).astype(object), None)
+
+        _emit_matrix(ws, header_row, matrix)
 
     def _create_statistics_sheet_from_dict(self, wb: Workbook, data: Dict[str, List[float]],
                                             base_name: str, conditions: List[str]) -> None:
@@ -593,59 +666,55 @@ class ExcelExporterSimple:
         sheet_name = f'{base_name}_Statistics'
         ws = wb.create_sheet(sheet_name)
 
-        # Convert to DataFrame for statistics
-        stats_df = pd.DataFrame([
-            {'condition': cond, 'value': val}
-            for cond, values in data.items()
-            for val in values
-        ])
+        # Conditions with values; auto_compare takes the arrays directly
+        groups = {cond: values for cond, values in data.items() if len(values) > 0}
 
         current_row = 1
 
         # Section 1: STATISTICAL ANALYSIS
-        ws.cell(row=current_row, column=1, value='STATISTICAL ANALYSIS').font = SECTION_TITLE_FONT_LARGE
+        ws.cell(row=current_row, column=1, value='STATISTICAL ANALYSIS').style = SECTION_TITLE_LARGE_STYLE
         ws.row_dimensions[current_row].height = 18.75
         current_row += 2
 
-        # Run statistics
+        # Run statistics once; the main test and pairwise sections share it
         try:
-            result = self.stats.auto_compare(stats_df, 'value', 'condition')
-            main_test = result.get('main_test')
-
-            if main_test:
-                ws.cell(row=current_row, column=1, value='Overall Test:').font = LABEL_FONT
-                test_name = main_test.test_name
-                if result.get('is_parametric') is False:
-                    test_name += ' (non-parametric)'
-                ws.cell(row=current_row, column=2, value=test_name)
-                current_row += 1
-
-                ws.cell(row=current_row, column=1, value='Test Statistic:')
-                ws.cell(row=current_row, column=2, value=round(main_test.statistic, 4))
-                current_row += 1
-
-                ws.cell(row=current_row, column=1, value='P-value:')
-                ws.cell(row=current_row, column=2, value=f'{main_test.p_value:.4e}')
-                current_row += 1
-
-                ws.cell(row=current_row, column=1, value='Significant (α=0.05):')
-                ws.cell(row=current_row, column=2, value='Yes' if main_test.significant else 'No')
+            result = self.stats.auto_compare(groups, 'value', 'condition')
         except Exception as e:
+            result = {}
             ws.cell(row=current_row, column=1, value='Error:')
             ws.cell(row=current_row, column=2, value=str(e))
 
+        main_test = result.get('main_test')
+        if main_test:
+            ws.cell(row=current_row, column=1, value='Overall Test:').style = LABEL_STYLE
+            test_name = main_test.test_name
+            if result.get('is_parametric') is False:
+                test_name += ' (non-parametric)'
+            ws.cell(row=current_row, column=2, value=test_name)
+            current_row += 1
+
+            ws.cell(row=current_row, column=1, value='Test Statistic:')
+            ws.cell(row=current_row, column=2, value=round(main_test.statistic, 4))
+            current_row += 1
+
+            ws.cell(row=current_row, column=1, value='P-value:')
+            ws.cell(row=current_row, column=2, value=f'{main_test.p_value:.4e}')
+            current_row += 1
+
+            ws.cell(row=current_row, column=1, value='Significant (α=0.05):')
+            ws.cell(row=current_row, column=2, value='Yes' if main_test.significant else 'No')
+
         current_row = 9
 
         # Section 2: DESCRIPTIVE STATISTICS
-        ws.cell(row=current_row, column=1, value='DESCRIPTIVE STATISTICS').font = SECTION_TITLE_FONT
+        ws.cell(row=current_row, column=1, value='DESCRIPTIVE STATISTICS').style = SECTION_TITLE_STYLE
         ws.row_dimensions[current_row].height = 15.75
         current_row += 1
 
         desc_headers = ['Condition', 'N', 'Mean', 'Median', 'SD', 'SEM', 'Min', 'Max']
         for col_idx, header in enumerate(desc_headers, 1):
             cell = ws.cell(row=current_row, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
+            cell.style = HEADER_STYLE
         current_row += 1
 
         for cond in conditions:
@@ -667,32 +736,26 @@ class ExcelExporterSimple:
         current_row = 19
 
         # Section 3: PAIRWISE COMPARISONS
-        ws.cell(row=current_row, column=1, value='PAIRWISE COMPARISONS').font = SECTION_TITLE_FONT
+        ws.cell(row=current_row, column=1, value='PAIRWISE COMPARISONS').style = SECTION_TITLE_STYLE
         ws.row_dimensions[current_row].height = 15.75
         current_row += 1
 
         pairwise_headers = ['Group 1', 'Group 2', 'Test', 'Statistic', 'P-value', 'Significant']
         for col_idx, header in enumerate(pairwise_headers, 1):
             cell = ws.cell(row=current_row, column=col_idx, value=header)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
+            cell.style = HEADER_STYLE
         current_row += 1
 
-        # Get pairwise comparisons
-        try:
-            result = self.stats.auto_compare(stats_df, 'value', 'condition')
-            post_hoc = result.get('post_hoc_tests', [])
-
-            if post_hoc:
-                for test in post_hoc:
-                    test_name = 'Mann-Whitney U' if not result.get('is_parametric', True) else 'Tukey HSD'
-                    significant = 'Yes' if test.p_value < 0.05 else 'No'
-
-                    row_values = [test.group1, test.group2, test_name,
-                                  round(test.statistic, 4) if hasattr(test, 'statistic') else '',
-                                  f'{test.p_value:.4e}', significant]
-                    for col_idx, val in enumerate(row_values, 1):
-                        ws.cell(row=current_row, column=col_idx, value=val)
-                    current_row += 1
-        except Exception:
-            pass
+        # Pairwise comparisons
+        post_hoc = result.get('post_hoc_tests', [])
+        if post_hoc:
+            for test in post_hoc:
+                test_name = 'Mann-Whitney U' if not result.get('is_parametric', True) else 'Tukey HSD'
+                significant = 'Yes' if test.p_value < 0.05 else 'No'
+
+                row_values = [test.group1, test.group2, test_name,
+                              round(test.statistic, 4) if hasattr(test, 'statistic') else '',
+                              f'{test.p_value:.4e}', significant]
+                for col_idx, val in enumerate(row_values, 1):
+                    ws.cell(row=current_row, column=col_idx, value=val)
+                current_row += 1
@@ -36,18 +36,7 @@ class GraphPadExporter:
         """
         # Get data from all assays
         parameters = self.param_selector.get_selected()
-        dfs = []
-        for assay_id in assay_ids:
-            assay_df = database.get_measurements(assay_id, parameters=parameters)
-            if not assay_df.empty:
-                assay_df['assay_id'] = assay_id
-                dfs.append(assay_df)
-
-        # Combine all data
-        if dfs:
-            df = pd.concat(dfs, ignore_index=True)
-        else:
-            df = pd.DataFrame()
+        df = database.get_measurements_bulk(assay_ids, parameters=parameters)
 
         # Create XML structure
         root = ET.Element('GraphPadPrismFile', {
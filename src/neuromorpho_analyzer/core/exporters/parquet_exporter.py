@@ -0,0 +1,74 @@
+"""Export measurements as Parquet for reuse in other analysis tools."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from .parameter_selector import ExportParameterSelector
+from ..database.base import DatabaseBase
+
+try:
+    # Optional dependency; pandas needs it to write Parquet
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class ParquetExporter:
+    """Exports measurements in the columnar Parquet format.
+
+    Parquet stores each parameter as a compressed, typed column, so files
+    are much smaller than CSV/Excel and tools such as pandas, polars or
+    DuckDB can read back only the columns and conditions they need.
+    """
+
+    COMPRESSION = 'snappy'
+    ROW_GROUP_SIZE = 50_000
+
+    def __init__(self, parameter_selector: ExportParameterSelector):
+        """Initialize Parquet exporter.
+
+        Args:
+            parameter_selector: Parameter selector for export
+        """
+        self.param_selector = parameter_selector
+
+    def export(self, assay_ids: List[int], output_dir: Path,
+               database: DatabaseBase,
+               partition_by_condition: bool = False) -> Path:
+        """Export the selected parameters of the given assays.
+
+        Args:
+            assay_ids: List of assay IDs to export
+            output_dir: Output directory
+            database: Database interface
+            partition_by_condition: Write a dataset directory with one
+                'condition=<name>' subdirectory per condition instead of
+                a single file
+
+        Returns:
+            Path to the created .parquet file (or dataset directory)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+        parameters = self.param_selector.get_selected()
+        df = database.get_measurements_bulk(assay_ids, parameters=parameters)
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        assay_indices = '_'.join(str(aid) for aid in sorted(assay_ids))
+        output_path = output_dir / f'measurements_{timestamp}_assays{assay_indices}'
+
+        if partition_by_condition and 'condition' in df.columns:
+            df.to_parquet(output_path, engine='pyarrow', compression=self.COMPRESSION,
+                          index=False, partition_cols=['condition'])
+            return output_path
+
+        output_path = output_path.with_suffix('.parquet')
+        df.to_parquet(output_path, engine='pyarrow', compression=self.COMPRESSION,
+                      index=False, row_group_size=self.ROW_GROUP_SIZE)
+        return output_path
@@ -1,13 +1,48 @@
 """Export statistical results as formatted tables."""
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.utils import get_column_letter
 from ..processors.statistics import StatisticsEngine
 
 
+# Min, Q25, median, Q75 and max for the summary table
+SUMMARY_QUANTILES = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+# Shared cell styles; openpyxl styles are immutable, so one instance serves every cell
+HEADER_FONT = Font(bold=True, size=12, color='FFFFFF')
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+
+# Fill for each significance marker written by _get_significance_level
+SIGNIFICANCE_FILLS = {
+    '***': PatternFill(start_color='FF6B6B', end_color='FF6B6B', fill_type='solid'),
+    '**': PatternFill(start_color='FFA07A', end_color='FFA07A', fill_type='solid'),
+    '*': PatternFill(start_color='FFD700', end_color='FFD700', fill_type='solid'),
+}
+
+# Widest Excel column the exporter will size to fit its contents
+MAX_COLUMN_WIDTH = 50
+
+
+def _column_widths(df: pd.DataFrame) -> np.ndarray:
+    """Column widths fitting each column's header and longest value.
+
+    Lengths are measured on the DataFrame with vectorized string ops
+    rather than by reading every written cell back from the worksheet.
+    """
+    header_lengths = np.array([len(str(name)) for name in df.columns])
+    value_lengths = np.array([column.astype(str).str.len().max() if len(column) else 0
+                              for _, column in df.items()], dtype=np.float64)
+    lengths = np.fmax(header_lengths, value_lengths)
+    return np.minimum(lengths + 2, MAX_COLUMN_WIDTH)
+
+
 class StatisticsTableExporter:
     """Exports comprehensive statistical results as formatted tables."""
 
@@ -25,6 +60,7 @@ class StatisticsTableExporter:
 
         Args:
             data: Dictionary mapping condition names to data series
+                or arrays
             parameter_name: Name of the parameter
 
         Returns:
@@ -32,17 +68,32 @@ class StatisticsTableExporter:
         """
         tables = {}
 
+        # Run the statistical tests once; both result tables are built from them
+        result = self._run_comparison(data)
+
         # 1. Summary statistics table
         tables['summary'] = self._create_summary_table(data, parameter_name)
 
         # 2. ANOVA results table
-        tables['anova'] = self._create_anova_table(data, parameter_name)
+        tables['anova'] = self._create_anova_table(data, parameter_name, result)
 
         # 3. Pairwise comparisons table
-        tables['pairwise'] = self._create_pairwise_table(data, parameter_name)
+        tables['pairwise'] = self._create_pairwise_table(data, parameter_name, result)
 
         return tables
 
+    def _run_comparison(self, data: Dict[str, pd.Series]) -> Dict[str, Any]:
+        """Run auto_compare on condition data.
+
+        Args:
+            data: Dictionary mapping condition names to data series
+
+        Returns:
+            Results dictionary from auto_compare()
+        """
+        # auto_compare takes the condition-to-values dict directly
+        return self.stats.auto_compare(data, 'value', 'condition')
+
     def _create_summary_table(self, data: Dict[str, pd.Series],
                               parameter_name: str) -> pd.DataFrame:
         """Create summary statistics table with values.
@@ -54,20 +105,19 @@ class StatisticsTableExporter:
         Returns:
             DataFrame with summary statistics
         """
-        import numpy as np
         rows = []
 
         for condition, series in data.items():
+            # Works on Series or plain arrays; NaNs are skipped like pandas does
+            values = np.asarray(series, dtype=np.float64)
+
             # Calculate summary statistics
-            n = len(series)
-            mean = series.mean()
-            std = series.std(ddof=1)
+            n = len(values)
+            mean = np.nanmean(values)
+            std = np.nanstd(values, ddof=1)
             sem = std / np.sqrt(n) if n > 0 else 0
-            median = series.median()
-            min_val = series.min()
-            max_val = series.max()
-            q25 = series.quantile(0.25)
-            q75 = series.quantile(0.75)
+            # All order statistics from a single partition of the values
+            min_val, q25, median, q75, max_val = np.nanquantile(values, SUMMARY_QUANTILES)
 
             rows.append({
                 'Parameter': parameter_name,
@@ -86,25 +136,20 @@ class StatisticsTableExporter:
         return pd.DataFrame(rows)
 
     def _create_anova_table(self, data: Dict[str, pd.Series],
-                            parameter_name: str) -> pd.DataFrame:
+                            parameter_name: str,
+                            result: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """Create ANOVA results table.
 
         Args:
             data: Dictionary mapping condition names to data series
             parameter_name: Name of the parameter
+            result: Precomputed auto_compare() results (computed if None)
 
         Returns:
             DataFrame with ANOVA results
         """
-        # Convert data to DataFrame format for auto_compare
-        df_data = []
-        for condition, series in data.items():
-            for value in series:
-                df_data.append({'condition': condition, 'value': value})
-        df = pd.DataFrame(df_data)
-
-        # Run auto_compare to get statistical results
-        result = self.stats.auto_compare(df, 'value', 'condition')
+        if result is None:
+            result = self._run_comparison(data)
 
         rows = [{
             'Parameter': parameter_name,
@@ -130,25 +175,20 @@ class StatisticsTableExporter:
         return pd.DataFrame(rows)
 
     def _create_pairwise_table(self, data: Dict[str, pd.Series],
-                               parameter_name: str) -> pd.DataFrame:
+                               parameter_name: str,
+                               result: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """Create pairwise comparisons table.
 
         Args:
             data: Dictionary mapping condition names to data series
             parameter_name: Name of the parameter
+            result: Precomputed auto_compare() results (computed if None)
 
         Returns:
             DataFrame with pairwise comparison results
         """
-        # Convert data to DataFrame format for auto_compare
-        df_data = []
-        for condition, series in data.items():
-            for value in series:
-                df_data.append({'condition': condition, 'value': value})
-        df = pd.DataFrame(df_data)
-
-        # Run auto_compare to get statistical results
-        result = self.stats.auto_compare(df, 'value', 'condition')
+        if result is None:
+            result = self._run_comparison(data)
 
         # Get post-hoc tests if available
         post_hoc_tests = result.get('post_hoc_tests')
@@ -202,58 +242,41 @@ class StatisticsTableExporter:
             tables: Dictionary of table name to DataFrame
             output_path: Path for output Excel file
         """
-        wb = Workbook()
-        wb.remove(wb.active)
+        # Stream rows straight to the file instead of keeping a cell grid
+        wb = Workbook(write_only=True)
 
         # Create worksheets for each table type
         for table_name, df in tables.items():
             ws = wb.create_sheet(table_name.capitalize())
 
+            # Column widths must be set before the first row is written
+            for col_idx, width in enumerate(_column_widths(df), 1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = int(width)
+
             # Write header
-            for col_idx, col_name in enumerate(df.columns, 1):
-                cell = ws.cell(row=1, column=col_idx, value=col_name)
-                cell.font = Font(bold=True, size=12, color='FFFFFF')
-                cell.fill = PatternFill(
-                    start_color='366092', end_color='366092', fill_type='solid'
-                )
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+            header = []
+            for col_name in df.columns:
+                cell = WriteOnlyCell(ws, value=col_name)
+                cell.font = HEADER_FONT
+                cell.fill = HEADER_FILL
+                cell.alignment = CENTER_ALIGN
+                header.append(cell)
+            ws.append(header)
+
+            # Highlight significant results in the last column
+            highlight_col = len(df.columns) if 'Significant' in df.columns else None
 
             # Write data
-            for row_idx, row in enumerate(df.itertuples(index=False), 2):
+            for row in df.itertuples(index=False, name=None):
+                cells = []
                 for col_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-
-                    # Highlight significant results
-                    if col_idx == len(row) and 'Significant' in df.columns:
-                        if isinstance(value, str):
-                            if value.startswith('***'):
-                                cell.fill = PatternFill(
-                                    start_color='FF6B6B', end_color='FF6B6B',
-                                    fill_type='solid'
-                                )
-                            elif value.startswith('**'):
-                                cell.fill = PatternFill(
-                                    start_color='FFA07A', end_color='FFA07A',
-                                    fill_type='solid'
-                                )
-                            elif value.startswith('*'):
-                                cell.fill = PatternFill(
-                                    start_color='FFD700', end_color='FFD700',
-                                    fill_type='solid'
-                                )
-
-            # Auto-adjust column widths
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(cell.value)
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.alignment = CENTER_ALIGN
+                    if col_idx == highlight_col and isinstance(value, str):
+                        fill = SIGNIFICANCE_FILLS.get(value.split(' ', 1)[0])
+                        if fill is not None:
+                            cell.fill = fill
+                    cells.append(cell)
+                ws.append(cells)
 
         wb.save(output_path)
@@ -4,6 +4,18 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import pandas as pd
 
+try:
+    # Optional Rust-based reader; much faster than openpyxl for XLSX
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# pandas gained the 'calamine' read_excel engine in 2.2; older versions still
+# use python-calamine directly for sheet names
+PANDAS_CALAMINE_ENGINE = CALAMINE_AVAILABLE and \
+    tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+
 
 class ExcelImporter:
     """Imports data from Excel files (XLS and XLSX)."""
@@ -100,7 +112,7 @@ class ExcelImporter:
     @staticmethod
     def _import_xlsx(file_path: Path, sheet_index: int = 0) -> pd.DataFrame:
         """
-        Import XLSX file using openpyxl.
+        Import XLSX file with pandas' calamine engine if available, else openpyxl.
 
         Args:
             file_path: Path to XLSX file
@@ -110,8 +122,11 @@ class ExcelImporter:
             DataFrame with all data from the sheet
 
         Raises:
-            ImportError: If openpyxl not installed
+            ImportError: If openpyxl is needed but not installed
         """
+        if PANDAS_CALAMINE_ENGINE:
+            return pd.read_excel(file_path, sheet_name=sheet_index, engine='calamine')
+
         try:
             from openpyxl import load_workbook
         except ImportError:
@@ -184,6 +199,9 @@ class ExcelImporter:
             workbook = xlrd.open_workbook(file_path)
             return workbook.sheet_names()
         elif ext == '.xlsx':
+            if CALAMINE_AVAILABLE:
+                from python_calamine import CalamineWorkbook
+                return CalamineWorkbook.from_path(str(file_path)).sheet_names
             from openpyxl import load_workbook
             workbook = load_workbook(file_path, read_only=True)
             names = workbook.sheetnames
@@ -1,10 +1,17 @@
 """File scanning and metadata extraction for neuromorphology data files."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import re
 import json
 
+from .excel_importer import CALAMINE_AVAILABLE
+
+
+# Number of files whose headers HeaderScanner remembers
+HEADER_CACHE_SIZE = 64
+
 
 class FileScanner:
     """Scans directories for morphology data files and extracts metadata."""
@@ -32,8 +39,12 @@ class FileScanner:
             image_index, dataset_marker, file_format
         """
         files = []
-        for ext in self.supported_extensions:
-            for file_path in self.directory.glob(f'*{ext}'):
+        if not self.directory.is_dir():
+            return files
+
+        # One directory listing instead of one glob per extension
+        for file_path in self.directory.iterdir():
+            if file_path.suffix in self.supported_extensions:
                 metadata = self._parse_filename(file_path)
                 if metadata:
                     files.append(metadata)
@@ -79,6 +90,14 @@ class FileScanner:
 class HeaderScanner:
     """Extracts column headers from various file formats."""
 
+    # File extension -> name of the scanner method
+    _SCANNERS = {
+        '.xls': '_scan_xls',
+        '.xlsx': '_scan_xlsx',
+        '.csv': '_scan_csv',
+        '.json': '_scan_json',
+    }
+
     @staticmethod
     def scan_headers(file_path: Path) -> List[str]:
         """
@@ -95,22 +114,37 @@ class HeaderScanner:
             FileNotFoundError: If file does not exist
         """
         file_path = Path(file_path)
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         ext = file_path.suffix.lower()
-
-        if ext == '.xls':
-            return HeaderScanner._scan_xls(file_path)
-        elif ext == '.xlsx':
-            return HeaderScanner._scan_xlsx(file_path)
-        elif ext == '.csv':
-            return HeaderScanner._scan_csv(file_path)
-        elif ext == '.json':
-            return HeaderScanner._scan_json(file_path)
-        else:
+        if ext not in HeaderScanner._SCANNERS:
             raise ValueError(f"Unsupported file format: {ext}")
 
+        # Keyed on modification time and size so edited files are rescanned
+        headers = HeaderScanner._scan_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+        return list(headers)
+
+    @staticmethod
+    @lru_cache(maxsize=HEADER_CACHE_SIZE)
+    def _scan_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+        """
+        Scan headers, remembering results for recently scanned files.
+
+        Args:
+            file_path: Path to data file
+            mtime_ns: File modification time (cache key only)
+            size: File size in bytes (cache key only)
+
+        Returns:
+            Tuple of column header names
+        """
+        path = Path(file_path)
+        scanner = getattr(HeaderScanner, HeaderScanner._SCANNERS[path.suffix.lower()])
+        return tuple(scanner(path))
+
     @staticmethod
     def _scan_xls(file_path: Path) -> List[str]:
         """
@@ -143,15 +177,28 @@ class HeaderScanner:
         Returns:
             List of header names from first row
         """
+        if CALAMINE_AVAILABLE:
+            from python_calamine import CalamineWorkbook
+            sheet = CalamineWorkbook.from_path(str(file_path)).get_sheet_by_index(0)
+            headers = next(iter(sheet.iter_rows()), [])
+            # Calamine returns '' for empty cells
+            return [str(h).strip() for h in headers if h is not None and h != '']
+
         try:
             from openpyxl import load_workbook
         except ImportError:
             raise ImportError("openpyxl package required for XLSX files. Install with: pip install openpyxl")
 
         workbook = load_workbook(file_path, read_only=True)
-        sheet = workbook.active
-        headers = [cell.value for cell in sheet[1]]
-        workbook.close()
+        try:
+            sheet = workbook.active
+            # Ignore the stored dimensions: files from some writers claim the
+            # full A1:XFD1048576 range, which pads the row to 16384 cells
+            sheet.reset_dimensions()
+            # values_only skips building a cell object per header cell
+            headers = next(sheet.iter_rows(max_row=1, values_only=True), ())
+        finally:
+            workbook.close()
         return [str(h).strip() for h in headers if h is not None]
 
     @staticmethod
@@ -1,7 +1,11 @@
 """Unified importer that works with all supported file formats."""
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Iterator, Tuple
 import pandas as pd
 
 from .csv_importer import CSVImporter
@@ -10,6 +14,25 @@ from .excel_importer import ExcelImporter
 from .parameter_mapper import ParameterMapper
 
 
+def _import_one(
+    file_path: Path,
+    selected_parameters: Optional[List[str]],
+    parameter_mapper: Optional[ParameterMapper],
+    kwargs: Dict
+) -> Tuple[Optional[pd.DataFrame], Optional[Exception]]:
+    """Import one file, returning the error instead of raising (module-level so worker processes can run it)."""
+    try:
+        df = UnifiedImporter.import_file(
+            file_path,
+            selected_parameters,
+            parameter_mapper,
+            **kwargs
+        )
+        return df, None
+    except Exception as e:
+        return None, e
+
+
 class UnifiedImporter:
     """
     Unified importer that automatically detects file format and imports data.
@@ -156,6 +179,63 @@ class UnifiedImporter:
         else:
             return pd.DataFrame()
 
+    @staticmethod
+    def iter_import_files(
+        file_paths: List[Path],
+        selected_parameters: Optional[List[str]] = None,
+        parameter_mapper: Optional[ParameterMapper] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        **kwargs
+    ) -> Iterator[Tuple[Optional[pd.DataFrame], Optional[Exception]]]:
+        """
+        Import files concurrently, yielding results in input order.
+
+        Parsing is mostly file I/O and pandas C code, so by default a thread
+        pool overlaps read latency across files. For large files where
+        parsing itself is the bottleneck, use_processes parses in spawned
+        worker processes instead. Errors are returned per file instead of
+        aborting the whole batch.
+
+        Args:
+            file_paths: List of file paths to import
+            selected_parameters: List of parameters to import (None = all)
+            parameter_mapper: ParameterMapper instance (overrides selected_parameters)
+            max_workers: Worker count (default: min(32, 4 * CPU count) threads,
+                or CPU count processes)
+            use_processes: Parse in worker processes instead of threads
+            **kwargs: Additional format-specific arguments
+
+        Yields:
+            (DataFrame, None) on success or (None, exception) on failure,
+            one tuple per file in the order of file_paths
+        """
+        import_one = partial(
+            _import_one,
+            selected_parameters=selected_parameters,
+            parameter_mapper=parameter_mapper,
+            kwargs=kwargs
+        )
+
+        # Nothing to overlap for a single file; skip starting the pool
+        if len(file_paths) <= 1 or max_workers == 1:
+            yield from map(import_one, file_paths)
+            return
+
+        if use_processes:
+            # Spawned, not forked, so workers never inherit locks held by
+            # GUI or JIT threads
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+                yield from executor.map(import_one, file_paths)
+            return
+
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(import_one, file_paths)
+
     @staticmethod
     def get_row_count(file_path: Path, **kwargs) -> int:
         """
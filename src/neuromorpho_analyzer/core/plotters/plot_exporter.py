@@ -1,6 +1,36 @@
 from pathlib import Path
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import matplotlib.pyplot as plt
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+
+def _save_figure(fig: plt.Figure, output_dir: Path, base_name: str,
+                 formats: List[str], dpi: int) -> List[Path]:
+    """Save one figure in each format (module-level so worker processes can run it)."""
+    exported_files = []
+
+    for fmt in formats:
+        # Normalize format name
+        if fmt == 'tiff':
+            fmt = 'tif'
+
+        output_path = output_dir / f"{base_name}.{fmt}"
+
+        # Export with high DPI
+        fig.savefig(output_path,
+                   dpi=dpi,
+                   format=fmt,
+                   bbox_inches='tight',
+                   facecolor='white',
+                   edgecolor='none',
+                   transparent=False)
+
+        exported_files.append(output_path)
+
+    return exported_files
 
 
 class PlotExporter:
@@ -14,6 +44,12 @@ class PlotExporter:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.dpi = dpi
 
+    def _check_formats(self, formats: List[str]) -> None:
+        """Raise ValueError for any unsupported format."""
+        for fmt in formats:
+            if fmt not in self.SUPPORTED_FORMATS:
+                raise ValueError(f"Unsupported format: {fmt}")
+
     def export_figure(self, fig: plt.Figure,
                      base_name: str,
                      formats: List[str] = ['png', 'tif']) -> List[Path]:
@@ -28,44 +64,47 @@ class PlotExporter:
         Returns:
             List of paths to exported files
         """
-        exported_files = []
-
-        for fmt in formats:
-            if fmt not in self.SUPPORTED_FORMATS:
-                raise ValueError(f"Unsupported format: {fmt}")
-
-            # Normalize format name
-            if fmt == 'tiff':
-                fmt = 'tif'
-
-            output_path = self.output_dir / f"{base_name}.{fmt}"
-
-            # Export with high DPI
-            fig.savefig(output_path,
-                       dpi=self.dpi,
-                       format=fmt,
-                       bbox_inches='tight',
-                       facecolor='white',
-                       edgecolor='none',
-                       transparent=False)
-
-            exported_files.append(output_path)
-
-        return exported_files
+        self._check_formats(formats)
+        return _save_figure(fig, self.output_dir, base_name, formats, self.dpi)
 
     def export_multiple_figures(self, figures: Dict[str, plt.Figure],
-                                formats: List[str] = ['png', 'tif']) -> Dict[str, List[Path]]:
+                                formats: List[str] = ['png', 'tif'],
+                                max_workers: Optional[int] = None) -> Dict[str, List[Path]]:
         """
         Export multiple figures at once.
 
+        High-DPI rendering is CPU-bound, so figures are pickled and rendered
+        in parallel worker processes. Workers are spawned rather than forked
+        so they never inherit locks held by GUI or JIT threads. Falls back to
+        exporting one by one if a figure cannot be pickled.
+
         Args:
             figures: Dict mapping base names to figures
             formats: Export formats
+            max_workers: Number of worker processes (None = CPU count,
+                1 = export in this process)
 
         Returns:
             Dict mapping base names to lists of exported file paths
         """
-        results = {}
-        for name, fig in figures.items():
-            results[name] = self.export_figure(fig, name, formats)
-        return results
+        self._check_formats(formats)
+        names = list(figures)
+
+        if len(names) > 1 and max_workers != 1:
+            try:
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+                    paths = executor.map(
+                        _save_figure,
+                        [figures[name] for name in names],
+                        [self.output_dir] * len(names),
+                        names,
+                        [formats] * len(names),
+                        [self.dpi] * len(names)
+                    )
+                    return dict(zip(names, paths))
+            except (pickle.PicklingError, AttributeError, TypeError, BrokenProcessPool):
+                # Unpicklable figure; any genuine error is re-raised below
+                pass
+
+        return {name: self.export_figure(figures[name], name, formats) for name in names}
@@ -3,6 +3,7 @@
 from .statistics import StatisticsEngine, StatisticalTest, NormalityTest, PostHocTest
 from .density_calculator import DensityCalculator, DensityConfig, DensityResult
 from .representative_files import RepresentativeFileAnalyzer
+from .reshape import wide_to_long
 
 __all__ = [
     'StatisticsEngine',
@@ -13,4 +14,5 @@ __all__ = [
     'DensityConfig',
     'DensityResult',
     'RepresentativeFileAnalyzer',
+    'wide_to_long',
 ]
@@ -5,6 +5,29 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from .jit import njit
+
+
+@njit
+def density_kernel(counts: np.ndarray, areas: np.ndarray) -> np.ndarray:
+    """Compute structures per µm² for arrays of counts and areas.
+
+    Args:
+        counts: Structure counts (float64)
+        areas: Areas in µm² (float64), same length as counts
+
+    Returns:
+        Density per µm² for each entry (0 where area is not positive)
+    """
+    n = counts.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        if areas[i] > 0:
+            out[i] = counts[i] / areas[i]
+        else:
+            out[i] = 0.0
+    return out
+
 
 @dataclass
 class DensityConfig:
@@ -183,30 +206,28 @@ class DensityCalculator:
         Returns:
             DataFrame with added density columns
         """
-        results = []
+        if df.empty:
+            return pd.DataFrame()
 
-        for idx, row in df.iterrows():
-            count = row[count_column]
+        counts = df[count_column].to_numpy()
 
-            # Get area
-            if image_area_column and image_area_column in df.columns:
-                area = row[image_area_column]
+        # Get area
+        if image_area_column and image_area_column in df.columns:
+            areas = df[image_area_column].to_numpy(dtype=np.float64)
+        else:
+            # Use default image area, optionally multiplied by num_images
+            if num_images_column and num_images_column in df.columns:
+                num_images = df[num_images_column].to_numpy(dtype=np.float64)
             else:
-                # Use default image area, optionally multiplied by num_images
-                num_images = 1
-                if num_images_column and num_images_column in df.columns:
-                    num_images = row[num_images_column]
-                area = self.config.image_area * num_images
-
-            result = self.calculate_density(
-                count=count,
-                image_area_um2=area,
-                source_file=row.get(source_column) if source_column else None,
-                condition=row.get(condition_column) if condition_column else None
-            )
-            results.append(result.to_dict())
-
-        return pd.DataFrame(results)
+                num_images = np.ones(len(df), dtype=np.float64)
+            areas = self.config.image_area * num_images
+
+        return self._build_density_frame(
+            counts,
+            areas,
+            source_files=self._optional_column(df, source_column),
+            conditions=self._optional_column(df, condition_column)
+        )
 
     def calculate_density_per_image(self,
                                      df: pd.DataFrame,
@@ -235,23 +256,54 @@ class DensityCalculator:
             group_cols.append(condition_column)
 
         counts = df.groupby(group_cols).size().reset_index(name='count')
+        if counts.empty:
+            return pd.DataFrame()
 
-        results = []
-        for idx, row in counts.iterrows():
-            count = row['count']
+        # Get area (use provided or default from config)
+        area = image_area_um2 if image_area_um2 is not None else self.config.image_area
 
-            # Get area (use provided or default from config)
-            area = image_area_um2 if image_area_um2 is not None else self.config.image_area
+        return self._build_density_frame(
+            counts['count'].to_numpy(),
+            np.full(len(counts), area, dtype=np.float64),
+            source_files=counts[source_column].to_numpy(),
+            conditions=self._optional_column(counts, condition_column)
+        )
 
-            result = self.calculate_density(
-                count=count,
-                image_area_um2=area,
-                source_file=row[source_column],
-                condition=row.get(condition_column) if condition_column in row.index else None
-            )
-            results.append(result.to_dict())
+    @staticmethod
+    def _optional_column(df: pd.DataFrame, column: Optional[str]) -> np.ndarray:
+        """Get column values, or an array of None if the column is absent."""
+        if column and column in df.columns:
+            return df[column].to_numpy()
+        return np.full(len(df), None, dtype=object)
 
-        return pd.DataFrame(results)
+    @staticmethod
+    def _build_density_frame(counts: np.ndarray, areas: np.ndarray,
+                             source_files: np.ndarray,
+                             conditions: np.ndarray) -> pd.DataFrame:
+        """Build a density results DataFrame (same columns as DensityResult.to_dict()).
+
+        Args:
+            counts: Structure counts
+            areas: Areas in µm²
+            source_files: Source file names
+            conditions: Condition names
+
+        Returns:
+            DataFrame with one row per count
+        """
+        density_per_um2 = density_kernel(
+            np.ascontiguousarray(counts, dtype=np.float64),
+            np.ascontiguousarray(areas, dtype=np.float64)
+        )
+        return pd.DataFrame({
+            'count': counts,
+            'area_um2': areas,
+            'density_per_um2': density_per_um2,
+            'density_per_mm2': density_per_um2 * 1_000_000,
+            'density_per_100um2': density_per_um2 * 100,
+            'source_file': source_files,
+            'condition': conditions
+        })
 
     @staticmethod
     def pixel_area_from_size(pixel_size_um: float) -> float:
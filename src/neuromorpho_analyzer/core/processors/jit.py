@@ -0,0 +1,42 @@
+"""Optional Numba JIT support for numeric kernels.
+
+Numba is an optional dependency. When it is not installed, ``njit`` becomes a
+no-op decorator so the kernels still run as plain Python/NumPy code.
+
+Kernels are compiled without ``parallel=True``: the startup warm-up thread
+may run them while an analysis does, and Numba's threading layer must not be
+entered from several threads at once. They are also not cached on disk, since
+the cache breaks when the package is imported under two module names.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+def warm_up_kernels() -> None:
+    """Compile all JIT kernels once with tiny inputs.
+
+    Intended to be called from a background thread at application startup so
+    the first real analysis does not pay the compilation cost.
+    """
+    import numpy as np
+
+    from .density_calculator import density_kernel
+    from .statistics import group_histogram, group_sum_of_squares
+
+    density_kernel(np.ones(2, dtype=np.float64), np.ones(2, dtype=np.float64))
+    group_sum_of_squares(np.ones(2, dtype=np.float64), np.array([0, 2], dtype=np.int64))
+    group_histogram(np.ones(2, dtype=np.float64), np.array([0, 2], dtype=np.int64),
+                    np.array([0.0, 1.0, 2.0]), 1.0)
@@ -5,14 +5,8 @@ import numpy as np
 from typing import Dict, List, Optional
 from pathlib import Path
 
-try:
-    from scipy.spatial.distance import euclidean
-except ImportError:
-    # Fallback implementation
-    def euclidean(u, v):
-        return np.sqrt(np.sum((np.array(u) - np.array(v)) ** 2))
-
 from ..database.base import DatabaseBase
+from .reshape import wide_to_long
 
 
 class RepresentativeFileAnalyzer:
@@ -42,13 +36,14 @@ class RepresentativeFileAnalyzer:
         self.database = database
 
     def analyze(self, assay_ids: List[int],
-                parameters: List[str],
+                parameters: Optional[List[str]] = None,
                 normalize: bool = True) -> pd.DataFrame:
         """Find representative files for each condition.
 
         Args:
             assay_ids: List of assay IDs to analyze
             parameters: Parameters to consider for distance calculation
+                (None = all stored parameters)
             normalize: Whether to normalize values before calculating distance
 
         Returns:
@@ -68,7 +63,9 @@ class RepresentativeFileAnalyzer:
         if not all_dfs:
             return pd.DataFrame(columns=['condition', 'file', 'distance_from_average', 'rank'])
 
-        df = pd.concat(all_dfs, ignore_index=True)
+        df = wide_to_long(pd.concat(all_dfs, ignore_index=True), parameters)
+        if parameters is None:
+            parameters = df['parameter_name'].unique().tolist()
 
         # Determine source file column name
         source_col = 'source_file' if 'source_file' in df.columns else 'origin_file'
@@ -77,76 +74,22 @@ class RepresentativeFileAnalyzer:
             df['source_file'] = 'unknown'
             source_col = 'source_file'
 
-        results = []
-
-        # Process each condition
-        for condition in df['condition'].unique():
-            cond_data = df[df['condition'] == condition]
-
-            # Calculate average values for each parameter
-            averages = {}
-            stds = {}
-            for param in parameters:
-                param_data = cond_data[cond_data['parameter_name'] == param]['value']
-                if len(param_data) > 0:
-                    averages[param] = param_data.mean()
-                    stds[param] = param_data.std() if param_data.std() > 0 else 1.0
-                else:
-                    averages[param] = 0
-                    stds[param] = 1.0
-
-            # Calculate distance for each file
-            files = cond_data[source_col].unique()
-            file_distances = []
-
-            for file in files:
-                file_data = cond_data[cond_data[source_col] == file]
-
-                # Build vector of parameter values for this file
-                file_vector = []
-                avg_vector = []
-                for param in parameters:
-                    param_values = file_data[
-                        file_data['parameter_name'] == param
-                    ]['value']
-
-                    if len(param_values) > 0:
-                        val = param_values.mean()
-                    else:
-                        val = averages.get(param, 0)
-
-                    avg_val = averages.get(param, 0)
-
-                    # Normalize if requested
-                    if normalize and stds.get(param, 1.0) > 0:
-                        val = (val - avg_val) / stds[param]
-                        avg_val = 0  # After normalization, average is 0
-
-                    file_vector.append(val)
-                    avg_vector.append(avg_val)
-
-                # Calculate Euclidean distance
-                distance = euclidean(file_vector, avg_vector)
-
-                file_distances.append({
-                    'condition': condition,
-                    'file': file,
-                    'distance_from_average': distance,
-                    'n_measurements': len(file_data)
-                })
-
-            # Sort by distance (ascending = most representative first)
-            file_distances_sorted = sorted(
-                file_distances,
-                key=lambda x: x['distance_from_average']
-            )
-
-            # Add rank
-            for rank, item in enumerate(file_distances_sorted, 1):
-                item['rank'] = rank
-                results.append(item)
-
-        return pd.DataFrame(results)
+        results = self._file_distances(
+            df, parameters, 'condition', source_col, 'parameter_name', 'value', normalize
+        )
+        if results.empty:
+            return results
+
+        # Sort by distance within each condition (ascending = most representative first)
+        condition_order = pd.factorize(results['condition'])[0]
+        results = results.assign(_order=condition_order).sort_values(
+            ['_order', 'distance_from_average'], kind='stable'
+        ).drop(columns='_order').reset_index(drop=True)
+
+        # Add rank
+        results['rank'] = results.groupby('condition', sort=False).cumcount() + 1
+
+        return results
 
     def analyze_from_dataframe(self, df: pd.DataFrame,
                                 parameters: List[str],
@@ -169,53 +112,11 @@ class RepresentativeFileAnalyzer:
         Returns:
             DataFrame with ranked files per condition
         """
-        results = []
-
-        for condition in df[condition_col].unique():
-            cond_data = df[df[condition_col] == condition]
-
-            # Calculate averages and stds
-            averages = {}
-            stds = {}
-            for param in parameters:
-                param_data = cond_data[cond_data[param_col] == param][value_col]
-                if len(param_data) > 0:
-                    averages[param] = param_data.mean()
-                    stds[param] = param_data.std() if param_data.std() > 0 else 1.0
-                else:
-                    averages[param] = 0
-                    stds[param] = 1.0
-
-            # Calculate distance for each file
-            for file in cond_data[source_col].unique():
-                file_data = cond_data[cond_data[source_col] == file]
-
-                file_vector = []
-                avg_vector = []
-
-                for param in parameters:
-                    param_values = file_data[file_data[param_col] == param][value_col]
-                    val = param_values.mean() if len(param_values) > 0 else averages.get(param, 0)
-                    avg_val = averages.get(param, 0)
-
-                    if normalize and stds.get(param, 1.0) > 0:
-                        val = (val - avg_val) / stds[param]
-                        avg_val = 0
-
-                    file_vector.append(val)
-                    avg_vector.append(avg_val)
-
-                distance = euclidean(file_vector, avg_vector)
-
-                results.append({
-                    'condition': condition,
-                    'file': file,
-                    'distance_from_average': distance,
-                    'n_measurements': len(file_data)
-                })
+        df_results = self._file_distances(
+            df, parameters, condition_col, source_col, param_col, value_col, normalize
+        )
 
         # Sort and rank
-        df_results = pd.DataFrame(results)
         if df_results.empty:
             df_results['rank'] = []
             return df_results
@@ -226,6 +127,77 @@ class RepresentativeFileAnalyzer:
 
         return df_results
 
+    @staticmethod
+    def _file_distances(df: pd.DataFrame,
+                        parameters: List[str],
+                        condition_col: str,
+                        source_col: str,
+                        param_col: str,
+                        value_col: str,
+                        normalize: bool) -> pd.DataFrame:
+        """Compute each file's distance from its condition average.
+
+        Condition and file means come from single groupby passes, and the
+        distances are computed as one array operation over all files.
+
+        Args:
+            df: Long-format measurement data
+            parameters: Parameters to consider
+            condition_col: Column name for condition
+            source_col: Column name for source file
+            param_col: Column name for parameter name
+            value_col: Column name for values
+            normalize: Whether to scale deviations by the condition std
+
+        Returns:
+            DataFrame with condition, file, distance_from_average and
+            n_measurements, ordered by condition then file appearance
+        """
+        columns = ['condition', 'file', 'distance_from_average', 'n_measurements']
+        if df.empty:
+            return pd.DataFrame(columns=columns)
+
+        keys = [condition_col, source_col]
+
+        # Measurements per file, grouped by condition in order of appearance
+        counts = df.groupby(keys, sort=False, observed=True).size()
+        conditions = pd.unique(df[condition_col].dropna())
+        file_conditions = counts.index.get_level_values(0)
+        order = np.argsort(pd.Categorical(file_conditions, categories=conditions).codes, kind='stable')
+        counts = counts.iloc[order]
+        file_conditions = file_conditions[order]
+
+        values = df[df[param_col].isin(parameters)]
+
+        # Condition averages and stds per parameter (missing: 0 and 1.0)
+        cond_groups = values.groupby([condition_col, param_col], observed=True)[value_col]
+        averages = cond_groups.mean().unstack(param_col)
+        stds = cond_groups.std().unstack(param_col)
+        averages.columns = averages.columns.astype(object)
+        stds.columns = stds.columns.astype(object)
+        averages = averages.reindex(index=file_conditions, columns=parameters).fillna(0).to_numpy()
+        stds = stds.reindex(index=file_conditions, columns=parameters)
+        stds = stds.where(stds > 0, 1.0).to_numpy()
+
+        # File means per parameter; parameters a file lacks count as average
+        file_means = values.groupby(keys + [param_col], observed=True)[value_col].mean()
+        file_means = file_means.unstack(param_col)
+        file_means.columns = file_means.columns.astype(object)
+        file_means = file_means.reindex(index=counts.index, columns=parameters).to_numpy(dtype=np.float64)
+        file_means = np.where(np.isnan(file_means), averages, file_means)
+
+        deviations = file_means - averages
+        if normalize:
+            deviations = deviations / stds
+        distances = np.sqrt(np.sum(deviations ** 2, axis=1))
+
+        return pd.DataFrame({
+            'condition': np.asarray(file_conditions, dtype=object),
+            'file': np.asarray(counts.index.get_level_values(1), dtype=object),
+            'distance_from_average': distances,
+            'n_measurements': counts.to_numpy()
+        })
+
     def get_top_representative(self, results: pd.DataFrame,
                                 n: int = 1) -> pd.DataFrame:
         """Get top N most representative files per condition.
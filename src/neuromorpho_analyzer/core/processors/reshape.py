@@ -0,0 +1,74 @@
+"""Reshape measurement tables between wide and long layouts."""
+
+from typing import List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+
+# Per-row metadata columns carried over to every long-format row
+ID_COLUMNS = ('source_file', 'condition', 'assay_id')
+
+
+def wide_to_long(df: pd.DataFrame,
+                 parameters: Optional[List[str]] = None,
+                 id_columns: Sequence[str] = ID_COLUMNS) -> pd.DataFrame:
+    """Convert wide measurements (one column per parameter) to long format.
+
+    The database returns one row per measurement with one column per
+    parameter; analysis code works on 'parameter_name'/'value' pairs. The
+    long frame is built directly with NumPy (column-major ravel plus
+    repeat/tile) instead of DataFrame.melt, avoiding melt's intermediate
+    copies. 'parameter_name' and 'condition' are categorical, so filtering
+    and grouping on them compares integer codes instead of strings.
+
+    DataFrames that are already in long format are returned filtered to
+    ``parameters``.
+
+    Args:
+        df: Wide DataFrame (parameters as columns)
+        parameters: Parameters to include (None = all non-metadata columns)
+        id_columns: Metadata columns to repeat for each parameter
+
+    Returns:
+        DataFrame with 'parameter_name', 'value' and the id columns present
+    """
+    if 'parameter_name' in df.columns and 'value' in df.columns:
+        if parameters is None:
+            return df
+        return df[df['parameter_name'].isin(parameters)]
+
+    id_cols = [c for c in id_columns if c in df.columns]
+    if parameters is None:
+        parameters = [c for c in df.columns if c not in id_cols]
+    else:
+        # Repeated names would give duplicate categories
+        parameters = [p for p in dict.fromkeys(parameters) if p in df.columns]
+
+    n_rows, n_params = len(df), len(parameters)
+    if n_rows == 0 or n_params == 0:
+        return pd.DataFrame(columns=['parameter_name', 'value', *id_cols])
+
+    wide = df[parameters]
+    try:
+        values = wide.to_numpy(dtype=np.float64)
+    except (ValueError, TypeError):
+        # Non-numeric entries become NaN
+        values = wide.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+
+    data = {
+        'parameter_name': pd.Categorical.from_codes(
+            np.repeat(np.arange(n_params), n_rows), categories=parameters
+        ),
+        'value': values.ravel(order='F'),
+    }
+    for col in id_cols:
+        if col == 'condition':
+            conditions = df[col].astype('category')
+            data[col] = pd.Categorical.from_codes(
+                np.tile(conditions.cat.codes.to_numpy(), n_params),
+                dtype=conditions.dtype
+            )
+        else:
+            data[col] = np.tile(df[col].to_numpy(), n_params)
+
+    return pd.DataFrame(data)
@@ -1,11 +1,94 @@
 """Statistical analysis engine for neuromorphological data."""
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 import pandas as pd
 import numpy as np
 from scipy import stats
 from dataclasses import dataclass
 
+from .jit import njit
+
+
+def _clean(values) -> np.ndarray:
+    """Return values as a contiguous float64 array with NaNs removed."""
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    return arr[~np.isnan(arr)]
+
+
+@njit
+def group_sum_of_squares(values: np.ndarray, offsets: np.ndarray) -> Tuple[float, float]:
+    """Compute between-group and total sums of squares.
+
+    Deviations are taken about the mean of the group means.
+
+    Args:
+        values: Concatenated values of all groups (float64)
+        offsets: Group boundaries into ``values`` (int64, length n_groups + 1)
+
+    Returns:
+        Tuple of (ss_between, ss_total)
+    """
+    n_groups = offsets.shape[0] - 1
+    means = np.empty(n_groups, dtype=np.float64)
+    for g in range(n_groups):
+        start = offsets[g]
+        stop = offsets[g + 1]
+        if stop > start:
+            means[g] = values[start:stop].sum() / (stop - start)
+        else:
+            means[g] = np.nan
+    grand_mean = means.sum() / n_groups
+
+    between = np.empty(n_groups, dtype=np.float64)
+    total = np.empty(n_groups, dtype=np.float64)
+    for g in range(n_groups):
+        start = offsets[g]
+        stop = offsets[g + 1]
+        between[g] = (stop - start) * (means[g] - grand_mean) ** 2
+        acc = 0.0
+        for i in range(start, stop):
+            acc += (values[i] - grand_mean) ** 2
+        total[g] = acc
+    return between.sum(), total.sum()
+
+
+@njit
+def group_histogram(values: np.ndarray, offsets: np.ndarray,
+                    edges: np.ndarray, bin_size: float) -> np.ndarray:
+    """Histogram each group over the same uniform bins.
+
+    Matches ``np.histogram(group, bins=edges)`` per group: bins are
+    half-open except the last, and values outside the edges (or NaN) are
+    not counted.
+
+    Args:
+        values: Concatenated values of all groups (float64)
+        offsets: Group boundaries into ``values`` (int64, length n_groups + 1)
+        edges: Uniform bin edges (float64, length bin_count + 1)
+        bin_size: Width of each bin
+
+    Returns:
+        Counts with shape (n_groups, bin_count) (int64)
+    """
+    n_groups = offsets.shape[0] - 1
+    bin_count = edges.shape[0] - 1
+    low = edges[0]
+    high = edges[bin_count]
+    hist = np.zeros((n_groups, bin_count), dtype=np.int64)
+    for g in range(n_groups):
+        for i in range(offsets[g], offsets[g + 1]):
+            value = values[i]
+            if not (value >= low and value <= high):
+                continue
+            b = min(max(int(np.floor((value - low) / bin_size)), 0), bin_count - 1)
+            # Correct float rounding at bin edges
+            if value < edges[b]:
+                b -= 1
+            elif b < bin_count - 1 and value >= edges[b + 1]:
+                b += 1
+            hist[g, b] += 1
+    return hist
+
 
 @dataclass
 class StatisticalTest:
@@ -89,7 +172,7 @@ class StatisticsEngine:
             NormalityTest result
         """
         # Remove NaN values
-        data_clean = data.dropna()
+        data_clean = _clean(data)
 
         if len(data_clean) < 3:
             # Not enough data for normality test
@@ -136,15 +219,15 @@ class StatisticsEngine:
             StatisticalTest result
         """
         # Remove NaN values
-        g1_clean = group1.dropna()
-        g2_clean = group2.dropna()
+        g1_clean = _clean(group1)
+        g2_clean = _clean(group2)
 
         # Perform t-test
         statistic, p_value = stats.ttest_ind(g1_clean, g2_clean, equal_var=equal_var)
 
         # Calculate effect size (Cohen's d)
         mean_diff = g1_clean.mean() - g2_clean.mean()
-        pooled_std = np.sqrt((g1_clean.std()**2 + g2_clean.std()**2) / 2)
+        pooled_std = np.sqrt((g1_clean.std(ddof=1)**2 + g2_clean.std(ddof=1)**2) / 2)
         cohens_d = mean_diff / pooled_std if pooled_std > 0 else np.nan
 
         test_name = "Independent t-test" if equal_var else "Welch's t-test"
@@ -160,8 +243,8 @@ class StatisticsEngine:
                 'cohens_d': float(cohens_d),
                 'group1_mean': float(g1_clean.mean()),
                 'group2_mean': float(g2_clean.mean()),
-                'group1_std': float(g1_clean.std()),
-                'group2_std': float(g2_clean.std()),
+                'group1_std': float(g1_clean.std(ddof=1)),
+                'group2_std': float(g2_clean.std(ddof=1)),
                 'group1_n': len(g1_clean),
                 'group2_n': len(g2_clean)
             }
@@ -183,8 +266,8 @@ class StatisticsEngine:
             StatisticalTest result
         """
         # Remove NaN values
-        g1_clean = group1.dropna()
-        g2_clean = group2.dropna()
+        g1_clean = _clean(group1)
+        g2_clean = _clean(group2)
 
         # Perform Mann-Whitney U test
         statistic, p_value = stats.mannwhitneyu(g1_clean, g2_clean, alternative='two-sided')
@@ -196,8 +279,8 @@ class StatisticsEngine:
             significant=p_value < self.alpha,
             alpha=self.alpha,
             additional_info={
-                'group1_median': float(g1_clean.median()),
-                'group2_median': float(g2_clean.median()),
+                'group1_median': float(np.median(g1_clean)),
+                'group2_median': float(np.median(g2_clean)),
                 'group1_n': len(g1_clean),
                 'group2_n': len(g2_clean)
             }
@@ -217,15 +300,15 @@ class StatisticsEngine:
             StatisticalTest result
         """
         # Remove NaN values from each group
-        groups_clean = [g.dropna() for g in groups]
+        groups_clean = [_clean(g) for g in groups]
 
         # Perform one-way ANOVA
         statistic, p_value = stats.f_oneway(*groups_clean)
 
         # Calculate effect size (eta-squared)
-        grand_mean = np.mean([g.mean() for g in groups_clean])
-        ss_between = sum(len(g) * (g.mean() - grand_mean)**2 for g in groups_clean)
-        ss_total = sum(sum((g - grand_mean)**2) for g in groups_clean)
+        offsets = np.zeros(len(groups_clean) + 1, dtype=np.int64)
+        np.cumsum([len(g) for g in groups_clean], out=offsets[1:])
+        ss_between, ss_total = group_sum_of_squares(np.concatenate(groups_clean), offsets)
         eta_squared = ss_between / ss_total if ss_total > 0 else np.nan
 
         return StatisticalTest(
@@ -238,7 +321,7 @@ class StatisticsEngine:
                 'eta_squared': float(eta_squared),
                 'num_groups': len(groups_clean),
                 'group_means': [float(g.mean()) for g in groups_clean],
-                'group_stds': [float(g.std()) for g in groups_clean],
+                'group_stds': [float(g.std(ddof=1)) for g in groups_clean],
                 'group_ns': [len(g) for g in groups_clean]
             }
         )
@@ -316,7 +399,7 @@ class StatisticsEngine:
             StatisticalTest result
         """
         # Remove NaN values from each group
-        groups_clean = [g.dropna() for g in groups]
+        groups_clean = [_clean(g) for g in groups]
 
         # Perform Kruskal-Wallis H test
         statistic, p_value = stats.kruskal(*groups_clean)
@@ -329,14 +412,35 @@ class StatisticsEngine:
             alpha=self.alpha,
             additional_info={
                 'num_groups': len(groups_clean),
-                'group_medians': [float(g.median()) for g in groups_clean],
+                'group_medians': [float(np.median(g)) for g in groups_clean],
                 'group_ns': [len(g) for g in groups_clean]
             }
         )
 
+    @staticmethod
+    def split_groups(
+        data: pd.DataFrame,
+        value_col: str,
+        group_col: str
+    ) -> Dict[Any, np.ndarray]:
+        """
+        Split long-format data into one float64 array per group.
+
+        Args:
+            data: DataFrame with data
+            value_col: Column name with values
+            group_col: Column name with group labels
+
+        Returns:
+            Dict mapping group label to NaN-free values, in order of first
+            appearance
+        """
+        grouped = data.groupby(group_col, sort=False, observed=True)[value_col]
+        return {group: _clean(values) for group, values in grouped}
+
     def auto_compare(
         self,
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, Dict[Any, Any]],
         value_col: str,
         group_col: str,
         parametric: Optional[bool] = None
@@ -351,7 +455,8 @@ class StatisticsEngine:
         - If ANOVA is significant, perform Tukey HSD post-hoc
 
         Args:
-            data: DataFrame with data
+            data: DataFrame with data, or dict mapping group labels to
+                  value arrays (skips the DataFrame split)
             value_col: Column name with values
             group_col: Column name with group labels
             parametric: Force parametric (True) or non-parametric (False)
@@ -360,8 +465,12 @@ class StatisticsEngine:
         Returns:
             Dictionary with test results and metadata
         """
-        # Get groups
-        groups = data[group_col].unique()
+        # Get groups as NaN-free float64 arrays (one pass over the data)
+        if isinstance(data, pd.DataFrame):
+            group_values = self.split_groups(data, value_col, group_col)
+        else:
+            group_values = {group: _clean(values) for group, values in data.items()}
+        groups = list(group_values)
         num_groups = len(groups)
 
         if num_groups < 2:
@@ -379,15 +488,15 @@ class StatisticsEngine:
         }
 
         # Calculate descriptive statistics for each group
-        for group in groups:
-            group_data = data[data[group_col] == group][value_col].dropna()
+        for group, group_data in group_values.items():
+            n = len(group_data)
             result['descriptive_stats'][group] = {
-                'n': len(group_data),
-                'mean': float(group_data.mean()),
-                'std': float(group_data.std()),
-                'median': float(group_data.median()),
-                'min': float(group_data.min()),
-                'max': float(group_data.max())
+                'n': n,
+                'mean': float(group_data.mean()) if n else np.nan,
+                'std': float(group_data.std(ddof=1)) if n > 1 else np.nan,
+                'median': float(np.median(group_data)) if n else np.nan,
+                'min': float(group_data.min()) if n else np.nan,
+                'max': float(group_data.max()) if n else np.nan
             }
 
         # Test normality if parametric not specified
@@ -395,8 +504,7 @@ class StatisticsEngine:
             print(f"Testing normality for each group...")
             all_normal = True
 
-            for group in groups:
-                group_data = data[data[group_col] == group][value_col]
+            for group, group_data in group_values.items():
                 normality = self.test_normality(group_data)
                 result['normality_tests'][group] = normality
 
@@ -412,8 +520,8 @@ class StatisticsEngine:
         # Perform appropriate test based on number of groups
         if num_groups == 2:
             # Two groups: t-test or Mann-Whitney U
-            group1_data = data[data[group_col] == groups[0]][value_col]
-            group2_data = data[data[group_col] == groups[1]][value_col]
+            group1_data = group_values[groups[0]]
+            group2_data = group_values[groups[1]]
 
             if parametric:
                 result['main_test'] = self.independent_t_test(group1_data, group2_data)
@@ -424,7 +532,7 @@ class StatisticsEngine:
 
         else:
             # Three or more groups: ANOVA or Kruskal-Wallis
-            group_data_list = [data[data[group_col] == g][value_col] for g in groups]
+            group_data_list = list(group_values.values())
 
             if parametric:
                 result['main_test'] = self.one_way_anova(*group_data_list)
@@ -433,7 +541,14 @@ class StatisticsEngine:
                 # If ANOVA is significant, perform Tukey HSD
                 if result['main_test'].significant:
                     print(f"  → ANOVA significant, performing Tukey HSD post-hoc test...")
-                    result['post_hoc_tests'] = self.tukey_hsd(data, value_col, group_col)
+                    tukey_data = pd.DataFrame({
+                        value_col: np.concatenate(group_data_list),
+                        group_col: np.repeat(
+                            np.array(groups, dtype=object),
+                            [len(g) for g in group_data_list]
+                        )
+                    })
+                    result['post_hoc_tests'] = self.tukey_hsd(tukey_data, value_col, group_col)
             else:
                 result['main_test'] = self.kruskal_wallis(*group_data_list)
                 print(f"\nPerformed: Kruskal-Wallis H test")
@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Dict, Callable, Optional
+from typing import List, Dict, Callable, Optional, Set, Tuple
 
 
 class ParameterSelectorWidget(ttk.Frame):
@@ -20,6 +20,9 @@ class ParameterSelectorWidget(ttk.Frame):
         # ['Length', 'Volume'] if those are selected
     """
 
+    # Height of one checkbox row in pixels
+    ROW_HEIGHT = 22
+
     def __init__(self, parent, parameters: List[str],
                  callback: Optional[Callable] = None,
                  show_checkboxes: bool = True):
@@ -35,7 +38,8 @@ class ParameterSelectorWidget(ttk.Frame):
         self.parameters = parameters
         self.callback = callback
         self.show_checkboxes = show_checkboxes
-        self.param_vars: Dict[str, tk.BooleanVar] = {}
+        # Selection state in plain Python; only visible rows have Tk variables
+        self.param_selection: Dict[str, bool] = {}
 
         self._create_widgets()
 
@@ -65,36 +69,121 @@ class ParameterSelectorWidget(ttk.Frame):
             self._create_listbox()
 
     def _create_checkboxes(self):
-        """Create checkbox for each parameter."""
-        # Scrollable frame for checkboxes
-        canvas = tk.Canvas(self, height=200)
-        scrollbar = ttk.Scrollbar(self, orient='vertical', command=canvas.yview)
-        self.checkbox_frame = ttk.Frame(canvas)
-
-        self.checkbox_frame.bind(
-            '<Configure>',
-            lambda e: canvas.configure(scrollregion=canvas.bbox('all'))
-        )
+        """Create a virtualized checkbox list.
 
-        canvas.create_window((0, 0), window=self.checkbox_frame, anchor='nw')
-        canvas.configure(yscrollcommand=scrollbar.set)
+        Only rows visible in the canvas get a Checkbutton. The pool of
+        Checkbuttons is reused while scrolling, so the widget count stays
+        constant no matter how many parameters there are.
+        """
+        self.canvas = tk.Canvas(
+            self, height=200, highlightthickness=0,
+            yscrollincrement=self.ROW_HEIGHT
+        )
+        scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scroll)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
 
-        canvas.grid(row=2, column=0, sticky='nsew')
+        self.canvas.grid(row=2, column=0, sticky='nsew')
         scrollbar.grid(row=2, column=1, sticky='ns')
 
         self.rowconfigure(2, weight=1)
         self.columnconfigure(0, weight=1)
 
-        # Create checkboxes
-        for idx, param in enumerate(self.parameters):
-            var = tk.BooleanVar(value=True)  # All selected by default
-            self.param_vars[param] = var
+        # Pool of (canvas window item, checkbutton, variable) reused for visible
+        # rows, plus what each pooled row currently shows: (row, parameter)
+        # and the checked state last pushed to its variable
+        self._row_pool: List[Tuple[int, ttk.Checkbutton, tk.BooleanVar]] = []
+        self._row_shown: List[Optional[Tuple[int, str]]] = []
+        self._row_checked: List[bool] = []
+
+        self.canvas.bind('<Configure>', lambda e: self._render_visible_rows())
+        self._bind_mousewheel(self.canvas)
+
+        self._reset_selection(set(self.parameters))  # All selected by default
+
+    def _reset_selection(self, selected: Set[str]):
+        """Set selection state for the current parameters and redraw.
+
+        Args:
+            selected: Parameter names to select initially
+        """
+        self.param_selection = {param: param in selected for param in self.parameters}
+        self.canvas.configure(
+            scrollregion=(0, 0, 0, len(self.parameters) * self.ROW_HEIGHT)
+        )
+        self.canvas.yview_moveto(0)
+        self._render_visible_rows()
+
+    def _render_visible_rows(self):
+        """Bind pooled checkbuttons to the rows currently in view.
+
+        Row ``r`` always uses pool slot ``r % pool size``, so scrolling by a
+        few rows only rebinds the slots that scrolled into view; slots that
+        still show the same row skip their Tk configure/coords calls.
+        """
+        height = max(self.canvas.winfo_height(), int(self.canvas.cget('height')))
+        first = int(self.canvas.canvasy(0)) // self.ROW_HEIGHT
+        count = max(0, min(height // self.ROW_HEIGHT + 2, len(self.parameters) - first))
+
+        while len(self._row_pool) < count:
+            slot = len(self._row_pool)
+            var = tk.BooleanVar(value=False)
+            checkbutton = ttk.Checkbutton(
+                self.canvas, variable=var,
+                command=lambda slot=slot: self._on_row_toggle(slot)
+            )
+            self._bind_mousewheel(checkbutton)
+            item = self.canvas.create_window(0, 0, window=checkbutton, anchor='nw')
+            self._row_pool.append((item, checkbutton, var))
+            self._row_shown.append(None)
+            self._row_checked.append(False)
+
+        pool_size = len(self._row_pool)
+        slot_rows = {row % pool_size: row for row in range(first, first + count)}
+
+        for slot, (item, checkbutton, var) in enumerate(self._row_pool):
+            row = slot_rows.get(slot)
+            if row is None:
+                if self._row_shown[slot] is not None:
+                    # Park unused rows above the scroll region (never visible)
+                    self._row_shown[slot] = None
+                    self.canvas.coords(item, 0, -2 * self.ROW_HEIGHT)
+                continue
+
+            param = self.parameters[row]
+            if self._row_shown[slot] != (row, param):
+                self._row_shown[slot] = (row, param)
+                checkbutton.configure(text=param)
+                self.canvas.coords(item, 0, row * self.ROW_HEIGHT)
+
+            checked = self.param_selection[param]
+            if self._row_checked[slot] != checked:
+                self._row_checked[slot] = checked
+                var.set(checked)
+
+    def _on_row_toggle(self, slot: int):
+        """Store a pooled checkbutton's new state for the parameter it shows."""
+        shown = self._row_shown[slot]
+        if shown is not None:
+            checked = self._row_pool[slot][2].get()
+            self._row_checked[slot] = checked
+            self.param_selection[shown[1]] = checked
+        self._on_change()
+
+    def _bind_mousewheel(self, widget):
+        """Scroll the checkbox list with the mouse wheel over widget."""
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            widget.bind(sequence, self._on_mousewheel)
+
+    def _on_scroll(self, *args):
+        """Scrollbar command: scroll canvas and redraw visible rows."""
+        self.canvas.yview(*args)
+        self._render_visible_rows()
 
-            ttk.Checkbutton(
-                self.checkbox_frame, text=param,
-                variable=var,
-                command=self._on_change
-            ).grid(row=idx, column=0, sticky='w', pady=1)
+    def _on_mousewheel(self, event):
+        """Scroll one row per wheel step."""
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self.canvas.yview_scroll(step, 'units')
+        self._render_visible_rows()
 
     def _create_listbox(self):
         """Create listbox for parameter selection."""
@@ -113,9 +202,9 @@ class ParameterSelectorWidget(ttk.Frame):
         self.listbox.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.listbox.yview)
 
-        for param in self.parameters:
-            self.listbox.insert('end', param)
-            self.listbox.selection_set('end')  # Select all by default
+        # One Tcl call for all items instead of one per parameter
+        self.listbox.insert('end', *self.parameters)
+        self.listbox.selection_set(0, 'end')  # Select all by default
 
         self.listbox.bind('<<ListboxSelect>>', lambda e: self._on_change())
 
@@ -125,8 +214,8 @@ class ParameterSelectorWidget(ttk.Frame):
     def _select_all(self):
         """Select all parameters."""
         if self.show_checkboxes:
-            for var in self.param_vars.values():
-                var.set(True)
+            self.param_selection = dict.fromkeys(self.parameters, True)
+            self._render_visible_rows()
         else:
             self.listbox.selection_set(0, 'end')
         self._on_change()
@@ -134,8 +223,8 @@ class ParameterSelectorWidget(ttk.Frame):
     def _deselect_all(self):
         """Deselect all parameters."""
         if self.show_checkboxes:
-            for var in self.param_vars.values():
-                var.set(False)
+            self.param_selection = dict.fromkeys(self.parameters, False)
+            self._render_visible_rows()
         else:
             self.listbox.selection_clear(0, 'end')
         self._on_change()
@@ -152,7 +241,7 @@ class ParameterSelectorWidget(ttk.Frame):
             List of parameter names that are selected
         """
         if self.show_checkboxes:
-            return [param for param, var in self.param_vars.items() if var.get()]
+            return [param for param, selected in self.param_selection.items() if selected]
         else:
             indices = self.listbox.curselection()
             return [self.parameters[i] for i in indices]
@@ -184,8 +273,9 @@ class ParameterSelectorWidget(ttk.Frame):
             parameters: List of parameter names to select (others will be deselected)
         """
         if self.show_checkboxes:
-            for param, var in self.param_vars.items():
-                var.set(param in parameters)
+            selected = set(parameters)
+            self.param_selection = {param: param in selected for param in self.parameters}
+            self._render_visible_rows()
         else:
             self.listbox.selection_clear(0, 'end')
             for i, param in enumerate(self.parameters):
@@ -208,27 +298,12 @@ class ParameterSelectorWidget(ttk.Frame):
         self.parameters = new_parameters
 
         if self.show_checkboxes:
-            # Clear existing checkboxes
-            for widget in self.checkbox_frame.winfo_children():
-                widget.destroy()
-
-            self.param_vars = {}
-
-            # Create new checkboxes
-            for idx, param in enumerate(self.parameters):
-                selected = param in old_selection if preserve_selection else True
-                var = tk.BooleanVar(value=selected)
-                self.param_vars[param] = var
-
-                ttk.Checkbutton(
-                    self.checkbox_frame, text=param,
-                    variable=var,
-                    command=self._on_change
-                ).grid(row=idx, column=0, sticky='w', pady=1)
+            self._reset_selection(
+                old_selection if preserve_selection else set(self.parameters)
+            )
         else:
             self.listbox.delete(0, 'end')
-            for param in self.parameters:
-                self.listbox.insert('end', param)
+            self.listbox.insert('end', *self.parameters)
 
             if preserve_selection:
                 for i, param in enumerate(self.parameters):
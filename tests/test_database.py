@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Test script to verify database functionality."""
 
+import sqlite3
 import sys
+import tempfile
 from pathlib import Path
 import pandas as pd
 
@@ -9,6 +11,8 @@ import pandas as pd
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from neuromorpho_analyzer.core.database import SQLiteDatabase
+from neuromorpho_analyzer.core.database.base import DatabaseBase
+from neuromorpho_analyzer.core.database.sqlite import READ_CHUNK_SIZE
 from neuromorpho_analyzer.core.models import Assay, Measurement
 from neuromorpho_analyzer.core.importers import UnifiedImporter
 
@@ -335,6 +339,404 @@ def test_data_models():
         return False
 
 
+def test_performance_pragmas():
+    """Test connection tuning for long-lived sessions."""
+    print("\n" + "=" * 70)
+    print("Test 7: Performance Pragmas")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Tuning is applied on connect
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            journal_mode = db.connection.execute('PRAGMA journal_mode').fetchone()[0]
+            synchronous = db.connection.execute('PRAGMA synchronous').fetchone()[0]
+            print(f"\n  journal_mode={journal_mode}, synchronous={synchronous}")
+
+            assert journal_mode == 'wal'
+            assert synchronous == 1  # NORMAL
+
+            # Connection stays usable after tuning
+            assay_id = db.insert_assay("Pragma Test")
+            assert db.get_assay(assay_id)['name'] == "Pragma Test"
+
+        # Callers can override individual settings
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db', pragmas={'synchronous': 'FULL'}) as db:
+            assert db.connection.execute('PRAGMA synchronous').fetchone()[0] == 2  # FULL
+            assert db.connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    print("\n  ✓ Performance pragmas applied!")
+    return True
+
+
+def test_transaction():
+    """Test grouping inserts into a single transaction."""
+    print("\n" + "=" * 70)
+    print("Test 8: Transactions")
+    print("=" * 70)
+
+    data = pd.DataFrame({'Length': [100, 110], 'Volume': [400, 450]})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assay_id = db.insert_assay("Transaction Test")
+            # Single writes commit on their own
+            assert not db.connection.in_transaction
+
+            with db.transaction():
+                db.insert_measurements(assay_id, data, source_file='a.csv', condition='Control')
+                db.insert_measurements(assay_id, data, source_file='b.csv', condition='Control')
+                # Nothing committed until the block exits
+                assert db.connection.in_transaction
+
+            assert not db.connection.in_transaction
+            assert db.get_measurement_count(assay_id) == 4
+            print(f"\n  Committed {db.get_measurement_count(assay_id)} measurements")
+
+            try:
+                with db.transaction():
+                    db.insert_measurements(assay_id, data, source_file='c.csv', condition='Control')
+                    raise RuntimeError("abort")
+            except RuntimeError:
+                pass
+
+            assert db.get_measurement_count(assay_id) == 4
+            print("  Rolled back failed transaction")
+
+    print("\n  ✓ Transactions working!")
+    return True
+
+
+def test_condition_counts():
+    """Test per-condition measurement counts computed in SQL."""
+    print("\n" + "=" * 70)
+    print("Test 9: Condition Counts")
+    print("=" * 70)
+
+    data = pd.DataFrame({'Length': [100, 110, 120], 'Volume': [400, 450, 500]})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assay_id = db.insert_assay("Count Test")
+            db.insert_measurements(assay_id, data, source_file='a.csv', condition='Control')
+            db.insert_measurements(assay_id, data.head(2), source_file='b.csv', condition='Treatment')
+
+            counts = db.get_condition_counts(assay_id)
+            print(f"\n  Counts: {counts}")
+            assert counts == {'Control': 3, 'Treatment': 2}
+            assert db.get_condition_counts(assay_id + 1) == {}
+
+    print("\n  ✓ Condition counts working!")
+    return True
+
+
+def test_multi_condition_filter():
+    """Test filtering measurements to several conditions in SQL."""
+    print("\n" + "=" * 70)
+    print("Test 10: Multi-Condition Filter")
+    print("=" * 70)
+
+    data = pd.DataFrame({'Length': [100, 110], 'Volume': [400, 450]})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assay_id = db.insert_assay("Filter Test")
+            for condition in ['Control', 'GST', 'Treatment']:
+                db.insert_measurements(assay_id, data, source_file=f'{condition}.csv', condition=condition)
+
+            df = db.get_measurements(assay_id, conditions=['Control', 'Treatment'])
+            print(f"\n  Selected conditions: {sorted(df['condition'].unique())}")
+            assert sorted(df['condition'].unique()) == ['Control', 'Treatment']
+            assert len(df) == 4
+            assert db.get_measurements(assay_id, conditions=[]).empty
+
+    print("\n  ✓ Multi-condition filter working!")
+    return True
+
+
+def test_parameter_projection():
+    """Test selected parameters are extracted in SQL."""
+    print("\n" + "=" * 70)
+    print("Test 11: Parameter Projection")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assay_id = db.insert_assay("Projection Test")
+            db.insert_measurements(assay_id, pd.DataFrame({'Length': [100.5, 110.0], 'Volume': [400, 450]}),
+                                   source_file='a.csv', condition='Control')
+            # Second file has a different parameter set
+            db.insert_measurements(assay_id, pd.DataFrame({'Length': [120.0], 'Area': [30.0]}),
+                                   source_file='b.csv', condition='GST')
+
+            df = db.get_measurements(assay_id, parameters=['Length', 'Volume', 'Missing'])
+            print(f"\n  Columns: {list(df.columns)}")
+            assert list(df.columns) == ['Length', 'Volume', 'source_file', 'condition']
+            assert df['Length'].tolist() == [100.5, 110.0, 120.0]
+            assert df['Volume'].isna().tolist() == [False, False, True]
+
+            # Same values as the full read
+            full = db.get_measurements(assay_id)
+            pd.testing.assert_series_equal(df['Length'], full['Length'])
+
+            assert db.get_measurements(assay_id, parameters=['Missing']).columns.tolist() == \
+                ['source_file', 'condition']
+
+            # A stored parameter with only empty values is kept as NaN
+            empty_id = db.insert_assay("Empty Parameter")
+            db.insert_measurements(empty_id, pd.DataFrame({'A': [1.0, 2.0], 'B': [float('nan')] * 2}),
+                                   source_file='c.csv', condition='Control')
+            projected = db.get_measurements(empty_id, parameters=['A', 'B'])
+            assert list(projected.columns) == ['A', 'B', 'source_file', 'condition']
+            assert projected['B'].isna().all()
+            assert 'B' in db.get_measurements(empty_id).columns
+
+            # Booleans keep their dtype when projected
+            flag_id = db.insert_assay("Boolean Parameter")
+            db.insert_measurements(flag_id, pd.DataFrame({'F': [True, False], 'N': [1.5, 2.5]}),
+                                   source_file='d.csv', condition='Control')
+            pd.testing.assert_frame_equal(db.get_measurements(flag_id, parameters=['F', 'N']),
+                                          db.get_measurements(flag_id))
+
+    print("\n  ✓ Parameter projection working!")
+    return True
+
+
+def test_lookup_cache():
+    """Test cached assay/parameter lookups stay in sync with writes."""
+    print("\n" + "=" * 70)
+    print("Test 12: Lookup Cache")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assert db.get_assay_by_name("Cache Test") is None
+            assay_id = db.insert_assay("Cache Test")
+            assert db.get_assay_by_name("Cache Test")['id'] == assay_id
+
+            # Repeated lookups are served from the cache
+            db.get_assay(assay_id)
+            db.get_assay(assay_id)
+            print(f"\n  get_assay cache: {db._get_assay_cached.cache_info()}")
+            assert db._get_assay_cached.cache_info().hits >= 1
+
+            # Returned dicts are copies
+            db.get_assay(assay_id)['name'] = 'changed'
+            assert db.get_assay(assay_id)['name'] == "Cache Test"
+
+            assert db.get_parameters(assay_id) == []
+            db.insert_measurements(assay_id, pd.DataFrame({'Length': [1.0]}), source_file='a.csv')
+            assert db.get_parameters(assay_id) == ['Length']
+
+            db.delete_assay(assay_id)
+            assert db.get_measurement_count(assay_id) == 0  # Cascaded
+            assert db.get_assay(assay_id) is None
+            assert db.get_assay_by_name("Cache Test") is None
+            assert db.get_parameters(assay_id) == []
+
+            # Rolled-back writes do not linger in the cache
+            try:
+                with db.transaction():
+                    db.insert_assay("Rolled Back")
+                    assert db.get_assay_by_name("Rolled Back") is not None
+                    raise RuntimeError("abort")
+            except RuntimeError:
+                pass
+            assert db.get_assay_by_name("Rolled Back") is None
+
+    print("\n  ✓ Lookup cache working!")
+    return True
+
+
+def test_chunked_reads():
+    """Test streaming measurements in chunks."""
+    print("\n" + "=" * 70)
+    print("Test 13: Chunked Reads")
+    print("=" * 70)
+
+    data = pd.DataFrame({'Length': range(25), 'Volume': range(100, 125)})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assay_id = db.insert_assay("Chunk Test")
+            db.insert_measurements(assay_id, data, source_file='a.csv', condition='Control')
+
+            for parameters in (None, ['Volume']):
+                chunks = list(db.iter_measurements(assay_id, parameters=parameters, chunk_size=10))
+                print(f"\n  parameters={parameters}: chunk sizes {[len(c) for c in chunks]}")
+                assert [len(c) for c in chunks] == [10, 10, 5]
+
+                combined = pd.concat(chunks, ignore_index=True)
+                expected = db.get_measurements(assay_id, parameters=parameters)
+                pd.testing.assert_frame_equal(combined, expected, check_dtype=False)
+
+            assert list(db.iter_measurements(assay_id, conditions=[])) == []
+
+    print("\n  ✓ Chunked reads working!")
+    return True
+
+
+def test_parameter_table():
+    """Test parameter names are served from the assay_parameters table."""
+    print("\n" + "=" * 70)
+    print("Test 14: Parameter Table")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'test.db'
+        with SQLiteDatabase(db_path) as db:
+            assay_id = db.insert_assay("Parameter Test")
+            db.insert_measurements(assay_id, pd.DataFrame({'Length': [1.0], 'Volume': [2.0]}),
+                                   source_file='a.csv')
+            db.insert_measurements(assay_id, pd.DataFrame({'Area': [3.0], 'Length': [4.0]}),
+                                   source_file='b.csv')
+
+            # Every file's parameters, in first-seen order
+            print(f"\n  Parameters: {db.get_parameters(assay_id)}")
+            assert db.get_parameters(assay_id) == ['Length', 'Volume', 'Area']
+
+            # Simulate a database written before the table existed
+            db.connection.execute('DELETE FROM assay_parameters')
+            db.connection.execute('PRAGMA user_version = 0')
+
+        with SQLiteDatabase(db_path) as db:
+            assert db.get_parameters(assay_id) == ['Length', 'Volume', 'Area']
+            print("  Rebuilt from stored measurements on connect")
+
+    print("\n  ✓ Parameter table working!")
+    return True
+
+
+def test_bulk_assay_insert():
+    """Test inserting several assays in one call."""
+    print("\n" + "=" * 70)
+    print("Test 15: Bulk Assay Insert")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            existing_id = db.insert_assay("Existing")
+            assays = [(f"Assay {i}", None if i % 2 else f"Description {i}") for i in range(1200)]
+
+            ids = db.insert_assays(assays)
+            print(f"\n  Inserted {len(ids)} assays")
+            assert len(set(ids)) == len(assays) and existing_id not in ids
+            assert db.get_assay(ids[3])['name'] == "Assay 3"
+            assert db.get_assay(ids[4])['description'] == "Description 4"
+            assert db.get_assay_by_name("Assay 1199")['id'] == ids[-1]
+
+            # A duplicate name rolls back the whole batch
+            try:
+                db.insert_assays([("New", None), ("Existing", None)])
+                assert False, "Expected IntegrityError"
+            except sqlite3.IntegrityError:
+                pass
+            assert db.get_assay_by_name("New") is None
+
+    print("\n  ✓ Bulk assay insert working!")
+    return True
+
+
+def test_read_only_connection():
+    """Test queries run on a separate read-only connection."""
+    print("\n" + "=" * 70)
+    print("Test 16: Read-Only Connection")
+    print("=" * 70)
+
+    data = pd.DataFrame({'Length': [100, 110]})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assert db._reader is not db.connection
+            try:
+                db._reader.execute('DELETE FROM assays')
+                assert False, "Expected read-only error"
+            except sqlite3.OperationalError:
+                pass
+
+            # Committed writes are visible to the reader
+            assay_id = db.insert_assay("Reader Test")
+            db.insert_measurements(assay_id, data, source_file='a.csv', condition='Control')
+            assert len(db.get_measurements(assay_id)) == 2
+
+            # Inside a transaction, reads see the uncommitted writes
+            with db.transaction():
+                db.insert_measurements(assay_id, data, source_file='b.csv', condition='Control')
+                assert db._reader is db.connection
+                assert db.get_measurement_count(assay_id) == 4
+
+        assert db._reader is None
+
+    print("\n  ✓ Read-only connection working!")
+    return True
+
+
+def test_bulk_measurement_read():
+    """Test reading several assays with one query."""
+    print("\n" + "=" * 70)
+    print("Test 17: Bulk Measurement Read")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            first = db.insert_assay("Bulk A")
+            second = db.insert_assay("Bulk B")
+            db.insert_measurements(first, pd.DataFrame({'Length': [1.0, 2.0], 'Volume': [10, 20]}),
+                                   source_file='a.csv', condition='Control')
+            db.insert_measurements(second, pd.DataFrame({'Length': [3.0], 'Area': [5.0]}),
+                                   source_file='b.csv', condition='GST')
+
+            for parameters in (None, ['Length', 'Volume', 'Missing']):
+                bulk = db.get_measurements_bulk([second, first, second], parameters=parameters)
+                print(f"\n  parameters={parameters}: columns {list(bulk.columns)}")
+                assert bulk['assay_id'].tolist() == [first, first, second]
+
+                # Same rows as reading the assays one at a time
+                expected = DatabaseBase.get_measurements_bulk(db, [first, second], parameters)
+                pd.testing.assert_frame_equal(bulk, expected, check_like=True)
+
+            assert db.get_measurements_bulk([]).empty
+            assert db.get_measurements_bulk([second + 1]).empty
+
+    print("\n  ✓ Bulk measurement read working!")
+    return True
+
+
+def test_chunked_read_dtypes():
+    """Test a parameter empty in the first chunk keeps a numeric dtype."""
+    print("\n" + "=" * 70)
+    print("Test 18: Chunked Read Dtypes")
+    print("=" * 70)
+
+    n_empty = READ_CHUNK_SIZE + 5
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SQLiteDatabase(Path(tmp_dir) / 'test.db') as db:
+            assay_id = db.insert_assay("Dtype Test")
+            db.insert_measurements(assay_id, pd.DataFrame({'Length': [1.0] * n_empty,
+                                                           'Volume': [float('nan')] * n_empty}),
+                                   source_file='f1.csv', condition='Control')
+            db.insert_measurements(assay_id, pd.DataFrame({'Length': [2.0] * 5, 'Volume': [1.0] * 5}),
+                                   source_file='f2.csv', condition='Control')
+
+            df = db.get_measurements(assay_id)
+            print(f"\n  Full read dtypes: {df.dtypes.to_dict()}")
+            assert df['Volume'].dtype == 'float64'
+            assert df['Volume'].notna().sum() == 5
+
+            projected = db.get_measurements(assay_id, parameters=['Length', 'Volume'])
+            print(f"  Projected read dtypes: {projected.dtypes.to_dict()}")
+            assert projected['Volume'].dtype == 'float64'
+
+            # Streamed chunks share the same dtypes
+            for parameters in (None, ['Length', 'Volume']):
+                chunks = list(db.iter_measurements(assay_id, parameters=parameters))
+                assert len(chunks) == 2
+                assert all(chunk['Volume'].dtype == 'float64' for chunk in chunks)
+
+    print("\n  ✓ Chunked read dtypes working!")
+    return True
+
+
 def run_all_tests():
     """Run all tests and display summary."""
     tests = [
@@ -344,6 +746,18 @@ def run_all_tests():
         ("Duplicate Detection", test_duplicate_detection),
         ("Integration with Importer", test_integration_with_importer),
         ("Data Models", test_data_models),
+        ("Performance Pragmas", test_performance_pragmas),
+        ("Transactions", test_transaction),
+        ("Condition Counts", test_condition_counts),
+        ("Multi-Condition Filter", test_multi_condition_filter),
+        ("Parameter Projection", test_parameter_projection),
+        ("Lookup Cache", test_lookup_cache),
+        ("Chunked Reads", test_chunked_reads),
+        ("Parameter Table", test_parameter_table),
+        ("Bulk Assay Insert", test_bulk_assay_insert),
+        ("Read-Only Connection", test_read_only_connection),
+        ("Bulk Measurement Read", test_bulk_measurement_read),
+        ("Chunked Read Dtypes", test_chunked_read_dtypes),
     ]
 
     results = []
@@ -11,6 +11,7 @@ from src.neuromorpho_analyzer.core.processors import (
     DensityCalculator, DensityConfig, DensityResult,
     RepresentativeFileAnalyzer
 )
+from src.neuromorpho_analyzer.core.processors.density_calculator import density_kernel
 
 
 class TestDensityConfig(unittest.TestCase):
@@ -108,6 +109,34 @@ class TestDensityCalculator(unittest.TestCase):
         self.assertEqual(result.area, 50.0)
         self.assertEqual(result.density, 0.5)
 
+    def test_densities_from_dataframe(self):
+        """Test vectorized density calculation matches per-row calculation."""
+        calc = DensityCalculator(DensityConfig(image_area_um2=10.0))
+        df = pd.DataFrame({
+            'count': [5, 20, 0],
+            'num_images': [1, 2, 4],
+            'source_file': ['a.csv', 'b.csv', 'c.csv'],
+            'condition': ['Control', 'Control', 'Treatment']
+        })
+
+        result = calc.calculate_densities_from_dataframe(df, num_images_column='num_images')
+
+        for i, row in df.iterrows():
+            expected = calc.calculate_density(
+                count=row['count'],
+                image_area_um2=10.0 * row['num_images'],
+                source_file=row['source_file'],
+                condition=row['condition']
+            ).to_dict()
+            for key, value in expected.items():
+                self.assertEqual(result.iloc[i][key], value)
+
+    def test_density_kernel_zero_area(self):
+        """Test density kernel returns 0 for non-positive or NaN areas."""
+        counts = np.array([10.0, 10.0, 10.0])
+        areas = np.array([5.0, 0.0, np.nan])
+        np.testing.assert_allclose(density_kernel(counts, areas), [2.0, 0.0, 0.0])
+
 
 class TestRepresentativeFileAnalyzer(unittest.TestCase):
     """Test RepresentativeFileAnalyzer class."""
@@ -4,8 +4,9 @@ import unittest
 import tempfile
 from pathlib import Path
 import pandas as pd
+import numpy as np
 import os
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 import xml.etree.ElementTree as ET
 
 from src.neuromorpho_analyzer.core.exporters import (
@@ -13,8 +14,11 @@ from src.neuromorpho_analyzer.core.exporters import (
     ExportParameterSelector,
     StatisticsTableExporter,
     ExcelExporter,
-    GraphPadExporter
+    GraphPadExporter,
+    ParquetExporter
 )
+from src.neuromorpho_analyzer.core.exporters.excel_exporter import _add_named_styles
+from src.neuromorpho_analyzer.core.exporters.parquet_exporter import PYARROW_AVAILABLE
 from src.neuromorpho_analyzer.core.processors.statistics import StatisticsEngine
 from src.neuromorpho_analyzer.core.database.base import DatabaseBase
 
@@ -245,6 +249,28 @@ class TestStatisticsTableExporter(unittest.TestCase):
         self.assertIn('Condition', summary.columns)
         self.assertIn('Mean', summary.columns)
 
+    def test_statistics_run_once(self):
+        """Test the tests run once for both ANOVA and pairwise tables."""
+        calls = []
+        auto_compare = self.stats_engine.auto_compare
+
+        def counting_auto_compare(*args, **kwargs):
+            calls.append(args)
+            return auto_compare(*args, **kwargs)
+
+        self.stats_engine.auto_compare = counting_auto_compare
+        self.exporter.create_statistics_tables(self.test_data, 'Test Parameter')
+        self.assertEqual(len(calls), 1)
+
+    def test_array_input(self):
+        """Test NumPy arrays give the same tables as Series."""
+        arrays = {cond: series.to_numpy() for cond, series in self.test_data.items()}
+        from_series = self.exporter.create_statistics_tables(self.test_data, 'Test Parameter')
+        from_arrays = self.exporter.create_statistics_tables(arrays, 'Test Parameter')
+
+        for name, table in from_series.items():
+            pd.testing.assert_frame_equal(from_arrays[name], table)
+
     def test_export_to_excel(self):
         """Test exporting to Excel."""
         tables = self.exporter.create_statistics_tables(
@@ -263,6 +289,18 @@ class TestStatisticsTableExporter(unittest.TestCase):
             self.assertIn('Anova', wb.sheetnames)
             self.assertIn('Pairwise', wb.sheetnames)
 
+    def test_export_column_widths(self):
+        """Test column widths fit the longest header or value."""
+        tables = {'summary': pd.DataFrame({'N': [12345], 'Note': ['x' * 80]})}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / 'test_stats.xlsx'
+            self.exporter.export_to_excel(tables, output_path)
+
+            ws = load_workbook(output_path)['Summary']
+            self.assertEqual(ws.column_dimensions['A'].width, 7)
+            self.assertEqual(ws.column_dimensions['B'].width, 50)
+
 
 class TestExcelExporter(unittest.TestCase):
     """Test ExcelExporter class."""
@@ -325,6 +363,59 @@ class TestExcelExporter(unittest.TestCase):
             self.assertIn('Mean', headers)
             self.assertIn('SEM', headers)
 
+    def test_frequency_sheet_skips_empty_bins(self):
+        """Test frequency sheet only writes bins that hold values by default."""
+        values = {'Control': np.array([15.0, 25.0, 26.0]), 'Treatment': np.array([15.0])}
+
+        for include_empty_bins, expected_rows in [(False, 3), (True, 251)]:
+            wb = Workbook(write_only=True)
+            _add_named_styles(wb)
+            self.exporter._create_frequency_sheet(
+                wb, values, 'Data', ['Control', 'Treatment'],
+                include_empty_bins=include_empty_bins
+            )
+            with tempfile.TemporaryDirectory() as tmpdir:
+                output_path = Path(tmpdir) / 'frequency.xlsx'
+                wb.save(output_path)
+                ws = load_workbook(output_path)['Data_Frequency']
+                rows = list(ws.iter_rows(values_only=True))
+
+            self.assertEqual(len(rows), expected_rows)
+            self.assertEqual(rows[1][:5], (15, 1, 33.33, 1, 100.0))
+
+    def test_relative_change_sheet(self):
+        """Test relative change is written against control, skipped without one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / 'relative.xlsx'
+            wb = Workbook(write_only=True)
+            _add_named_styles(wb)
+            self.exporter._create_relative_change_sheet(
+                wb, {'Control': np.array([10.0, 30.0]), 'Treatment': np.array([30.0])},
+                'Data', ['Control', 'Treatment']
+            )
+            self.exporter._create_relative_change_sheet(
+                wb, {'A': np.array([1.0]), 'B': np.array([2.0])}, 'Other', ['A', 'B']
+            )
+            wb.save(output_path)
+
+            loaded = load_workbook(output_path)
+            self.assertEqual(loaded.sheetnames, ['Data_RelativeChange'])
+            rows = list(loaded['Data_RelativeChange'].iter_rows(values_only=True))
+
+        self.assertEqual(rows[1], ('Average:', 0.0, 50.0))
+        self.assertEqual(rows[4], ('Values:', -50.0, 50.0))
+        self.assertEqual(rows[5], (None, 50.0, None))
+
+    def test_filter_by_marker(self):
+        """Test marker filtering matches the letter before the extension."""
+        df = pd.DataFrame({
+            'source_file': ['cellL.csv', 'cellT.csv', 'L.dir/cell.csv', 'cellL.', None],
+            'value': [1.0, 2.0, 3.0, 4.0, 5.0]
+        })
+
+        filtered = self.exporter._filter_by_marker(df, 'L')
+        self.assertEqual(filtered['value'].tolist(), [1.0])
+
 
 class TestGraphPadExporter(unittest.TestCase):
     """Test GraphPadExporter class."""
@@ -388,6 +479,46 @@ class TestGraphPadExporter(unittest.TestCase):
                 self.assertGreater(len(columns), 0)
 
 
+class TestParquetExporter(unittest.TestCase):
+    """Test ParquetExporter class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.db = MockDatabase()
+        self.selector = ExportParameterSelector(self.db)
+        self.selector.select_all([1, 2])
+        self.exporter = ParquetExporter(self.selector)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_export(self):
+        """Test exported file round-trips the measurements."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = self.exporter.export([1, 2], Path(tmpdir), self.db)
+
+            self.assertTrue(output_path.name.endswith('.parquet'))
+            loaded = pd.read_parquet(output_path)
+            self.assertEqual(len(loaded), len(self.db.measurements_df))
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_partition_by_condition(self):
+        """Test condition-partitioned dataset export."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = self.exporter.export(
+                [1, 2], Path(tmpdir), self.db, partition_by_condition=True
+            )
+
+            self.assertTrue(output_path.is_dir())
+            self.assertTrue((output_path / 'condition=Control').is_dir())
+            self.assertTrue((output_path / 'condition=Treatment').is_dir())
+
+    @unittest.skipIf(PYARROW_AVAILABLE, "pyarrow installed")
+    def test_missing_pyarrow(self):
+        """Test a clear error is raised without pyarrow."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ImportError):
+                self.exporter.export([1, 2], Path(tmpdir), self.db)
+
+
 def run_tests():
     """Run all export tests."""
     # Create test suite
@@ -400,6 +531,7 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestStatisticsTableExporter))
     suite.addTests(loader.loadTestsFromTestCase(TestExcelExporter))
     suite.addTests(loader.loadTestsFromTestCase(TestGraphPadExporter))
+    suite.addTests(loader.loadTestsFromTestCase(TestParquetExporter))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -3,6 +3,7 @@
 
 import sys
 from pathlib import Path
+import pandas as pd
 
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -282,6 +283,79 @@ def test_multiple_files():
         return False
 
 
+def test_iter_import_files():
+    """Test concurrent import keeps file order and reports per-file errors."""
+    print("\n" + "=" * 70)
+    print("Test 7: Concurrent Import")
+    print("=" * 70)
+
+    data_dir = Path(__file__).parent.parent / 'test_data'
+    test_files = [
+        data_dir / '002_GST_005L.csv',
+        data_dir / '005_Invalid.txt',
+        data_dir / '003_Treatment_010T.json',
+        data_dir / '001_Control_001.xlsx',
+    ]
+
+    results = list(UnifiedImporter.iter_import_files(test_files, max_workers=4))
+    assert len(results) == len(test_files)
+
+    for file_path, (df, error) in zip(test_files, results):
+        print(f"  {file_path.name}: {'error' if error else f'{len(df)} rows'}")
+        if file_path.suffix == '.txt':
+            assert df is None and isinstance(error, ValueError)
+        else:
+            assert error is None
+            expected = UnifiedImporter.import_file(file_path)
+            pd.testing.assert_frame_equal(df, expected)
+
+    # Worker processes return the same frames and errors
+    proc_results = list(UnifiedImporter.iter_import_files(
+        test_files, max_workers=2, use_processes=True
+    ))
+    for (df, error), (proc_df, proc_error) in zip(results, proc_results):
+        if error is not None:
+            assert type(proc_error) is type(error)
+        else:
+            pd.testing.assert_frame_equal(proc_df, df)
+
+    # Single file is imported without a thread pool
+    (df, error), = UnifiedImporter.iter_import_files(test_files[:1])
+    assert error is None and len(df) > 0
+
+    print("\n  ✓ Concurrent import working!")
+    return True
+
+
+def test_header_cache():
+    """Test header scans are cached per file version."""
+    print("\n" + "=" * 70)
+    print("Test 8: Header Cache")
+    print("=" * 70)
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = Path(tmpdir) / '001_Control_001.csv'
+        csv_path.write_text("Length,Volume\n1,2\n")
+
+        headers = HeaderScanner.scan_headers(csv_path)
+        assert headers == ['Length', 'Volume']
+
+        # Returned lists are copies, so callers cannot corrupt the cache
+        headers.append('Extra')
+        assert HeaderScanner.scan_headers(csv_path) == ['Length', 'Volume']
+
+        # Editing the file invalidates its cached headers
+        csv_path.write_text("Length,Volume,Branch Points\n1,2,3\n")
+        headers = HeaderScanner.scan_headers(csv_path)
+        print(f"  Headers after edit: {headers}")
+        assert headers == ['Length', 'Volume', 'Branch Points']
+
+    print("\n  ✓ Header cache working!")
+    return True
+
+
 def run_all_tests():
     """Run all tests and display summary."""
     tests = [
@@ -291,6 +365,8 @@ def run_all_tests():
         ("Unified Importer", test_unified_importer),
         ("ParameterMapper Integration", test_parameter_mapper_integration),
         ("Multiple Files Import", test_multiple_files),
+        ("Concurrent Import", test_iter_import_files),
+        ("Header Cache", test_header_cache),
     ]
 
     results = []
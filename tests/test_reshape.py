@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Tests for wide/long measurement reshaping."""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from src.neuromorpho_analyzer.core.processors import wide_to_long
+
+
+class TestWideToLong(unittest.TestCase):
+    """Test wide_to_long function."""
+
+    def setUp(self):
+        """Create wide test data."""
+        self.wide_df = pd.DataFrame({
+            'Length': [1.0, 2.0, 3.0],
+            'Volume': [10.0, np.nan, 30.0],
+            'source_file': ['a.csv', 'a.csv', 'b.csv'],
+            'condition': ['Control', 'Control', 'Treatment']
+        })
+
+    def test_matches_melt(self):
+        """Test output matches DataFrame.melt."""
+        result = wide_to_long(self.wide_df)
+        expected = self.wide_df.melt(
+            id_vars=['source_file', 'condition'],
+            var_name='parameter_name',
+            value_name='value'
+        )
+        columns = ['parameter_name', 'value', 'source_file', 'condition']
+        pd.testing.assert_frame_equal(
+            result[columns].astype({'parameter_name': object, 'condition': object}),
+            expected[columns],
+            check_dtype=False
+        )
+
+    def test_categorical_columns(self):
+        """Test parameter and condition columns are categorical."""
+        result = wide_to_long(self.wide_df, ['Volume', 'Length'])
+        self.assertIsInstance(result['parameter_name'].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(result['condition'].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(result['parameter_name'].cat.categories), ['Volume', 'Length'])
+        self.assertEqual(list(result['condition'][:3]), ['Control', 'Control', 'Treatment'])
+
+    def test_parameter_subset(self):
+        """Test selecting a subset of parameters."""
+        result = wide_to_long(self.wide_df, ['Volume', 'Missing'])
+        self.assertEqual(list(result['parameter_name'].unique()), ['Volume'])
+        self.assertEqual(len(result), 3)
+
+    def test_duplicate_parameters(self):
+        """Test repeated parameter names are reshaped once."""
+        result = wide_to_long(self.wide_df, ['Length', 'Length'])
+        self.assertEqual(list(result['parameter_name'].cat.categories), ['Length'])
+        self.assertEqual(len(result), 3)
+
+    def test_long_input_passthrough(self):
+        """Test long-format input is filtered, not reshaped."""
+        long_df = wide_to_long(self.wide_df)
+        result = wide_to_long(long_df, ['Length'])
+        self.assertEqual(len(result), 3)
+        self.assertTrue((result['parameter_name'] == 'Length').all())
+
+    def test_empty_dataframe(self):
+        """Test handling of empty DataFrame."""
+        result = wide_to_long(self.wide_df.iloc[0:0])
+        self.assertTrue(result.empty)
+        self.assertIn('value', result.columns)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -10,6 +10,7 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from neuromorpho_analyzer.core.processors import StatisticsEngine
+from neuromorpho_analyzer.core.processors.statistics import group_histogram
 
 
 def test_normality_testing():
@@ -272,6 +273,63 @@ def test_auto_compare_multiple_groups():
     return True
 
 
+def test_auto_compare_array_groups():
+    """Test auto compare with a dict of arrays instead of a DataFrame."""
+    print("\n" + "=" * 70)
+    print("Test 9: Auto Compare (Array Groups)")
+    print("=" * 70)
+
+    stats_engine = StatisticsEngine(alpha=0.05)
+
+    np.random.seed(42)
+    groups = {
+        'Control': np.random.normal(100, 15, 30),
+        'Treatment1': np.random.normal(120, 15, 30),
+        'Treatment2': np.random.normal(140, 15, 30)
+    }
+    groups['Control'][0] = np.nan
+    data = pd.DataFrame({
+        'value': np.concatenate(list(groups.values())),
+        'condition': np.repeat(list(groups), 30)
+    })
+
+    from_arrays = stats_engine.auto_compare(groups, 'value', 'condition')
+    from_frame = stats_engine.auto_compare(data, 'value', 'condition')
+
+    print(f"\nArrays: {from_arrays['main_test']}")
+    print(f"Frame:  {from_frame['main_test']}")
+
+    assert from_arrays['group_names'] == list(groups)
+    assert from_arrays['descriptive_stats']['Control']['n'] == 29
+    assert from_arrays['main_test'].p_value == from_frame['main_test'].p_value
+    assert len(from_arrays['post_hoc_tests']) == len(from_frame['post_hoc_tests'])
+
+    print("\n✓ Auto compare (array groups) working!")
+    return True
+
+
+def test_group_histogram():
+    """Test the grouped histogram kernel against np.histogram."""
+    print("\n" + "=" * 70)
+    print("Test 10: Group Histogram")
+    print("=" * 70)
+
+    np.random.seed(42)
+    edges = 10 + np.arange(51) * 0.1
+    groups = [np.random.uniform(5, 20, 300), np.array([]), np.concatenate([edges, [np.nan]])]
+    offsets = np.concatenate(([0], np.cumsum([len(g) for g in groups])))
+
+    hist = group_histogram(np.concatenate(groups), offsets, edges, 0.1)
+
+    assert hist.shape == (3, 50)
+    for group, counts in zip(groups, hist):
+        expected, _ = np.histogram(group[~np.isnan(group)], bins=edges)
+        assert np.array_equal(counts, expected)
+
+    print("\n✓ Group histogram matches np.histogram!")
+    return True
+
+
 def run_all_tests():
     """Run all tests and display summary."""
     tests = [
@@ -283,6 +341,8 @@ def run_all_tests():
         ("Kruskal-Wallis H Test", test_kruskal_wallis),
         ("Auto Compare (2 Groups)", test_auto_compare_two_groups),
         ("Auto Compare (3+ Groups)", test_auto_compare_multiple_groups),
+        ("Auto Compare (Array Groups)", test_auto_compare_array_groups),
+        ("Group Histogram", test_group_histogram),
     ]
 
     results = []